@@ -0,0 +1,458 @@
+#!/usr/bin/env python3
+"""
+Benchmark script for the oop modules.
+
+Usage: python benchmarks.py [name ...] [size ...]
+Runs the named benchmarks (all by default, see BENCHMARKS) once per size
+(defaults to 10k and 1M).
+"""
+
+import math
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from contextlib import redirect_stdout
+
+import book_class
+from book_class import BookFactory
+from calculation_history import CalculationHistory
+
+from library_catalog import ColumnarCatalog
+from library_system import Book, EBook, Library, PrintBook
+from polymorphism_demo import Circle, Rectangle, Shape, Triangle
+import shape_batch
+from shape_batch import ShapeBatch
+from shape_index import GridIndex
+from shape_io import export_shapes, summarize_file
+
+DEFAULT_SIZES = [10_000, 1_000_000]
+
+
+class DictBook:
+    """library_system.Book's layout before __slots__, kept as a baseline."""
+
+    def __init__(self, title, author):
+        self.title = title
+        self.author = author
+
+
+class DictEBook(DictBook):
+    """library_system.EBook's layout before __slots__."""
+
+    def __init__(self, title, author, file_size):
+        super().__init__(title, author)
+        self.file_size = file_size
+
+
+class DictPrintBook(DictBook):
+    """library_system.PrintBook's layout before __slots__."""
+
+    def __init__(self, title, author, page_count):
+        super().__init__(title, author)
+        self.page_count = page_count
+
+
+class PlainShape:
+    """polymorphism_demo.Shape before geometry caching, kept as a baseline."""
+
+    x = None
+    y = None
+
+    def place(self, x, y):
+        self.x = x
+        self.y = y
+        return self
+
+    def bounding_box(self):
+        if self.x is None or self.y is None:
+            raise ValueError(f"{self} has no position")
+        return self._bounding_box()
+
+
+class PlainRectangle(PlainShape):
+    """polymorphism_demo.Rectangle before geometry caching."""
+
+    def __init__(self, length, width, x=None, y=None):
+        self.length = length
+        self.width = width
+        if x is not None or y is not None:
+            self.place(x, y)
+
+    def area(self):
+        return self.length * self.width
+
+    def perimeter(self):
+        return 2 * (self.length + self.width)
+
+    def _bounding_box(self):
+        return (self.x, self.y, self.x + self.length, self.y + self.width)
+
+
+class PlainCircle(PlainShape):
+    """polymorphism_demo.Circle before geometry caching."""
+
+    def __init__(self, radius, x=None, y=None):
+        self.radius = radius
+        if x is not None or y is not None:
+            self.place(x, y)
+
+    def area(self):
+        return math.pi * (self.radius ** 2)
+
+    def perimeter(self):
+        return 2 * math.pi * self.radius
+
+    def _bounding_box(self):
+        return (self.x - self.radius, self.y - self.radius,
+                self.x + self.radius, self.y + self.radius)
+
+
+class PlainTriangle(PlainShape):
+    """polymorphism_demo.Triangle before geometry caching."""
+
+    def __init__(self, base, height, x=None, y=None):
+        self.base = base
+        self.height = height
+        if x is not None or y is not None:
+            self.place(x, y)
+
+    def area(self):
+        return 0.5 * self.base * self.height
+
+    def perimeter(self):
+        return self.base + 2 * math.hypot(self.base / 2, self.height)
+
+    def _bounding_box(self):
+        return (self.x, self.y, self.x + self.base, self.y + self.height)
+
+
+def timed(func, *args):
+    """Return the wall-clock seconds taken by func(*args)."""
+    start = time.perf_counter()
+    func(*args)
+    return time.perf_counter() - start
+
+
+def traced_memory(func, *args):
+    """
+    Run func(*args) with tracemalloc on.
+
+    Returns:
+        tuple: (result, bytes still allocated, peak bytes), counted from the call
+    """
+    tracemalloc.start()
+    try:
+        result = func(*args)
+        allocated, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return result, allocated, peak
+
+
+def bytes_per_object(factory, count):
+    """Measure the traced memory allocated per object built by factory()."""
+    objects, allocated, _ = traced_memory(lambda: [factory() for _ in range(count)])
+    return (allocated - sys.getsizeof(objects)) / count
+
+
+def compare_layouts(cases, count):
+    """
+    Print memory per object and attribute read speed, before and after a change.
+
+    Args:
+        cases (list): (name, before factory, after factory, read function) tuples
+        count (int): Objects built per factory
+    """
+    width = max(len(name) for name, *_ in cases)
+    for name, before, after, read in cases:
+        sizes = [bytes_per_object(factory, count) for factory in (before, after)]
+        reads = []
+        for factory in (before, after):
+            objects = [factory() for _ in range(count)]
+            reads.append(count / timed(lambda: [read(obj) for obj in objects]))
+        print(f"{count:>10,} {name:<{width}} | bytes/object: {sizes[0]:.0f} -> {sizes[1]:.0f} | "
+              f"reads/s: {reads[0]:,.0f} -> {reads[1]:,.0f}")
+
+
+def benchmark_slots(size):
+    """Compare memory and attribute reads of dict-based and slotted books."""
+    cases = [
+        ("Book", lambda: DictBook("Title", "Author"), lambda: Book("Title", "Author"),
+         lambda book: (book.title, book.author)),
+        ("EBook", lambda: DictEBook("Title", "Author", 512),
+         lambda: EBook("Title", "Author", 512),
+         lambda book: (book.title, book.author, book.file_size)),
+        ("PrintBook", lambda: DictPrintBook("Title", "Author", 300),
+         lambda: PrintBook("Title", "Author", 300),
+         lambda book: (book.title, book.author, book.page_count)),
+    ]
+    compare_layouts(cases, size)
+
+
+def benchmark_catalog(size):
+    """Compare aggregates over a list of books with the columnar catalog."""
+    books = [EBook(f"Title {i}", f"Author {i % 100}", i % 1000) if i % 3 == 1
+             else PrintBook(f"Title {i}", f"Author {i % 100}", i % 800) if i % 3 == 2
+             else Book(f"Title {i}", f"Author {i % 100}") for i in range(size)]
+    catalog = ColumnarCatalog.from_books(books)
+
+    def loop_queries():
+        sum(book.file_size for book in books if isinstance(book, EBook))
+        pages = [book.page_count for book in books if isinstance(book, PrintBook)]
+        sum(pages) / len(pages)
+
+    def catalog_queries():
+        catalog.total("file_size", EBook)
+        catalog.average("page_count", PrintBook)
+
+    loop = timed(loop_queries)
+    columns = timed(catalog_queries)
+    print(f"{size:>10,} books | objects: {loop:.4f}s | columns: {columns:.4f}s | "
+          f"speedup: {loop / columns:.1f}x")
+
+
+def benchmark_listing(size):
+    """Compare the original print() per book with write_listing(), cold and cached."""
+    library = Library()
+    library.add_books(EBook(f"Title {i}", "Author", i) if i % 2
+                      else PrintBook(f"Title {i}", "Author", i) for i in range(size))
+
+    def print_each(fp):
+        # list_books() before write_listing(): one print() per book
+        print("Books in the library:", file=fp)
+        for book in library.books:
+            print(book.get_info(), file=fp)
+
+    fd, path = tempfile.mkstemp(suffix=".txt")
+    os.close(fd)
+    try:
+        times = []
+        for write in (print_each, library.write_listing, library.write_listing):
+            with open(path, "w") as fp:
+                times.append(timed(write, fp))
+    finally:
+        os.remove(path)
+    print(f"{size:>10,} books | print(): {times[0]:.3f}s | write_listing: {times[1]:.3f}s cold, "
+          f"{times[2]:.3f}s cached | speedup: {times[0] / times[1]:.1f}x cold, "
+          f"{times[0] / times[2]:.1f}x cached")
+
+
+def benchmark_flyweight(size):
+    """Compare memory and parse speed of plain and flyweight book_class.Books."""
+    lines = [f"Book('Title {i}', 'Author {i % 2_000}', {1900 + i % 120})" for i in range(size)]
+    evaluated = lines[:100_000]
+
+    def plain_parse(lines):
+        # The same regex parse, without sharing authors and years
+        match = book_class.BOOK_REPR.fullmatch
+        return [book_class.Book(title, author, int(year))
+                for title, author, year in (match(line).groups() for line in lines)]
+
+    def eval_parse(lines):
+        return [eval(line, vars(book_class)) for line in lines]
+
+    def traced(parse):
+        return traced_memory(parse, lines)[1] / size
+
+    def rate(parse, lines):
+        # Keep the books alive until the clock stops; freeing them runs __del__
+        start = time.perf_counter()
+        books = parse(lines)
+        return len(books) / (time.perf_counter() - start)
+
+    # Book.__del__ prints one line per book
+    with open(os.devnull, "w") as devnull, redirect_stdout(devnull):
+        memory = [traced(plain_parse), traced(BookFactory().parse_many)]
+        rates = [rate(eval_parse, evaluated), rate(plain_parse, lines),
+                 rate(BookFactory().parse_many, lines)]
+    print(f"{size:>10,} books | bytes/book: {memory[0]:.0f} -> {memory[1]:.0f} | "
+          f"lines/s: eval {rates[0]:,.0f}, regex {rates[1]:,.0f}, factory {rates[2]:,.0f}")
+
+
+def random_shapes(size, seed=42):
+    """Build size Rectangles, Circles and Triangles with random dimensions."""
+    rng = random.Random(seed)
+    makers = [lambda: Rectangle(rng.uniform(1, 10), rng.uniform(1, 10)),
+              lambda: Circle(rng.uniform(1, 5)),
+              lambda: Triangle(rng.uniform(1, 10), rng.uniform(1, 10))]
+    return [rng.choice(makers)() for _ in range(size)]
+
+
+def benchmark_shape_batch(size):
+    """Compare per-object area() calls with ShapeBatch column arithmetic."""
+    shapes = random_shapes(size)
+    batch = ShapeBatch.from_shapes(shapes)
+
+    def per_object():
+        areas = [shape.area() for shape in shapes]
+        sum(areas)
+
+    def batched():
+        batch.areas()
+        batch.total_area()
+
+    loop = timed(per_object)
+    columns = timed(batched)
+    histogram = timed(batch.histogram, 20)
+    backend = "map" if shape_batch.numpy is None else "NumPy"
+    print(f"{size:>10,} shapes | area() loop: {loop:.4f}s | ShapeBatch ({backend}): "
+          f"{columns:.4f}s ({loop / columns:.1f}x) | histogram: {histogram:.4f}s")
+
+
+def placed_shapes(size, seed=42):
+    """Place random shapes so each one overlaps a handful of neighbours."""
+    rng = random.Random(seed)
+    side = 10 * math.sqrt(size)
+    return [shape.place(rng.uniform(0, side), rng.uniform(0, side))
+            for shape in random_shapes(size, seed)]
+
+
+def brute_force_pairs(shapes):
+    """The O(n^2) overlap test the grid replaces."""
+    boxes = [shape.bounding_box() for shape in shapes]
+    return [(i, j) for i in range(len(boxes)) for j in range(i + 1, len(boxes))
+            if boxes[i][0] <= boxes[j][2] and boxes[j][0] <= boxes[i][2]
+            and boxes[i][1] <= boxes[j][3] and boxes[j][1] <= boxes[i][3]]
+
+
+def benchmark_spatial_index(size):
+    """Measure grid index build, window, nearest and overlap queries."""
+    shapes = placed_shapes(size)
+    rng = random.Random(7)
+    side = 10 * math.sqrt(size)
+    points = [(rng.uniform(0, side), rng.uniform(0, side)) for _ in range(1_000)]
+
+    sample = shapes[:2_000]
+    brute = timed(brute_force_pairs, sample)
+    grid = timed(lambda: GridIndex.bulk_load(sample).overlapping_pairs())
+    print(f"{len(sample):>10,} shapes | overlap pairs: O(n^2) {brute:.3f}s | grid {grid:.3f}s")
+
+    start = time.perf_counter()
+    index = GridIndex.bulk_load(shapes)
+    build = time.perf_counter() - start
+    windows = timed(lambda: [index.query(x, y, x + 20, y + 20) for x, y in points])
+    nearest = timed(lambda: [index.nearest(x, y, 5) for x, y in points])
+    start = time.perf_counter()
+    pairs = len(index.overlapping_pairs())
+    overlaps = time.perf_counter() - start
+    print(f"{size:>10,} shapes | build: {build:.2f}s | {len(points) / windows:,.0f} windows/s | "
+          f"{len(points) / nearest:,.0f} nearest/s | {pairs:,} overlap pairs: {overlaps:.2f}s")
+
+
+def benchmark_geometry_cache(size):
+    """Compare the original uncached shape classes with cached and opted-out ones."""
+    rng = random.Random(42)
+    specs = []
+    for _ in range(size):
+        kind = rng.randrange(3)
+        dimensions = (rng.uniform(1, 5),) if kind == 1 else (rng.uniform(1, 10), rng.uniform(1, 10))
+        specs.append((kind, dimensions + (rng.uniform(0, 100), rng.uniform(0, 100))))
+    rounds = 10
+    variants = [("original", (PlainRectangle, PlainCircle, PlainTriangle), True),
+                ("cached", (Rectangle, Circle, Triangle), True),
+                ("opt-out", (Rectangle, Circle, Triangle), False)]
+    for name, kinds, cache in variants:
+        Shape.cache_geometry = cache
+        shapes = []
+
+        def build_and_measure():
+            shapes[:] = [kinds[kind](*args) for kind, args in specs]
+            for shape in shapes:
+                shape.area()
+
+        def measure_repeatedly():
+            for _ in range(rounds):
+                for shape in shapes:
+                    shape.area(), shape.perimeter(), shape.bounding_box()
+
+        def mutate():
+            for shape in shapes:
+                shape.x = shape.x
+
+        built, repeated, moved = timed(build_and_measure), timed(measure_repeatedly), timed(mutate)
+        print(f"{size:>10,} shapes | {name:<8} | build + area(): {built:.3f}s | "
+              f"{rounds}x all geometry: {repeated:.3f}s | set x: {moved:.3f}s")
+    Shape.cache_geometry = True
+
+
+def benchmark_shape_summary(size):
+    """Measure streaming area summaries of shape files by process count."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        for fmt in ("text", "jsonl"):
+            path = os.path.join(tmpdir, f"shapes.{fmt}")
+            with open(path, "w") as fp:
+                export_shapes(placed_shapes(size), fp, fmt)
+
+            serial = timed(summarize_file, path, fmt, 1)
+            # Traced separately, since tracing slows the run down
+            peak = traced_memory(summarize_file, path, fmt, 1)[2]
+            print(f"{size:>10,} shapes | {fmt:<5} | 1 process: {size / serial:,.0f} shapes/s, "
+                  f"peak {peak / 2**20:.1f} MiB")
+            for workers in sorted({2, 4, os.cpu_count() or 1} - {1}):
+                elapsed = timed(summarize_file, path, fmt, workers)
+                print(f"{size:>10,} shapes | {fmt:<5} | {workers} processes: "
+                      f"{size / elapsed:,.0f} shapes/s ({os.cpu_count()} CPUs)")
+
+
+def benchmark_history(size):
+    """Compare the old unbounded string list with the ring-buffer history."""
+    operations = [(f"{i} + {i % 100}", i + i % 100) for i in range(size)]
+
+    def string_list():
+        # Calculator.history before the ring buffer
+        history = []
+        for operation, result in operations:
+            history.append(f"{operation}: {result}")
+        return history
+
+    cases = [("list", string_list)]
+    for capacity in (1_000, size):
+        def ring(capacity=capacity):
+            history = CalculationHistory(capacity)
+            for operation, result in operations:
+                history.append(operation, result)
+            return history
+        cases.append((f"ring {capacity:,}", ring))
+
+    for label, build in cases:
+        history, memory, _ = traced_memory(build)
+        adds = size / timed(build)
+        recent = timed(lambda: history[-10:] if isinstance(history, list) else history.last(10))
+        print(f"{size:>10,} entries | {label:<14} | {memory / 2**20:8.1f} MiB | "
+              f"{adds:,.0f} adds/s | last 10: {recent * 1e6:.0f}us")
+
+
+# name, heading, benchmark function
+BENCHMARKS = [
+    ("slots", "MEMORY: __dict__ VS __slots__", benchmark_slots),
+    ("catalog", "AGGREGATES: BOOK OBJECTS VS COLUMNAR CATALOG", benchmark_catalog),
+    ("listing", "LISTING: print() PER BOOK VS write_listing()", benchmark_listing),
+    ("flyweight", "BOOK_CLASS: PLAIN VS FLYWEIGHT AUTHORS AND YEARS", benchmark_flyweight),
+    ("shapes", "AREAS: PER-OBJECT area() VS ShapeBatch", benchmark_shape_batch),
+    ("spatial", "SPATIAL INDEX: UNIFORM GRID OVER PLACED SHAPES", benchmark_spatial_index),
+    ("geometry", "SHAPE GEOMETRY: ORIGINAL VS CACHED CLASSES", benchmark_geometry_cache),
+    ("summary", "SHAPE FILES: STREAMING AREA SUMMARY BY PROCESS COUNT", benchmark_shape_summary),
+    ("history", "CALCULATOR HISTORY: STRING LIST VS RING BUFFER", benchmark_history),
+]
+
+
+def main():
+    """Run the selected benchmarks (all by default) for each size."""
+    names = [arg for arg in sys.argv[1:] if not arg.isdigit()]
+    sizes = [int(arg) for arg in sys.argv[1:] if arg.isdigit()] or DEFAULT_SIZES
+
+    for name, heading, benchmark in BENCHMARKS:
+        if names and name not in names:
+            continue
+        print("=" * 50)
+        print(heading)
+        print("=" * 50)
+        for size in sizes:
+            benchmark(size)
+
+
+if __name__ == "__main__":
+    main()
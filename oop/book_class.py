@@ -1,3 +1,6 @@
+import re
+
+
 class Book:
     """
     A Book class that demonstrates Python magic methods.
@@ -41,4 +44,109 @@ class Book:
         Returns:
             str: A string that can be used to recreate the Book instance
         """
-        return f"Book('{self.title}', '{self.author}', {self.year})" 
\ No newline at end of file
+        return f"Book('{self.title}', '{self.author}', {self.year})" 
+
+
+# Matches the text produced by Book.__repr__; the author is taken to end at
+# the last "', '" so titles may contain quotes
+BOOK_REPR = re.compile(r"Book\('(.*)', '(.*)', (-?\d+)\)")
+
+# Years in this range are shared by BookFactory; others are stored as given
+MAX_SHARED_YEAR = 10_000
+
+
+class BookFactory:
+    """
+    A flyweight factory that builds Book instances sharing equal values.
+    
+    Large catalogs repeat the same few thousand authors and years millions
+    of times. The factory keeps one canonical object per distinct author
+    string and per year below MAX_SHARED_YEAR, and gives that same object
+    to every Book it builds, so repeated values are stored only once.
+    """
+    
+    def __init__(self):
+        """
+        Initialize a factory with no shared values.
+        """
+        self._authors = {}
+        self._years = {}
+    
+    def create(self, title, author, year):
+        """
+        Build a Book whose author and year are shared with earlier books.
+        
+        Args:
+            title (str): The title of the book
+            author (str): The author of the book
+            year (int): The publication year of the book
+            
+        Returns:
+            Book: A new Book instance
+        """
+        author = self._authors.setdefault(author, author)
+        if -MAX_SHARED_YEAR < year < MAX_SHARED_YEAR:
+            year = self._years.setdefault(year, year)
+        return Book(title, author, year)
+    
+    def parse(self, text):
+        """
+        Build a Book from its repr() text without using eval().
+        
+        Args:
+            text (str): Text such as "Book('1984', 'George Orwell', 1949)"
+            
+        Returns:
+            Book: A new Book instance
+            
+        Raises:
+            ValueError: If text is not a Book repr
+        """
+        match = BOOK_REPR.fullmatch(text.strip())
+        if match is None:
+            raise ValueError(f"Not a Book repr: {text!r}")
+        title, author, year = match.groups()
+        return self.create(title, author, int(year))
+    
+    def parse_many(self, lines):
+        """
+        Build Books from repr() lines, such as a file of repr(book) lines.
+        
+        Blank lines are skipped. Author and year sharing is inlined here
+        because this loop runs once per book in bulk loads.
+        
+        Args:
+            lines (iterable): Lines of Book repr text
+            
+        Returns:
+            list: New Book instances, in input order
+            
+        Raises:
+            ValueError: If a non-blank line is not a Book repr
+        """
+        fullmatch = BOOK_REPR.fullmatch
+        authors = self._authors
+        years = self._years
+        books = []
+        for number, line in enumerate(lines, 1):
+            line = line.strip()
+            if not line:
+                continue
+            match = fullmatch(line)
+            if match is None:
+                raise ValueError(f"Line {number} is not a Book repr: {line!r}")
+            title, author, year = match.groups()
+            year = int(year)
+            if -MAX_SHARED_YEAR < year < MAX_SHARED_YEAR:
+                year = years.setdefault(year, year)
+            books.append(Book(title, authors.setdefault(author, author), year))
+        return books
+    
+    def distinct_authors(self):
+        """
+        Get the number of distinct authors shared by the factory.
+        
+        Returns:
+            int: The number of author strings stored
+        """
+        return len(self._authors)
@@ -0,0 +1,256 @@
+"""
+Bounded, structured calculation history for Calculator.
+
+Entries are kept in a fixed-capacity ring buffer of typed columns: an
+operator code, two operands and a result. Once the buffer is full, each new
+entry replaces the oldest one, so a long-running calculator uses constant
+memory.
+"""
+
+import csv
+import re
+from array import array
+from collections import namedtuple
+
+from record_io import iter_chunks
+
+OPERATORS = "+-*/"
+OTHER = len(OPERATORS)  # Code of entries kept as text, see append()
+
+# Flag bits marking values that were ints rather than floats
+A_INT, B_INT, RESULT_INT = 1, 2, 4
+
+NUMBER = r"-?\d+(?:\.\d+)?(?:[eE][-+]?\d+)?"
+OPERATION = re.compile(rf"({NUMBER}) ([-+*/]) ({NUMBER})")
+
+HistoryEntry = namedtuple("HistoryEntry", "operation operator a b result")
+
+
+def _exact_number(value):
+    """
+    Check that a value survives storage in an array("d") unchanged.
+
+    Returns:
+        tuple: (float value, True if it was an int), or None if the value
+            is not a number a float holds exactly
+    """
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        return None
+    if isinstance(value, int):
+        if abs(value) > 2 ** 53:
+            return None
+        return float(value), True
+    return value, False
+
+
+def _parse_number(text):
+    """Parse an operand as an int or float, matching how it was typed."""
+    return int(text) if re.fullmatch(r"-?\d+", text) else float(text)
+
+
+class CalculationHistory:
+    """
+    A fixed-capacity ring buffer of calculations.
+
+    "a <op> b" operations with int or float values are stored as an
+    operator code, two operands and a result in array columns, and are
+    formatted back to the exact text they were added with. Any other
+    operation text or result type is kept as given.
+
+    Iterating yields the "operation: result" strings, oldest first, straight
+    from the buffer without copying it. The history must not be modified
+    while an iterator is in use.
+    """
+
+    def __init__(self, capacity=1000):
+        """
+        Initialize an empty history.
+
+        Args:
+            capacity (int): Maximum number of entries kept, defaults to 1000
+
+        Raises:
+            ValueError: If capacity is not positive
+        """
+        if capacity <= 0:
+            raise ValueError("History capacity must be positive")
+        self.capacity = capacity
+        self._codes = bytearray(capacity)
+        self._flags = bytearray(capacity)
+        self._a = array("d", bytes(8 * capacity))
+        self._b = array("d", bytes(8 * capacity))
+        self._results = array("d", bytes(8 * capacity))
+        self._other = {}  # position -> (operation, result) for OTHER entries
+        self._start = 0  # Position of the oldest entry
+        self._size = 0
+
+    def __len__(self):
+        """Number of entries currently kept."""
+        return self._size
+
+    def _next_position(self):
+        """Claim the position for a new entry, dropping the oldest if full."""
+        if self._size < self.capacity:
+            position = (self._start + self._size) % self.capacity
+            self._size += 1
+        else:
+            position = self._start
+            self._start = (self._start + 1) % self.capacity
+            self._other.pop(position, None)
+        return position
+
+    def record(self, operator, a, b, result):
+        """
+        Add a structured calculation.
+
+        Args:
+            operator (str): One of "+", "-", "*" or "/"
+            a (float): First operand
+            b (float): Second operand
+            result (float): Result of the calculation
+
+        Raises:
+            ValueError: If the operator is unknown
+        """
+        if operator not in OPERATORS or len(operator) != 1:
+            raise ValueError(f"Unknown operator: {operator}")
+        values = [_exact_number(value) for value in (a, b, result)]
+        if None in values:
+            self._add_other(f"{a} {operator} {b}", result)
+            return
+
+        position = self._next_position()
+        (a, a_int), (b, b_int), (result, result_int) = values
+        self._codes[position] = OPERATORS.index(operator)
+        self._flags[position] = a_int * A_INT | b_int * B_INT | result_int * RESULT_INT
+        self._a[position] = a
+        self._b[position] = b
+        self._results[position] = result
+
+    def append(self, operation, result):
+        """
+        Add a calculation described as text, as Calculator.add_to_history() does.
+
+        Args:
+            operation (str): Description such as "10 + 5"
+            result: Result of the calculation
+        """
+        match = OPERATION.fullmatch(operation)
+        if match is not None:
+            a, operator, b = match.groups()
+            a, b = _parse_number(a), _parse_number(b)
+            # Only store it structured if it formats back to the same text
+            if f"{a} {operator} {b}" == operation:
+                self.record(operator, a, b, result)
+                return
+        self._add_other(operation, result)
+
+    def _add_other(self, operation, result):
+        """Keep an entry that does not fit the columns as given."""
+        position = self._next_position()
+        self._codes[position] = OTHER
+        self._other[position] = (operation, result)
+
+    def _entry(self, position):
+        """Build the HistoryEntry stored at a buffer position."""
+        code = self._codes[position]
+        if code == OTHER:
+            operation, result = self._other[position]
+            return HistoryEntry(operation, None, None, None, result)
+
+        flags = self._flags[position]
+        a, b, result = self._a[position], self._b[position], self._results[position]
+        if flags & A_INT:
+            a = int(a)
+        if flags & B_INT:
+            b = int(b)
+        if flags & RESULT_INT:
+            result = int(result)
+        operator = OPERATORS[code]
+        return HistoryEntry(f"{a} {operator} {b}", operator, a, b, result)
+
+    def _positions(self, start=0, stop=None):
+        """Iterate over buffer positions of entries start..stop, oldest first."""
+        stop = self._size if stop is None else stop
+        return ((self._start + i) % self.capacity for i in range(start, stop))
+
+    def entries(self, last=None):
+        """
+        Iterate over structured entries, oldest first.
+
+        Args:
+            last (int): Only the newest last entries, defaults to all
+
+        Returns:
+            iterator: HistoryEntry tuples; operator, a and b are None for
+                entries kept as text
+        """
+        start = 0 if last is None else max(self._size - last, 0)
+        return map(self._entry, self._positions(start))
+
+    def __iter__(self):
+        """Iterate over "operation: result" strings, oldest first."""
+        for entry in self.entries():
+            yield f"{entry.operation}: {entry.result}"
+
+    def __getitem__(self, index):
+        """
+        Get entries by position, oldest first, like a list of strings.
+
+        Args:
+            index (int or slice): Entry index or slice
+
+        Returns:
+            str or list: "operation: result" text
+
+        Raises:
+            IndexError: If an int index is out of range
+        """
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._size))]
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError("history index out of range")
+        entry = self._entry((self._start + index) % self.capacity)
+        return f"{entry.operation}: {entry.result}"
+
+    def last(self, n):
+        """
+        Get the newest n entries.
+
+        Args:
+            n (int): Number of entries
+
+        Returns:
+            list: "operation: result" strings, oldest first
+        """
+        return [f"{entry.operation}: {entry.result}" for entry in self.entries(last=n)]
+
+    def clear(self):
+        """Remove every entry."""
+        self._other.clear()
+        self._start = self._size = 0
+
+    def export_csv(self, fp, chunk_size=1000):
+        """
+        Write every entry to a CSV file with a header row.
+
+        Args:
+            fp: A text file object opened for writing (with newline="")
+            chunk_size (int): Rows per write, defaults to 1000
+
+        Returns:
+            int: The number of entries written
+
+        Raises:
+            ValueError: If chunk_size is not positive
+        """
+        # Checked before the header is written, not when the first chunk is read
+        if chunk_size <= 0:
+            raise ValueError("chunk_size must be positive")
+        writer = csv.writer(fp)
+        writer.writerow(HistoryEntry._fields)
+        for rows in iter_chunks(self.entries(), chunk_size):
+            writer.writerows(rows)
+        return self._size
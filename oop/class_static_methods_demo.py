@@ -1,3 +1,6 @@
+from calculation_history import CalculationHistory
+
+
 class Calculator:
     """
     Calculator class demonstrating class methods and static methods.
@@ -9,15 +12,17 @@ class Calculator:
     # Class attribute that can be accessed by class methods
     calculation_type = "Arithmetic Operations"
     
-    def __init__(self, name="Default Calculator"):
+    def __init__(self, name="Default Calculator", history_size=1000):
         """
         Initialize a Calculator instance.
         
         Args:
             name (str): The name of the calculator instance
+            history_size (int): Number of history entries kept, defaults to
+                1000; older entries are dropped
         """
         self.name = name
-        self.history = []
+        self.history = CalculationHistory(history_size)
     
     @staticmethod
     def add(a, b):
@@ -133,13 +138,20 @@ class Calculator:
             operation (str): Description of the operation performed
             result (float): Result of the calculation
         """
-        self.history.append(f"{operation}: {result}")
+        self.history.append(operation, result)
     
-    def get_history(self):
+    def get_history(self, last=None):
         """
         Instance method to get calculation history.
         
+        Iterate over self.history instead to read entries without a copy.
+        
+        Args:
+            last (int): Only return the newest last entries, defaults to all
+            
         Returns:
             list: List of calculation history entries
         """
-        return self.history.copy() 
\ No newline at end of file
+        if last is None:
+            return list(self.history)
+        return self.history.last(last) 
\ No newline at end of file
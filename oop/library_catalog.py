@@ -0,0 +1,294 @@
+from array import array
+from collections import Counter
+from itertools import compress
+
+from library_system import Book, EBook, PrintBook
+
+try:
+    import numpy
+except ImportError:  # Masks and group-bys fall back to Python loops
+    numpy = None
+
+# Kind codes stored in the kinds column, indexed by code
+KINDS = (Book, EBook, PrintBook)
+KIND_CODES = {kind: code for code, kind in enumerate(KINDS)}
+FIELDS = ("file_size", "page_count")
+
+
+class ColumnarCatalog:
+    """
+    A column-oriented catalog of Book, EBook, and PrintBook records.
+
+    Instead of one object per book, the catalog keeps one typed column per
+    attribute: titles, author ids into a shared author table, a kind code,
+    file sizes and page counts (0 where a kind has no such attribute).
+    Aggregates, filters and group-bys work on whole columns instead of
+    book objects with isinstance() checks. When NumPy is installed, masks
+    are whole-array comparisons and group-bys use numpy.bincount() and
+    numpy.add.at(); otherwise they are Python loops over the columns, and
+    totals use sum() with itertools.compress(). Book objects are only built
+    on request.
+    """
+
+    def __init__(self):
+        """Initialize an empty catalog."""
+        self.titles = []
+        self.authors = []  # Distinct author names, indexed by author id
+        self._author_ids = {}
+        self.author_ids = array("I")
+        self.kinds = bytearray()
+        self.file_sizes = array("q")
+        self.page_counts = array("q")
+
+    @classmethod
+    def from_books(cls, books):
+        """
+        Build a catalog from book objects.
+
+        Args:
+            books (iterable): Book, EBook, or PrintBook instances
+
+        Returns:
+            ColumnarCatalog: A new catalog
+        """
+        catalog = cls()
+        catalog.add_books(books)
+        return catalog
+
+    @classmethod
+    def from_library(cls, library):
+        """
+        Build a catalog holding every book of a Library.
+
+        Args:
+            library (Library): The library to copy
+
+        Returns:
+            ColumnarCatalog: A new catalog
+        """
+        return cls.from_books(library.books)
+
+    def __len__(self):
+        """Number of books in the catalog."""
+        return len(self.titles)
+
+    def add_book(self, book):
+        """
+        Append one book to the columns.
+
+        Args:
+            book (Book): A Book, EBook, or PrintBook instance
+
+        Raises:
+            TypeError: If book is not one of the supported classes
+        """
+        code = KIND_CODES.get(type(book))
+        if code is None:
+            raise TypeError("Only Book, EBook, or PrintBook instances can be added")
+
+        author_id = self._author_ids.get(book.author)
+        if author_id is None:
+            author_id = self._author_ids[book.author] = len(self.authors)
+            self.authors.append(book.author)
+
+        self.titles.append(book.title)
+        self.author_ids.append(author_id)
+        self.kinds.append(code)
+        self.file_sizes.append(book.file_size if code == 1 else 0)
+        self.page_counts.append(book.page_count if code == 2 else 0)
+
+    def add_books(self, books):
+        """
+        Append many books to the columns.
+
+        Args:
+            books (iterable): Book, EBook, or PrintBook instances
+        """
+        for book in books:
+            self.add_book(book)
+
+    def _column(self, field):
+        """Look up a numeric column by attribute name."""
+        if field not in FIELDS:
+            raise ValueError(f"Unknown numeric field: {field}")
+        return getattr(self, field + "s")
+
+    def _numpy_mask(self, kind, author):
+        """Build the selection mask as a boolean array with whole-array comparisons."""
+        selected = numpy.ones(len(self), dtype=bool)
+        if kind is not None:
+            kinds = numpy.frombuffer(self.kinds, dtype=numpy.uint8)
+            selected &= kinds == KIND_CODES[kind]
+        if author is not None:
+            author_id = self._author_ids.get(author)
+            if author_id is None:
+                selected[:] = False
+            else:
+                author_ids = numpy.frombuffer(self.author_ids, dtype=self.author_ids.typecode)
+                selected &= author_ids == author_id
+        return selected
+
+    def mask(self, kind=None, author=None):
+        """
+        Build a selection mask with one 0/1 byte per book.
+
+        Args:
+            kind (type): Keep only this class (Book, EBook or PrintBook)
+            author (str): Keep only books by this author
+
+        Returns:
+            bytes: 1 for each selected book, 0 otherwise
+        """
+        if numpy is not None:
+            return self._numpy_mask(kind, author).view(numpy.uint8).tobytes()
+        selected = bytes([1]) * len(self)
+        if kind is not None:
+            table = bytes(int(code == KIND_CODES[kind]) for code in range(256))
+            selected = self.kinds.translate(table)
+        if author is not None:
+            author_id = self._author_ids.get(author)
+            by_author = bytes(int(i == author_id) for i in self.author_ids)
+            both = int.from_bytes(selected, "big") & int.from_bytes(by_author, "big")
+            selected = both.to_bytes(len(self), "big")
+        return selected
+
+    def count(self, kind=None, author=None):
+        """
+        Count the books matching a filter.
+
+        Args:
+            kind (type): Count only this class
+            author (str): Count only books by this author
+
+        Returns:
+            int: The number of matching books
+        """
+        if kind is None and author is None:
+            return len(self)
+        if numpy is not None:
+            return int(numpy.count_nonzero(self._numpy_mask(kind, author)))
+        return self.mask(kind, author).count(1)
+
+    def total(self, field, kind=None, author=None):
+        """
+        Sum a numeric column over the books matching a filter.
+
+        Args:
+            field (str): "file_size" or "page_count"
+            kind (type): Sum only this class
+            author (str): Sum only books by this author
+
+        Returns:
+            int: The total
+        """
+        column = self._column(field)
+        if kind is None and author is None:
+            return sum(column)
+        if numpy is not None:
+            values = numpy.frombuffer(column, dtype=numpy.int64)
+            return int(values[self._numpy_mask(kind, author)].sum())
+        return sum(compress(column, self.mask(kind, author)))
+
+    def average(self, field, kind=None, author=None):
+        """
+        Average a numeric column over the books matching a filter.
+
+        Args:
+            field (str): "file_size" or "page_count"
+            kind (type): Average only this class
+            author (str): Average only books by this author
+
+        Returns:
+            float or None: The average, or None if no book matches
+        """
+        count = self.count(kind, author)
+        return self.total(field, kind, author) / count if count else None
+
+    def filter(self, kind=None, author=None):
+        """
+        Get the positions of the books matching a filter.
+
+        Args:
+            kind (type): Keep only this class
+            author (str): Keep only books by this author
+
+        Returns:
+            list: Row positions, usable with book()
+        """
+        return list(compress(range(len(self)), self.mask(kind, author)))
+
+    def group_by(self, by, field=None):
+        """
+        Count books, or sum a numeric column, per kind or per author.
+
+        Args:
+            by (str): "kind" (keys are class names) or "author"
+            field (str): Column to sum, or None to count books
+
+        Returns:
+            dict: Group key -> count or total
+        """
+        if by == "kind":
+            keys, names = self.kinds, [kind.__name__ for kind in KINDS]
+        elif by == "author":
+            keys, names = self.author_ids, self.authors
+        else:
+            raise ValueError(f"Cannot group by: {by}")
+        if numpy is not None:
+            return self._numpy_group_by(keys, names, field)
+
+        counts = Counter(keys)
+        if field is None:
+            return {names[key]: count for key, count in sorted(counts.items())}
+
+        totals = dict.fromkeys(sorted(counts), 0)
+        for key, value in zip(keys, self._column(field)):
+            totals[key] += value
+        return {names[key]: total for key, total in totals.items()}
+
+    def _numpy_group_by(self, keys, names, field):
+        """Count or sum per group with numpy.bincount() and numpy.add.at()."""
+        dtype = numpy.uint8 if isinstance(keys, bytearray) else keys.typecode
+        keys = numpy.frombuffer(keys, dtype=dtype)
+        counts = numpy.bincount(keys, minlength=len(names))
+        present = numpy.flatnonzero(counts)
+        if field is None:
+            values = counts
+        else:
+            # add.at keeps integer totals exact, unlike bincount() weights
+            values = numpy.zeros(len(names), dtype=numpy.int64)
+            numpy.add.at(values, keys, numpy.frombuffer(self._column(field), dtype=numpy.int64))
+        return {names[key]: int(values[key]) for key in present.tolist()}
+
+    def book(self, position):
+        """
+        Build the book object stored at a row.
+
+        Args:
+            position (int): Row position
+
+        Returns:
+            Book: A new Book, EBook, or PrintBook instance
+        """
+        kind = self.kinds[position]
+        title = self.titles[position]
+        author = self.authors[self.author_ids[position]]
+        if kind == 1:
+            return EBook(title, author, self.file_sizes[position])
+        if kind == 2:
+            return PrintBook(title, author, self.page_counts[position])
+        return Book(title, author)
+
+    def books(self, positions=None):
+        """
+        Build book objects for some or all rows.
+
+        Args:
+            positions (iterable): Row positions, defaults to every row
+
+        Returns:
+            list: New Book, EBook, and PrintBook instances
+        """
+        if positions is None:
+            positions = range(len(self))
+        return [self.book(position) for position in positions]
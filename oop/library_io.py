@@ -0,0 +1,156 @@
+"""
+Streaming CSV / JSON Lines import and export for the library system.
+
+Each record carries a "kind" field ("book", "ebook" or "printbook") that
+selects the class to build, plus the fields that class needs.
+"""
+
+import csv
+import io
+import json
+
+from library_system import Book, EBook, PrintBook
+from record_io import iter_chunks, read_jsonl, write_chunks
+
+FIELDS = ["kind", "title", "author", "file_size", "page_count"]
+FORMATS = ("csv", "jsonl")
+
+
+def read_records(fp, fmt="csv"):
+    """
+    Lazily read catalog records from a CSV or JSON Lines file.
+
+    Args:
+        fp: A text file object opened for reading
+        fmt (str): "csv" (with a header row) or "jsonl"
+
+    Returns:
+        iterator: One dict per record
+
+    Raises:
+        ValueError: If the format is not supported
+    """
+    if fmt == "csv":
+        return csv.DictReader(fp)
+    if fmt == "jsonl":
+        return read_jsonl(fp)
+    raise ValueError(f"Unsupported catalog format: {fmt}")
+
+
+def book_from_record(record):
+    """
+    Build a Book, EBook, or PrintBook from a catalog record.
+
+    Args:
+        record (dict): A record with kind, title, author and, for EBook
+            and PrintBook, file_size or page_count
+
+    Returns:
+        Book: The new book instance
+
+    Raises:
+        ValueError: If the kind is unknown or a required field is missing
+    """
+    kind = record.get("kind") or "book"
+    try:
+        if kind == "book":
+            return Book(record["title"], record["author"])
+        if kind == "ebook":
+            return EBook(record["title"], record["author"], int(record["file_size"]))
+        if kind == "printbook":
+            return PrintBook(record["title"], record["author"], int(record["page_count"]))
+    except (KeyError, TypeError) as e:
+        raise ValueError(f"Catalog record is missing a field: {record}") from e
+    raise ValueError(f"Unknown book kind: {kind}")
+
+
+def book_to_record(book):
+    """
+    Convert a Book, EBook, or PrintBook into a catalog record.
+
+    Args:
+        book (Book): The book to convert
+
+    Returns:
+        dict: The record, with empty values for fields the kind lacks
+    """
+    return {
+        "kind": type(book).__name__.lower(),
+        "title": book.title,
+        "author": book.author,
+        "file_size": getattr(book, "file_size", None),
+        "page_count": getattr(book, "page_count", None),
+    }
+
+
+def iter_book_batches(fp, fmt="csv", batch_size=1000):
+    """
+    Stream books from a catalog file in fixed-size batches.
+
+    Only one batch is held in memory at a time.
+
+    Args:
+        fp: A text file object opened for reading
+        fmt (str): "csv" or "jsonl"
+        batch_size (int): Number of books per batch, defaults to 1000
+
+    Returns:
+        iterator: Lists of new Book, EBook, and PrintBook instances
+    """
+    return iter_chunks(map(book_from_record, read_records(fp, fmt)), batch_size)
+
+
+def import_books(fp, library, fmt="csv", batch_size=1000):
+    """
+    Load a catalog file into a library, one batch at a time.
+
+    Args:
+        fp: A text file object opened for reading
+        library (Library): The library to populate
+        fmt (str): "csv" or "jsonl"
+        batch_size (int): Number of books per batch, defaults to 1000
+
+    Returns:
+        int: The number of books imported
+    """
+    count = 0
+    for batch in iter_book_batches(fp, fmt, batch_size):
+        count += library.add_books(batch)
+    return count
+
+
+def export_books(books, fp, fmt="csv", batch_size=1000):
+    """
+    Write books to a catalog file, one buffered write per batch.
+
+    Args:
+        books (iterable): Book, EBook, and PrintBook instances to export
+        fp: A text file object opened for writing
+        fmt (str): "csv" (a header row is written first) or "jsonl"
+        batch_size (int): Number of books per write, defaults to 1000
+
+    Returns:
+        int: The number of books exported
+
+    Raises:
+        ValueError: If the format is not supported
+    """
+    if fmt not in FORMATS:
+        raise ValueError(f"Unsupported catalog format: {fmt}")
+
+    if fmt == "jsonl":
+        def format_batch(batch):
+            return "".join([json.dumps(book_to_record(book)) + "\n" for book in batch])
+        return write_chunks(fp, books, format_batch, batch_size)
+
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, FIELDS)
+    writer.writeheader()
+    fp.write(buffer.getvalue())
+
+    def format_batch(batch):
+        buffer.seek(0)
+        buffer.truncate()
+        writer.writerows(map(book_to_record, batch))
+        return buffer.getvalue()
+    return write_chunks(fp, books, format_batch, batch_size)
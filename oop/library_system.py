@@ -1,3 +1,6 @@
+import sys
+
+
 class Book:
     """
     Base class representing a book with common attributes.
@@ -6,6 +9,9 @@ class Book:
     demonstrating inheritance principles in Python.
     """
     
+    # No per-instance __dict__; subclasses add slots for their own attributes
+    __slots__ = ("title", "author")
+    
     def __init__(self, title, author):
         """
         Initialize a Book instance with title and author.
@@ -44,6 +50,8 @@ class EBook(Book):
     Demonstrates inheritance and method overriding.
     """
     
+    __slots__ = ("file_size",)
+    
     def __init__(self, title, author, file_size):
         """
         Initialize an EBook instance.
@@ -84,6 +92,8 @@ class PrintBook(Book):
     Demonstrates inheritance and method overriding.
     """
     
+    __slots__ = ("page_count",)
+    
     def __init__(self, title, author, page_count):
         """
         Initialize a PrintBook instance.
@@ -129,6 +139,8 @@ class Library:
         Initialize an empty library with no books.
         """
         self.books = []
+        # (chunk_size, copy of books, rendered chunks) from write_listing()
+        self._listing = None
     
     def add_book(self, book):
         """
@@ -139,9 +151,30 @@ class Library:
         """
         if isinstance(book, Book):
             self.books.append(book)
+            self._listing = None
         else:
             raise TypeError("Only Book instances can be added to the library")
     
+    def add_books(self, books):
+        """
+        Add many books to the library at once.
+        
+        The whole batch is validated before any book is added, so a bad
+        batch leaves the library unchanged.
+        
+        Args:
+            books (iterable): Book, EBook, or PrintBook instances to add
+            
+        Returns:
+            int: The number of books added
+        """
+        books = list(books)
+        if not all(isinstance(book, Book) for book in books):
+            raise TypeError("Only Book instances can be added to the library")
+        self.books.extend(books)
+        self._listing = None
+        return len(books)
+    
     def list_books(self):
         """
         Print details of all books in the library.
@@ -149,13 +182,46 @@ class Library:
         This method demonstrates polymorphism by calling get_info()
         on different types of book objects.
         """
+        self.write_listing(sys.stdout)
+    
+    def write_listing(self, fp, chunk_size=10_000):
+        """
+        Write the list_books() output to a text file.
+        
+        Lines are joined into one string per chunk_size books, so a large
+        library is written with a few large writes instead of one print()
+        per book. The rendered chunks are kept, and later calls write them
+        again without calling get_info(). add_book() and add_books() drop
+        them, as does any other change to the books list. Changing a book's
+        attributes is not detected; call invalidate_listing() afterwards.
+        
+        Args:
+            fp (file): A text file open for writing
+            chunk_size (int): Books rendered per write, defaults to 10,000
+            
+        Returns:
+            int: The number of books written
+        """
         if not self.books:
-            print("The library is empty.")
-            return
+            fp.write("The library is empty.\n")
+            return 0
         
-        print("Books in the library:")
-        for book in self.books:
-            print(book.get_info())
+        listing = self._listing
+        # Lists of books compare by identity, so this also catches direct edits
+        if listing is None or listing[0] != chunk_size or listing[1] != self.books:
+            books = list(self.books)
+            chunks = ["\n".join([book.get_info() for book in books[start:start + chunk_size]]) + "\n"
+                      for start in range(0, len(books), chunk_size)]
+            listing = self._listing = (chunk_size, books, chunks)
+            
+        fp.write("Books in the library:\n")
+        for chunk in listing[2]:
+            fp.write(chunk)
+        return len(self.books)
+    
+    def invalidate_listing(self):
+        """Drop the text cached by write_listing(), e.g. after editing a book."""
+        self._listing = None
     
     def get_book_count(self):
         """
@@ -1,4 +1,36 @@
 import math
+from operator import attrgetter
+
+# Instance attributes holding cached area(), perimeter() and bounding_box()
+GEOMETRY_CACHE_KEYS = ("_area", "_perimeter", "_box")
+
+
+def geometry_field(name, cached=GEOMETRY_CACHE_KEYS):
+    """
+    Build a property for a dimension or coordinate stored in "_" + name.
+    
+    Reading the property is a C-level attribute lookup. Assigning to it
+    stores the value and drops the cached values that depend on it.
+    Constructors set the underlying attribute directly, since a new shape
+    has nothing cached yet.
+    
+    Args:
+        name (str): The public attribute name
+        cached (tuple): Cache attributes to drop when the value changes
+        
+    Returns:
+        property: The field's property
+    """
+    private = "_" + name
+    
+    def set_field(self, value):
+        cache = self.__dict__
+        cache[private] = value
+        for key in cached:
+            cache.pop(key, None)
+            
+    return property(attrgetter(private), set_field, doc=f"The shape's {name}.")
+
 
 class Shape:
     """
@@ -6,9 +38,116 @@ class Shape:
     
     This class demonstrates the concept of abstract base classes
     where derived classes must implement specific methods.
+    
+    Shapes may optionally be placed on a plane at (x, y). Placed shapes
+    have an axis-aligned bounding box, which spatial indexes use.
+    
+    area(), perimeter() and bounding_box() compute their value once and
+    cache it. Dimensions and coordinates are geometry_field() properties,
+    so assigning to one drops the cached values that depend on it.
+    Subclasses provide the formulas by overriding _compute_area(),
+    _compute_perimeter() and _compute_bounding_box(), which read the
+    underlying attributes (self._radius rather than self.radius). Set
+    cache_geometry to False, on a class or an instance, for short-lived
+    shapes that are only measured once.
     """
     
+    cache_geometry = True
+    
+    # Nothing is cached until first use
+    _area = _perimeter = _box = None
+    
+    # Shapes are unplaced unless a subclass constructor or place() sets these
+    _x = _y = None
+    x = geometry_field("x", cached=("_box",))
+    y = geometry_field("y", cached=("_box",))
+    
+    def place(self, x, y):
+        """
+        Position the shape on the plane.
+        
+        Args:
+            x (float): Horizontal coordinate of the shape's anchor point
+            y (float): Vertical coordinate of the shape's anchor point
+            
+        Returns:
+            Shape: This shape, for chaining
+        """
+        self._x = x
+        self._y = y
+        self.__dict__.pop("_box", None)
+        return self
+    
+    def is_placed(self):
+        """
+        Check whether the shape has a position.
+        
+        Returns:
+            bool: True if x and y are set
+        """
+        return self._x is not None and self._y is not None
+    
+    def bounding_box(self):
+        """
+        Get the axis-aligned box enclosing a placed shape.
+        
+        Returns:
+            tuple: (min_x, min_y, max_x, max_y)
+            
+        Raises:
+            ValueError: If the shape has not been placed
+        """
+        box = self._box
+        if box is None:
+            if not self.is_placed():
+                raise ValueError(f"{self} has no position")
+            box = self._compute_bounding_box()
+            if self.cache_geometry:
+                self._box = box
+        return box
+    
+    def _compute_bounding_box(self):
+        """
+        Compute the bounding box from the shape's position.
+        
+        Raises:
+            NotImplementedError: This method must be overridden by subclasses
+        """
+        raise NotImplementedError("Subclasses must override the _compute_bounding_box() method")
+    
+    def _position_text(self):
+        """Format ", x=..., y=..." for __str__, or "" if the shape is unplaced."""
+        return f", x={self.x}, y={self.y}" if self.is_placed() else ""
+    
     def area(self):
+        """
+        Get the area of the shape, computing it on first use.
+        
+        Returns:
+            float: The area of the shape
+        """
+        area = self._area
+        if area is None:
+            area = self._compute_area()
+            if self.cache_geometry:
+                self._area = area
+        return area
+    
+    def perimeter(self):
+        """
+        Get the perimeter of the shape, computing it on first use.
+        
+        Returns:
+            float: The perimeter of the shape
+        """
+        perimeter = self._perimeter
+        if perimeter is None:
+            perimeter = self._compute_perimeter()
+            if self.cache_geometry:
+                self._perimeter = perimeter
+        return perimeter
+    
+    def _compute_area(self):
         """
         Calculate the area of the shape.
         
@@ -18,7 +157,16 @@ class Shape:
         Raises:
             NotImplementedError: This method must be overridden by subclasses
         """
-        raise NotImplementedError("Subclasses must override the area() method")
+        raise NotImplementedError("Subclasses must override the _compute_area() method")
+    
+    def _compute_perimeter(self):
+        """
+        Calculate the perimeter of the shape.
+        
+        Raises:
+            NotImplementedError: This method must be overridden by subclasses
+        """
+        raise NotImplementedError("Subclasses must override the _compute_perimeter() method")
     
     def __str__(self):
         """
@@ -34,22 +182,29 @@ class Rectangle(Shape):
     """
     Derived class representing a rectangle.
     
-    Inherits from Shape and overrides the area method
+    Inherits from Shape and overrides the _compute_area method
     to calculate the area of a rectangle.
     """
     
-    def __init__(self, length: float, width: float):
+    length = geometry_field("length")
+    width = geometry_field("width")
+    
+    def __init__(self, length: float, width: float, x: float = None, y: float = None):
         """
         Initialize a Rectangle instance.
         
         Args:
-            length (float): The length of the rectangle
-            width (float): The width of the rectangle
+            length (float): The length of the rectangle, along the x axis
+            width (float): The width of the rectangle, along the y axis
+            x (float): Optional x of the lower-left corner
+            y (float): Optional y of the lower-left corner
         """
-        self.length = length
-        self.width = width
+        self._length = length
+        self._width = width
+        self._x = x
+        self._y = y
     
-    def area(self):
+    def _compute_area(self):
         """
         Calculate the area of the rectangle.
         
@@ -59,7 +214,16 @@ class Rectangle(Shape):
         Returns:
             float: The area of the rectangle (length × width)
         """
-        return self.length * self.width
+        return self._length * self._width
+    
+    def _compute_perimeter(self):
+        """
+        Calculate the perimeter of the rectangle.
+        
+        Returns:
+            float: The perimeter of the rectangle (2 × (length + width))
+        """
+        return 2 * (self._length + self._width)
     
     def __str__(self):
         """
@@ -68,27 +232,42 @@ class Rectangle(Shape):
         Returns:
             str: Detailed information about the rectangle
         """
-        return f"Rectangle(length={self.length}, width={self.width})"
+        return f"Rectangle(length={self.length}, width={self.width}{self._position_text()})"
+    
+    def _compute_bounding_box(self):
+        """
+        Compute the rectangle's box from its lower-left corner.
+        
+        Returns:
+            tuple: (min_x, min_y, max_x, max_y)
+        """
+        return (self._x, self._y, self._x + self._length, self._y + self._width)
 
 
 class Circle(Shape):
     """
     Derived class representing a circle.
     
-    Inherits from Shape and overrides the area method
+    Inherits from Shape and overrides the _compute_area method
     to calculate the area of a circle.
     """
     
-    def __init__(self, radius: float):
+    radius = geometry_field("radius")
+    
+    def __init__(self, radius: float, x: float = None, y: float = None):
         """
         Initialize a Circle instance.
         
         Args:
             radius (float): The radius of the circle
+            x (float): Optional x of the center
+            y (float): Optional y of the center
         """
-        self.radius = radius
+        self._radius = radius
+        self._x = x
+        self._y = y
     
-    def area(self):
+    def _compute_area(self):
         """
         Calculate the area of the circle.
         
@@ -98,7 +277,16 @@ class Circle(Shape):
         Returns:
             float: The area of the circle (π × radius²)
         """
-        return math.pi * (self.radius ** 2)
+        return math.pi * (self._radius ** 2)
+    
+    def _compute_perimeter(self):
+        """
+        Calculate the circumference of the circle.
+        
+        Returns:
+            float: The circumference of the circle (2 × π × radius)
+        """
+        return 2 * math.pi * self._radius
     
     def __str__(self):
         """
@@ -107,7 +295,17 @@ class Circle(Shape):
         Returns:
             str: Detailed information about the circle
         """
-        return f"Circle(radius={self.radius})"
+        return f"Circle(radius={self.radius}{self._position_text()})"
+    
+    def _compute_bounding_box(self):
+        """
+        Compute the circle's box from its center.
+        
+        Returns:
+            tuple: (min_x, min_y, max_x, max_y)
+        """
+        radius = self._radius
+        return (self._x - radius, self._y - radius, self._x + radius, self._y + radius)
 
 
 # Additional derived class to demonstrate extensibility
@@ -119,18 +317,25 @@ class Triangle(Shape):
     the Shape hierarchy with new shapes.
     """
     
-    def __init__(self, base: float, height: float):
+    base = geometry_field("base")
+    height = geometry_field("height")
+    
+    def __init__(self, base: float, height: float, x: float = None, y: float = None):
         """
         Initialize a Triangle instance.
         
         Args:
-            base (float): The base length of the triangle
-            height (float): The height of the triangle
+            base (float): The base length of the triangle, along the x axis
+            height (float): The height of the triangle, along the y axis
+            x (float): Optional x of the left end of the base
+            y (float): Optional y of the base
         """
-        self.base = base
-        self.height = height
+        self._base = base
+        self._height = height
+        self._x = x
+        self._y = y
     
-    def area(self):
+    def _compute_area(self):
         """
         Calculate the area of the triangle.
         
@@ -140,7 +345,20 @@ class Triangle(Shape):
         Returns:
             float: The area of the triangle (0.5 × base × height)
         """
-        return 0.5 * self.base * self.height
+        return 0.5 * self._base * self._height
+    
+    def _compute_perimeter(self):
+        """
+        Calculate the perimeter of the triangle.
+        
+        Base and height alone do not fix the other two sides, so the
+        triangle is taken to be isosceles, with its apex above the middle
+        of the base.
+        
+        Returns:
+            float: The perimeter of the triangle (base + 2 × side)
+        """
+        return self._base + 2 * math.hypot(self._base / 2, self._height)
     
     def __str__(self):
         """
@@ -149,4 +367,16 @@ class Triangle(Shape):
         Returns:
             str: Detailed information about the triangle
         """
-        return f"Triangle(base={self.base}, height={self.height})" 
\ No newline at end of file
+        return f"Triangle(base={self.base}, height={self.height}{self._position_text()})"
+    
+    def _compute_bounding_box(self):
+        """
+        Compute the triangle's box from the left end of its base.
+        
+        The apex lies somewhere above the base, so the box spans the base
+        and the full height.
+        
+        Returns:
+            tuple: (min_x, min_y, max_x, max_y)
+        """
+        return (self._x, self._y, self._x + self._base, self._y + self._height) 
\ No newline at end of file
@@ -0,0 +1,68 @@
+"""
+Helpers shared by the streaming file readers and writers (library_io and
+shape_io): JSON Lines parsing and fixed-size chunking, so at most one chunk
+of records is held in memory at a time.
+"""
+
+import json
+from itertools import islice
+
+
+def read_jsonl(fp):
+    """
+    Lazily parse a JSON Lines file, skipping blank lines.
+
+    Args:
+        fp: A text file object opened for reading
+
+    Returns:
+        iterator: One parsed value per line
+    """
+    return (json.loads(line) for line in fp if line.strip())
+
+
+def iter_chunks(items, chunk_size):
+    """
+    Split an iterable into lists of up to chunk_size items.
+
+    Args:
+        items (iterable): The items to split
+        chunk_size (int): Maximum number of items per chunk
+
+    Yields:
+        list: The next chunk; only the last one may be shorter
+
+    Raises:
+        ValueError: If chunk_size is not positive
+    """
+    if chunk_size <= 0:
+        raise ValueError("chunk_size must be positive")
+    items = iter(items)
+    while True:
+        chunk = list(islice(items, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def write_chunks(fp, items, format_chunk, chunk_size):
+    """
+    Write items to a text file, one write per chunk.
+
+    Args:
+        fp: A text file object opened for writing
+        items (iterable): The items to write
+        format_chunk (callable): Turns a list of items into the text to write
+        chunk_size (int): Maximum number of items per write
+
+    Returns:
+        int: The number of items written
+
+    Raises:
+        ValueError: If chunk_size is not positive
+    """
+    count = 0
+    for chunk in iter_chunks(items, chunk_size):
+        fp.write(format_chunk(chunk))
+        count += len(chunk)
+    return count
@@ -0,0 +1,230 @@
+import math
+from array import array
+from collections import Counter
+from functools import partial
+from itertools import compress
+from operator import add, mul
+
+from polymorphism_demo import Circle, Rectangle, Triangle
+
+try:
+    import numpy
+except ImportError:  # Areas fall back to map() over the array columns
+    numpy = None
+
+# Kind codes stored in the kinds column, indexed by code
+KINDS = (Rectangle, Circle, Triangle)
+KIND_CODES = {kind: code for code, kind in enumerate(KINDS)}
+
+RECTANGLE, CIRCLE, TRIANGLE = range(len(KINDS))
+
+# Area of each kind = SCALES[code] * first * second (a circle stores its
+# radius in both columns)
+SCALES = (1.0, math.pi, 0.5)
+
+
+class ShapeBatch:
+    """
+    A structure-of-arrays container for Rectangle, Circle and Triangle.
+
+    Shapes are stored as three parallel columns instead of objects: a kind
+    code and two array("d") dimension columns, holding length and width for
+    rectangles, base and height for triangles, and the radius twice for
+    circles. Every area is then SCALES[kind] * first * second, which is
+    computed a whole column at a time, so no area() method is dispatched
+    per shape. Shape objects are only built by to_shapes().
+
+    When NumPy is installed, the columns are viewed as NumPy arrays without
+    copying and each query is a few vectorized calls. Otherwise the same
+    arithmetic runs through map() over C-level operators, which saves memory
+    but is not much faster than calling area() on every object.
+    """
+
+    def __init__(self):
+        """Initialize an empty batch."""
+        self.kinds = bytearray()
+        self.first = array("d")
+        self.second = array("d")
+
+    @classmethod
+    def from_shapes(cls, shapes):
+        """
+        Build a batch from shape objects.
+
+        Args:
+            shapes (iterable): Rectangle, Circle, or Triangle instances
+
+        Returns:
+            ShapeBatch: A new batch
+        """
+        batch = cls()
+        batch.extend(shapes)
+        return batch
+
+    def __len__(self):
+        """Number of shapes in the batch."""
+        return len(self.kinds)
+
+    def append(self, shape):
+        """
+        Add one shape to the columns.
+
+        Args:
+            shape (Shape): A Rectangle, Circle, or Triangle instance
+
+        Raises:
+            TypeError: If shape is not one of the supported classes
+        """
+        code = KIND_CODES.get(type(shape))
+        if code is None:
+            raise TypeError("Only Rectangle, Circle, or Triangle instances can be added")
+        if code == RECTANGLE:
+            first, second = shape.length, shape.width
+        elif code == CIRCLE:
+            first = second = shape.radius
+        else:
+            first, second = shape.base, shape.height
+        self.kinds.append(code)
+        self.first.append(first)
+        self.second.append(second)
+
+    def extend(self, shapes):
+        """
+        Add many shapes to the columns.
+
+        Args:
+            shapes (iterable): Rectangle, Circle, or Triangle instances
+        """
+        for shape in shapes:
+            self.append(shape)
+
+    def count(self, kind=None):
+        """
+        Count the shapes of one kind, or all shapes.
+
+        Args:
+            kind (type): Rectangle, Circle or Triangle, defaults to all
+
+        Returns:
+            int: The number of shapes
+        """
+        if kind is None:
+            return len(self)
+        return self.kinds.count(KIND_CODES[kind])
+
+    def _iter_areas(self, kind=None):
+        """Lazily compute areas, of one kind or of every shape, in order."""
+        if kind is None:
+            products = map(mul, self.first, self.second)
+            return map(mul, products, map(SCALES.__getitem__, self.kinds))
+
+        code = KIND_CODES[kind]
+        selected = self.kinds.translate(bytes(int(i == code) for i in range(256)))
+        products = map(mul, compress(self.first, selected), compress(self.second, selected))
+        return map(partial(mul, SCALES[code]), products)
+
+    def _numpy_areas(self, kind=None):
+        """Compute areas, of one kind or of every shape, as a NumPy array."""
+        kinds = numpy.frombuffer(self.kinds, dtype=numpy.uint8)
+        first = numpy.frombuffer(self.first, dtype=numpy.float64)
+        second = numpy.frombuffer(self.second, dtype=numpy.float64)
+        if kind is None:
+            return first * second * numpy.array(SCALES)[kinds]
+
+        code = KIND_CODES[kind]
+        selected = kinds == code
+        return first[selected] * second[selected] * SCALES[code]
+
+    def areas(self, kind=None):
+        """
+        Compute shape areas.
+
+        Args:
+            kind (type): Only compute areas of this class, defaults to all
+
+        Returns:
+            array: Areas in the order the shapes were added
+        """
+        if numpy is not None:
+            return array("d", self._numpy_areas(kind).tobytes())
+        return array("d", self._iter_areas(kind))
+
+    def total_area(self, kind=None):
+        """
+        Sum shape areas.
+
+        Args:
+            kind (type): Only sum areas of this class, defaults to all
+
+        Returns:
+            float: The total area
+        """
+        if numpy is not None:
+            return float(self._numpy_areas(kind).sum())
+        return math.fsum(self._iter_areas(kind))
+
+    def total_area_by_kind(self):
+        """
+        Sum shape areas per kind.
+
+        Returns:
+            dict: Class name -> total area
+        """
+        return {kind.__name__: self.total_area(kind) for kind in KINDS}
+
+    def histogram(self, bins=10, kind=None, low=None, high=None):
+        """
+        Count shape areas in equal-width bins.
+
+        Areas outside [low, high] are not counted. The last bin includes
+        high. If low equals high, the range is widened by 0.5 on each side.
+
+        Args:
+            bins (int): Number of bins, defaults to 10
+            kind (type): Only count areas of this class, defaults to all
+            low (float): Lower edge, defaults to the smallest area
+            high (float): Upper edge, defaults to the largest area
+
+        Returns:
+            tuple: (counts, edges), a list of bins counts and a list of
+                bins + 1 bin edges
+        """
+        if numpy is not None:
+            values = self._numpy_areas(kind)
+            smallest, largest = (values.min(), values.max()) if len(values) else (0.0, 0.0)
+            low = float(smallest) if low is None else low
+            high = float(largest) if high is None else high
+            counts, edges = numpy.histogram(values, bins, range=(low, high))
+            return counts.tolist(), edges.tolist()
+
+        values = self.areas(kind)
+        smallest, largest = min(values, default=0.0), max(values, default=0.0)
+        low = smallest if low is None else low
+        high = largest if high is None else high
+        if low > smallest or high < largest:
+            values = [value for value in values if low <= value <= high]
+        if high == low:
+            low, high = low - 0.5, high + 0.5
+        width = (high - low) / bins
+        edges = [low + i * width for i in range(bins)] + [high]
+
+        # Bin number of every area, computed column-wise
+        offsets = map(partial(add, -low), values)
+        indexes = Counter(map(math.floor, map(partial(mul, 1 / width), offsets)))
+        counts = [0] * bins
+        for index, count in indexes.items():
+            # Areas equal to high, or rounded past an edge, join the end bins
+            counts[min(max(index, 0), bins - 1)] += count
+        return counts, edges
+
+    def to_shapes(self):
+        """
+        Build shape objects for every row.
+
+        Returns:
+            list: New Rectangle, Circle, and Triangle instances, in order,
+                with float dimensions
+        """
+        makers = (Rectangle, lambda radius, _: Circle(radius), Triangle)
+        return [makers[code](first, second)
+                for code, first, second in zip(self.kinds, self.first, self.second)]
@@ -0,0 +1,241 @@
+import math
+from array import array
+from heapq import nsmallest
+
+
+class GridIndex:
+    """
+    A uniform-grid spatial index over placed shapes.
+
+    The plane is cut into square cells of cell_size. Each shape is listed in
+    every cell its bounding box touches, so a query only looks at the shapes
+    in the cells it covers instead of at every shape. Bounding boxes are
+    kept in four array("d") columns, indexed by the shape's id (its position
+    in insertion order).
+
+    Queries and overlap tests use bounding boxes, so a circle or triangle
+    matches a window that touches its box even if it misses the shape.
+    """
+
+    def __init__(self, cell_size):
+        """
+        Initialize an empty index.
+
+        Args:
+            cell_size (float): Width and height of a grid cell
+
+        Raises:
+            ValueError: If cell_size is not positive
+        """
+        if cell_size <= 0:
+            raise ValueError("cell_size must be positive")
+        self.cell_size = cell_size
+        self.shapes = []
+        self.min_x = array("d")
+        self.min_y = array("d")
+        self.max_x = array("d")
+        self.max_y = array("d")
+        self._cells = {}  # (column, row) -> list of shape ids
+        self._columns = range(0)  # Columns and rows holding any shape
+        self._rows = range(0)
+
+    @classmethod
+    def bulk_load(cls, shapes, cell_size=None):
+        """
+        Build an index over many shapes at once.
+
+        Args:
+            shapes (iterable): Placed Shape instances
+            cell_size (float): Cell width, defaults to twice the average
+                bounding box side so most shapes touch few cells
+
+        Returns:
+            GridIndex: A new index
+
+        Raises:
+            ValueError: If any shape has not been placed
+        """
+        shapes = list(shapes)
+        boxes = [shape.bounding_box() for shape in shapes]
+        if cell_size is None:
+            sides = math.fsum(max_x - min_x + max_y - min_y
+                              for min_x, min_y, max_x, max_y in boxes)
+            cell_size = sides / len(boxes) if boxes and sides else 1.0
+        index = cls(cell_size)
+        for shape, box in zip(shapes, boxes):
+            index._add(shape, box)
+        return index
+
+    def __len__(self):
+        """Number of indexed shapes."""
+        return len(self.shapes)
+
+    def _cell_range(self, min_x, min_y, max_x, max_y):
+        """Get the column and row spans of the cells a box touches."""
+        size = self.cell_size
+        return (range(math.floor(min_x / size), math.floor(max_x / size) + 1),
+                range(math.floor(min_y / size), math.floor(max_y / size) + 1))
+
+    def _add(self, shape, box):
+        """Store a shape with its already computed bounding box."""
+        shape_id = len(self.shapes)
+        self.shapes.append(shape)
+        min_x, min_y, max_x, max_y = box
+        self.min_x.append(min_x)
+        self.min_y.append(min_y)
+        self.max_x.append(max_x)
+        self.max_y.append(max_y)
+        columns, rows = self._cell_range(min_x, min_y, max_x, max_y)
+        if self._columns:
+            self._columns = range(min(columns.start, self._columns.start),
+                                  max(columns.stop, self._columns.stop))
+            self._rows = range(min(rows.start, self._rows.start), max(rows.stop, self._rows.stop))
+        else:
+            self._columns, self._rows = columns, rows
+        cells = self._cells
+        for column in columns:
+            for row in rows:
+                cell = cells.get((column, row))
+                if cell is None:
+                    cells[(column, row)] = [shape_id]
+                else:
+                    cell.append(shape_id)
+
+    def insert(self, shape):
+        """
+        Add one shape to the index.
+
+        Args:
+            shape (Shape): A placed Shape instance
+
+        Raises:
+            ValueError: If the shape has not been placed
+        """
+        self._add(shape, shape.bounding_box())
+
+    def _overlaps(self, shape_id, min_x, min_y, max_x, max_y):
+        """Check whether a stored box intersects a box (touching counts)."""
+        return (self.min_x[shape_id] <= max_x and min_x <= self.max_x[shape_id]
+                and self.min_y[shape_id] <= max_y and min_y <= self.max_y[shape_id])
+
+    def query(self, min_x, min_y, max_x, max_y):
+        """
+        Find the shapes whose bounding box intersects a window.
+
+        Args:
+            min_x (float): Left edge of the window
+            min_y (float): Bottom edge of the window
+            max_x (float): Right edge of the window
+            max_y (float): Top edge of the window
+
+        Returns:
+            list: Matching shapes, in insertion order
+        """
+        found = set()
+        columns, rows = self._cell_range(min_x, min_y, max_x, max_y)
+        cells = self._cells
+        # Skip the part of a large window that lies outside every shape
+        for column in range(max(columns.start, self._columns.start),
+                            min(columns.stop, self._columns.stop)):
+            for row in range(max(rows.start, self._rows.start), min(rows.stop, self._rows.stop)):
+                for shape_id in cells.get((column, row), ()):
+                    if shape_id not in found and self._overlaps(shape_id, min_x, min_y, max_x, max_y):
+                        found.add(shape_id)
+        return [self.shapes[shape_id] for shape_id in sorted(found)]
+
+    def _distance(self, shape_id, x, y):
+        """Distance from a point to a stored box, 0 if the point is inside."""
+        dx = max(self.min_x[shape_id] - x, 0.0, x - self.max_x[shape_id])
+        dy = max(self.min_y[shape_id] - y, 0.0, y - self.max_y[shape_id])
+        return math.hypot(dx, dy)
+
+    def nearest(self, x, y, k=1):
+        """
+        Find the shapes whose bounding boxes are closest to a point.
+
+        Cells are searched in growing square rings around the point until
+        the next ring cannot hold anything closer than the k-th best match.
+        Rings start at the first one that reaches an occupied cell and only
+        visit occupied columns and rows, so a point far from every shape
+        costs no more than one near them.
+
+        Args:
+            x (float): Horizontal coordinate of the point
+            y (float): Vertical coordinate of the point
+            k (int): Number of shapes to return, defaults to 1
+
+        Returns:
+            list: Up to k shapes, closest first
+        """
+        if not self.shapes or k <= 0:
+            return []
+        size = self.cell_size
+        column, row = math.floor(x / size), math.floor(y / size)
+        columns, rows = self._columns, self._rows
+        # Rings before first miss every occupied cell, rings after reach too
+        first = max(columns.start - column, column - columns[-1],
+                    rows.start - row, row - rows[-1], 0)
+        reach = max(abs(column - columns.start), abs(column - columns[-1]),
+                    abs(row - rows.start), abs(row - rows[-1]))
+
+        seen = set()
+        best = []
+        for ring in range(first, reach + 1):
+            for cell in self._ring(column, row, ring):
+                for shape_id in self._cells.get(cell, ()):
+                    if shape_id not in seen:
+                        seen.add(shape_id)
+                        best.append((self._distance(shape_id, x, y), shape_id))
+            best = nsmallest(k, best)
+            # Anything in a later ring is at least ring * size away
+            if len(best) == k and best[-1][0] <= ring * size:
+                break
+        return [self.shapes[shape_id] for _, shape_id in best]
+
+    def _ring(self, column, row, ring):
+        """Yield the occupied-range cells at Chebyshev distance ring from (column, row)."""
+        columns, rows = self._columns, self._rows
+        left, right, bottom, top = column - ring, column + ring, row - ring, row + ring
+        span = range(max(left, columns.start), min(right + 1, columns.stop))
+        for edge in (bottom, top) if ring else (row,):
+            if edge in rows:
+                for cell_column in span:
+                    yield (cell_column, edge)
+        span = range(max(bottom + 1, rows.start), min(top, rows.stop))
+        for edge in (left, right) if ring else ():
+            if edge in columns:
+                for cell_row in span:
+                    yield (edge, cell_row)
+
+    def overlapping_pairs(self):
+        """
+        Find every pair of shapes whose bounding boxes intersect.
+
+        Only shapes sharing a cell are compared. A pair that shares several
+        cells is reported by the one holding the lower-left corner of the
+        two boxes' intersection, so each pair appears once. That cell is
+        computed with the same floor division that placed the shapes in
+        their cells.
+
+        Returns:
+            list: (shape, shape) pairs; the first was inserted earlier
+        """
+        size = self.cell_size
+        floor = math.floor
+        boxes = list(zip(self.min_x, self.min_y, self.max_x, self.max_y))
+        pairs = []
+        for (column, row), ids in self._cells.items():
+            if len(ids) < 2:
+                continue
+            cell = [(shape_id,) + boxes[shape_id] for shape_id in ids]
+            for i, (first, min_x1, min_y1, max_x1, max_y1) in enumerate(cell):
+                for second, min_x2, min_y2, max_x2, max_y2 in cell[i + 1:]:
+                    # Compare cell indices, not cell edges: column * size can
+                    # round differently from the division that placed a box
+                    if (min_x1 <= max_x2 and min_x2 <= max_x1
+                            and min_y1 <= max_y2 and min_y2 <= max_y1
+                            and floor(max(min_x1, min_x2) / size) == column
+                            and floor(max(min_y1, min_y2) / size) == row):
+                        pairs.append((first, second))
+        pairs.sort()
+        return [(self.shapes[first], self.shapes[second]) for first, second in pairs]
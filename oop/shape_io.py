@@ -0,0 +1,305 @@
+"""
+Streaming text / JSON Lines input for polymorphism_demo shapes, and a
+parallel per-kind area summary.
+
+Text files hold one str(shape) per line, such as "Circle(radius=1.5)" or
+"Rectangle(length=2, width=3, x=0, y=0)". JSON Lines records carry a "kind"
+field ("rectangle", "circle" or "triangle"), the dimensions that kind needs
+and, optionally, x and y.
+"""
+
+import json
+import os
+import re
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+from polymorphism_demo import Circle, Rectangle, Triangle
+from record_io import iter_chunks, read_jsonl, write_chunks
+
+FORMATS = ("text", "jsonl")
+
+# kind -> (class, constructor fields)
+KINDS = {
+    "rectangle": (Rectangle, ("length", "width")),
+    "circle": (Circle, ("radius",)),
+    "triangle": (Triangle, ("base", "height")),
+}
+
+SHAPE_TEXT = re.compile(r"(\w+)\((.*)\)")
+
+
+def parse_shape_text(line):
+    """
+    Turn one str(shape) line into a record.
+
+    Args:
+        line (str): Text such as "Circle(radius=1.5, x=0, y=0)"
+
+    Returns:
+        dict: The record, with a lowercase kind and float values
+
+    Raises:
+        ValueError: If the line is not a shape
+    """
+    match = SHAPE_TEXT.fullmatch(line.strip())
+    if match is None:
+        raise ValueError(f"Not a shape: {line.strip()!r}")
+    kind, fields = match.groups()
+    record = {"kind": kind.lower()}
+    for field in fields.split(", "):
+        name, _, value = field.partition("=")
+        record[name] = float(value)
+    return record
+
+
+def read_records(fp, fmt="text"):
+    """
+    Lazily read shape records from a text or JSON Lines file.
+
+    Blank lines are skipped.
+
+    Args:
+        fp: A text file object opened for reading
+        fmt (str): "text" or "jsonl"
+
+    Returns:
+        iterator: One dict per record
+
+    Raises:
+        ValueError: If the format is not supported
+    """
+    if fmt == "text":
+        return (parse_shape_text(line) for line in fp if line.strip())
+    if fmt == "jsonl":
+        return read_jsonl(fp)
+    raise ValueError(f"Unsupported shape format: {fmt}")
+
+
+def shape_from_record(record):
+    """
+    Build a Rectangle, Circle, or Triangle from a record.
+
+    Args:
+        record (dict): A record with kind, the kind's dimensions and
+            optionally x and y
+
+    Returns:
+        Shape: The new shape
+
+    Raises:
+        ValueError: If the kind is unknown or a dimension is missing
+    """
+    kind = str(record.get("kind", "")).lower()
+    if kind not in KINDS:
+        raise ValueError(f"Unknown shape kind: {kind}")
+    cls, fields = KINDS[kind]
+    try:
+        dimensions = [record[field] for field in fields]
+    except KeyError as e:
+        raise ValueError(f"Shape record is missing a field: {record}") from e
+    return cls(*dimensions, x=record.get("x"), y=record.get("y"))
+
+
+def shape_to_record(shape):
+    """
+    Convert a Rectangle, Circle, or Triangle into a JSON Lines record.
+
+    Args:
+        shape (Shape): The shape to convert
+
+    Returns:
+        dict: The record; x and y are included only for placed shapes
+    """
+    kind = type(shape).__name__.lower()
+    record = {"kind": kind}
+    for field in KINDS[kind][1]:
+        record[field] = getattr(shape, field)
+    if shape.is_placed():
+        record["x"], record["y"] = shape.x, shape.y
+    return record
+
+
+def iter_shape_chunks(fp, fmt="text", chunk_size=10_000):
+    """
+    Stream shapes from a file in fixed-size chunks.
+
+    Only one chunk is held in memory at a time.
+
+    Args:
+        fp: A text file object opened for reading
+        fmt (str): "text" or "jsonl"
+        chunk_size (int): Number of shapes per chunk, defaults to 10,000
+
+    Returns:
+        iterator: Lists of new Rectangle, Circle, and Triangle instances
+    """
+    return iter_chunks(map(shape_from_record, read_records(fp, fmt)), chunk_size)
+
+
+def export_shapes(shapes, fp, fmt="text", chunk_size=10_000):
+    """
+    Write shapes to a file, one buffered write per chunk.
+
+    Args:
+        shapes (iterable): Rectangle, Circle, and Triangle instances
+        fp: A text file object opened for writing
+        fmt (str): "text" or "jsonl"
+        chunk_size (int): Number of shapes per write, defaults to 10,000
+
+    Returns:
+        int: The number of shapes written
+
+    Raises:
+        ValueError: If the format is not supported
+    """
+    if fmt not in FORMATS:
+        raise ValueError(f"Unsupported shape format: {fmt}")
+    encode = str if fmt == "text" else lambda shape: json.dumps(shape_to_record(shape))
+
+    def format_chunk(chunk):
+        return "".join([encode(shape) + "\n" for shape in chunk])
+    return write_chunks(fp, shapes, format_chunk, chunk_size)
+
+
+class AreaSummary:
+    """
+    Shape count, total area, and smallest and largest area per kind.
+
+    Summaries of separate chunks can be merged, so a file can be summarized
+    piece by piece, in any number of processes.
+    """
+
+    def __init__(self):
+        """Initialize an empty summary."""
+        self.kinds = {}  # Class name -> [count, total, smallest, largest]
+
+    def add(self, shapes):
+        """
+        Add the areas of some shapes.
+
+        Args:
+            shapes (iterable): Shape instances
+
+        Returns:
+            AreaSummary: This summary, for chaining
+        """
+        for shape in shapes:
+            area = shape.area()
+            stats = self.kinds.get(type(shape).__name__)
+            if stats is None:
+                self.kinds[type(shape).__name__] = [1, area, area, area]
+            else:
+                stats[0] += 1
+                stats[1] += area
+                if area < stats[2]:
+                    stats[2] = area
+                elif area > stats[3]:
+                    stats[3] = area
+        return self
+
+    def merge(self, other):
+        """
+        Fold another summary into this one.
+
+        Args:
+            other (AreaSummary): The summary to add
+
+        Returns:
+            AreaSummary: This summary, for chaining
+        """
+        for kind, (count, total, smallest, largest) in other.kinds.items():
+            stats = self.kinds.get(kind)
+            if stats is None:
+                self.kinds[kind] = [count, total, smallest, largest]
+            else:
+                stats[0] += count
+                stats[1] += total
+                stats[2] = min(stats[2], smallest)
+                stats[3] = max(stats[3], largest)
+        return self
+
+    @property
+    def count(self):
+        """Number of shapes summarized."""
+        return sum(stats[0] for stats in self.kinds.values())
+
+    @property
+    def total_area(self):
+        """Total area of every shape summarized."""
+        return sum(stats[1] for stats in self.kinds.values())
+
+    def as_dict(self):
+        """
+        Report the statistics of each kind.
+
+        Returns:
+            dict: Class name -> dict with count, total, mean, min and max
+        """
+        return {kind: {"count": count, "total": total, "mean": total / count,
+                       "min": smallest, "max": largest}
+                for kind, (count, total, smallest, largest) in sorted(self.kinds.items())}
+
+
+def summarize_lines(lines, fmt="text"):
+    """
+    Summarize the shapes in a chunk of file lines.
+
+    This is the work each process does in summarize_file().
+
+    Args:
+        lines (list): Lines of a text or JSON Lines shape file
+        fmt (str): "text" or "jsonl"
+
+    Returns:
+        AreaSummary: The chunk's summary
+    """
+    return AreaSummary().add(map(shape_from_record, read_records(lines, fmt)))
+
+
+def summarize_file(path, fmt=None, workers=None, chunk_size=10_000):
+    """
+    Summarize shape areas in a file, spreading chunks over processes.
+
+    The file is read chunk_size lines at a time. Each chunk of raw lines is
+    parsed and summarized by a worker process, and the partial summaries
+    are merged in file order. At most two chunks per worker are in flight,
+    so memory use does not grow with the file size.
+
+    Args:
+        path (str): Path of a text or JSON Lines shape file
+        fmt (str): "text" or "jsonl", defaults to "jsonl" for .jsonl files
+            and "text" otherwise
+        workers (int): Number of processes, defaults to the CPU count;
+            1 summarizes in this process
+        chunk_size (int): Lines per chunk, defaults to 10,000
+
+    Returns:
+        AreaSummary: The summary of the whole file
+
+    Raises:
+        ValueError: If the format is not supported or a line is not a shape
+    """
+    if fmt is None:
+        fmt = "jsonl" if path.endswith(".jsonl") else "text"
+    if fmt not in FORMATS:
+        raise ValueError(f"Unsupported shape format: {fmt}")
+    workers = workers or os.cpu_count() or 1
+    summary = AreaSummary()
+
+    with open(path, encoding="utf-8") as fp:
+        chunks = iter_chunks(fp, chunk_size)
+        if workers == 1:
+            for lines in chunks:
+                summary.merge(summarize_lines(lines, fmt))
+            return summary
+
+        with ProcessPoolExecutor(workers) as pool:
+            pending = deque()
+            for lines in chunks:
+                pending.append(pool.submit(summarize_lines, lines, fmt))
+                if len(pending) >= 2 * workers:
+                    summary.merge(pending.popleft().result())
+            while pending:
+                summary.merge(pending.popleft().result())
+    return summary
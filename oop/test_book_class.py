@@ -0,0 +1,38 @@
+import io
+import unittest
+from contextlib import redirect_stdout
+from book_class import Book, BookFactory
+
+class TestBookFactory(unittest.TestCase):
+
+    def setUp(self):
+        """Set up a factory and silence Book.__del__ messages."""
+        self.factory = BookFactory()
+        silenced = redirect_stdout(io.StringIO())
+        silenced.__enter__()
+        self.addCleanup(silenced.__exit__, None, None, None)
+
+    def test_shared_values(self):
+        """Test that equal authors and years become one shared object."""
+        first = self.factory.create("1984", "".join(["George ", "Orwell"]), 1949)
+        second = self.factory.create("Animal Farm", "".join(["George ", "Orwell"]), int("1949"))
+        self.assertIs(first.author, second.author)
+        self.assertIs(first.year, second.year)
+        self.assertEqual(self.factory.distinct_authors(), 1)
+
+    def test_repr_round_trip(self):
+        """Test that parsed reprs rebuild equal books without eval()."""
+        books = [Book("1984", "George Orwell", 1949), Book("Ender's Game", "Orson Scott Card", 1985)]
+        parsed = self.factory.parse_many([repr(book) + "\n" for book in books] + ["\n"])
+        self.assertEqual([repr(book) for book in parsed], [repr(book) for book in books])
+        self.assertEqual(self.factory.parse(repr(books[1])).title, "Ender's Game")
+
+    def test_invalid_repr(self):
+        """Test that malformed lines are rejected with their line number."""
+        with self.assertRaises(ValueError):
+            self.factory.parse("__import__('os')")
+        with self.assertRaisesRegex(ValueError, "Line 2"):
+            self.factory.parse_many(["Book('A', 'B', 1)", "Book('A', 'B', year)"])
+
+if __name__ == '__main__':
+    unittest.main()
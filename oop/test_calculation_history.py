@@ -0,0 +1,58 @@
+import io
+import unittest
+from calculation_history import CalculationHistory
+from class_static_methods_demo import Calculator
+
+class TestCalculationHistory(unittest.TestCase):
+
+    def test_calculator_compatibility(self):
+        """Test that add_to_history/get_history keep their text format."""
+        calc = Calculator("Test")
+        calc.add_to_history("10 + 5", 15)
+        calc.add_to_history("7 / 2", 3.5)
+        calc.add_to_history("sqrt(16)", 4.0)
+        calc.add_to_history("1e3 * 2", 2000)
+        self.assertEqual(calc.get_history(),
+                         ["10 + 5: 15", "7 / 2: 3.5", "sqrt(16): 4.0", "1e3 * 2: 2000"])
+        self.assertEqual(calc.get_history(last=2), ["sqrt(16): 4.0", "1e3 * 2: 2000"])
+        entry = next(calc.history.entries())
+        self.assertEqual((entry.operator, entry.a, entry.b, entry.result), ("+", 10, 5, 15))
+
+    def test_ring_buffer(self):
+        """Test that the oldest entries are dropped once capacity is reached."""
+        history = CalculationHistory(capacity=3)
+        for i in range(5):
+            history.record("*", i, 2, i * 2)
+        history.append("not structured", "n/a")
+        self.assertEqual(len(history), 3)
+        self.assertEqual(list(history), ["3 * 2: 6", "4 * 2: 8", "not structured: n/a"])
+        self.assertEqual(history[0], "3 * 2: 6")
+        self.assertEqual(history[-1], "not structured: n/a")
+        self.assertEqual(history[1:], ["4 * 2: 8", "not structured: n/a"])
+        self.assertEqual(history.last(10), list(history))
+        with self.assertRaises(IndexError):
+            history[3]
+        with self.assertRaises(ValueError):
+            history.record("%", 1, 2, 1)
+        history.clear()
+        self.assertEqual(list(history), [])
+
+    def test_export_csv(self):
+        """Test bulk CSV export with a header row."""
+        history = CalculationHistory()
+        history.append("10 - 5", 5)
+        history.append("custom", 1.5)
+        out = io.StringIO()
+        self.assertEqual(history.export_csv(out, chunk_size=1), 2)
+        self.assertEqual(out.getvalue().splitlines(),
+                         ["operation,operator,a,b,result", "10 - 5,-,10,5,5", "custom,,,,1.5"])
+
+        out = io.StringIO()
+        self.assertEqual(history.export_csv(out, chunk_size=2), 2)
+        self.assertEqual(len(out.getvalue().splitlines()), 3)
+        for chunk_size in (0, -1):
+            with self.assertRaises(ValueError):
+                history.export_csv(io.StringIO(), chunk_size=chunk_size)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,63 @@
+import unittest
+from unittest import mock
+import library_catalog
+from library_system import Book, EBook, PrintBook, Library
+from library_catalog import ColumnarCatalog
+
+class TestColumnarCatalog(unittest.TestCase):
+
+    def setUp(self):
+        """Set up a catalog from a Library with every kind of book."""
+        library = Library()
+        library.add_books([
+            Book("Pride and Prejudice", "Jane Austen"),
+            EBook("Snow Crash", "Neal Stephenson", 500),
+            PrintBook("The Lord of the Rings", "J.R.R. Tolkien", 1200),
+            EBook("Emma", "Jane Austen", 300),
+        ])
+        self.catalog = ColumnarCatalog.from_library(library)
+
+    def test_aggregates(self):
+        """Test totals, averages and counts with and without filters."""
+        self.assertEqual(len(self.catalog), 4)
+        self.assertEqual(self.catalog.total("file_size", EBook), 800)
+        self.assertEqual(self.catalog.total("file_size", author="Jane Austen"), 300)
+        self.assertEqual(self.catalog.average("page_count", PrintBook), 1200)
+        self.assertIsNone(self.catalog.average("page_count", author="Nobody"))
+        self.assertEqual(self.catalog.count(EBook, "Jane Austen"), 1)
+        with self.assertRaises(ValueError):
+            self.catalog.total("title")
+
+    def test_filter_and_group_by(self):
+        """Test row filters and per-kind / per-author groups."""
+        self.assertEqual(self.catalog.filter(author="Jane Austen"), [0, 3])
+        self.assertEqual(self.catalog.filter(PrintBook), [2])
+        self.assertEqual(self.catalog.group_by("kind"),
+                         {"Book": 1, "EBook": 2, "PrintBook": 1})
+        self.assertEqual(self.catalog.group_by("author", "file_size"),
+                         {"Jane Austen": 300, "Neal Stephenson": 500, "J.R.R. Tolkien": 0})
+
+    def test_loop_fallback(self):
+        """Test that results match with and without NumPy."""
+        def results():
+            return [self.catalog.mask(EBook, "Jane Austen"), self.catalog.mask(author="Nobody"),
+                    self.catalog.filter(Book), self.catalog.group_by("kind"),
+                    self.catalog.group_by("author", "page_count"),
+                    self.catalog.total("file_size", EBook), self.catalog.count(author="Jane Austen")]
+
+        expected = results()
+        with mock.patch.object(library_catalog, "numpy", None):
+            self.assertEqual(results(), expected)
+        self.assertEqual(expected[0], bytes([0, 0, 0, 1]))
+
+    def test_materialize(self):
+        """Test that book objects are rebuilt with their original class."""
+        books = self.catalog.books(self.catalog.filter(EBook))
+        self.assertEqual([type(book) for book in books], [EBook, EBook])
+        self.assertEqual(str(books[1]), "EBook: Emma by Jane Austen, File Size: 300KB")
+        self.assertEqual(str(self.catalog.book(0)), str(Book("Pride and Prejudice", "Jane Austen")))
+        with self.assertRaises(TypeError):
+            self.catalog.add_book("not a book")
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,47 @@
+import io
+import unittest
+from library_io import book_from_record, export_books, import_books, iter_book_batches
+from library_system import Book, EBook, Library, PrintBook
+
+class TestLibraryIO(unittest.TestCase):
+
+    def setUp(self):
+        """Set up a Library with one book of each kind."""
+        self.library = Library()
+        self.library.add_books([Book("Pride and Prejudice", "Jane Austen"),
+                                EBook("Snow Crash", "Neal Stephenson", 500),
+                                PrintBook("The Lord of the Rings", "J.R.R. Tolkien", 1216)])
+
+    def test_round_trip(self):
+        """Test that both formats rebuild every kind with its own fields."""
+        for fmt in ("csv", "jsonl"):
+            output = io.StringIO()
+            self.assertEqual(export_books(self.library.books, output, fmt, batch_size=2), 3)
+
+            copy = Library()
+            self.assertEqual(import_books(io.StringIO(output.getvalue()), copy, fmt, batch_size=2), 3)
+            self.assertEqual([type(book) for book in copy.books], [Book, EBook, PrintBook])
+            self.assertEqual([book.get_info() for book in copy.books],
+                             [book.get_info() for book in self.library.books])
+
+    def test_empty_export(self):
+        """Test that an empty CSV export still has its header row."""
+        output = io.StringIO()
+        self.assertEqual(export_books([], output), 0)
+        self.assertEqual(output.getvalue(), "kind,title,author,file_size,page_count\r\n")
+
+    def test_batches(self):
+        """Test batch sizes and validation of records and batch size."""
+        data = "kind,title,author,file_size\nbook,A,X,\nebook,B,Y,10\nbook,C,Z,\n"
+        sizes = [len(batch) for batch in iter_book_batches(io.StringIO(data), batch_size=2)]
+        self.assertEqual(sizes, [2, 1])
+
+        with self.assertRaises(ValueError):
+            book_from_record({"kind": "ebook", "title": "A", "author": "X"})
+        with self.assertRaises(ValueError):
+            book_from_record({"kind": "scroll", "title": "A", "author": "X"})
+        with self.assertRaises(ValueError):
+            list(iter_book_batches(io.StringIO(data), batch_size=0))
+
+if __name__ == '__main__':
+    unittest.main()
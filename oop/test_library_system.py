@@ -0,0 +1,56 @@
+import io
+import unittest
+from library_system import Book, EBook, PrintBook, Library
+
+class TestLibraryRendering(unittest.TestCase):
+
+    def test_renderings_follow_changes(self):
+        """Test that renderings follow attribute changes."""
+        book = EBook("Snow Crash", "Neal Stephenson", 500)
+        self.assertEqual(book.get_info(), "EBook: Book: Snow Crash by Neal Stephenson, File Size: 500KB")
+        book.file_size = 600
+        book.title = "The Diamond Age"
+        self.assertEqual(book.get_info(), "EBook: Book: The Diamond Age by Neal Stephenson, File Size: 600KB")
+        self.assertEqual(str(book), "EBook: The Diamond Age by Neal Stephenson, File Size: 600KB")
+
+    def test_write_listing(self):
+        """Test that write_listing() matches list_books() across chunks."""
+        library = Library()
+        out = io.StringIO()
+        self.assertEqual(library.write_listing(out), 0)
+        self.assertEqual(out.getvalue(), "The library is empty.\n")
+
+        library.add_books([Book("Emma", "Jane Austen"),
+                           PrintBook("The Hobbit", "J.R.R. Tolkien", 310),
+                           EBook("Snow Crash", "Neal Stephenson", 500)])
+        out = io.StringIO()
+        self.assertEqual(library.write_listing(out, chunk_size=2), 3)
+        self.assertEqual(out.getvalue(), "Books in the library:\n"
+                         "Book: Emma by Jane Austen\n"
+                         "PrintBook: Book: The Hobbit by J.R.R. Tolkien, Page Count: 310\n"
+                         "EBook: Book: Snow Crash by Neal Stephenson, File Size: 500KB\n")
+
+    def test_listing_cache(self):
+        """Test that the cached listing follows additions and explicit invalidation."""
+        library = Library()
+        book = Book("Emma", "Jane Austen")
+        library.add_book(book)
+
+        def listing():
+            out = io.StringIO()
+            library.write_listing(out)
+            return out.getvalue().splitlines()[1:]
+
+        self.assertEqual(listing(), ["Book: Emma by Jane Austen"])
+        library.add_books([EBook("Snow Crash", "Neal Stephenson", 500)])
+        self.assertEqual(len(listing()), 2)
+        library.books.pop()
+        self.assertEqual(listing(), ["Book: Emma by Jane Austen"])
+
+        book.title = "Persuasion"
+        self.assertEqual(listing(), ["Book: Emma by Jane Austen"])
+        library.invalidate_listing()
+        self.assertEqual(listing(), ["Book: Persuasion by Jane Austen"])
+
+if __name__ == '__main__':
+    unittest.main()
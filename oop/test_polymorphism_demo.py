@@ -0,0 +1,43 @@
+import math
+import unittest
+from polymorphism_demo import Circle, Rectangle, Shape, Triangle
+
+class TestShapeGeometry(unittest.TestCase):
+
+    def test_formulas(self):
+        """Test area and perimeter of every shape kind."""
+        self.assertEqual(Rectangle(2, 3).perimeter(), 10)
+        self.assertEqual(Circle(1).perimeter(), 2 * math.pi)
+        self.assertEqual(Triangle(6, 4).area(), 12)
+        self.assertEqual(Triangle(6, 4).perimeter(), 16)
+        with self.assertRaises(NotImplementedError):
+            Shape().area()
+
+    def test_cache_invalidation(self):
+        """Test that cached values follow dimension and position changes."""
+        circle = Circle(1, 0, 0)
+        self.assertEqual((circle.area(), circle.bounding_box()), (math.pi, (-1, -1, 1, 1)))
+        self.assertIs(circle.bounding_box(), circle.bounding_box())
+        circle.radius = 2
+        self.assertEqual(circle.area(), 4 * math.pi)
+        self.assertEqual(circle.perimeter(), 4 * math.pi)
+        circle.place(5, 5)
+        self.assertEqual(circle.bounding_box(), (3, 3, 7, 7))
+        circle.x = 6
+        self.assertEqual(circle.bounding_box(), (4, 3, 8, 7))
+        self.assertEqual((circle.radius, circle.x, circle.area()), (2, 6, 4 * math.pi))
+
+        rectangle = Rectangle(2, 3)
+        rectangle.area()
+        rectangle.width = 4
+        self.assertEqual(rectangle.area(), 8)
+
+    def test_opt_out(self):
+        """Test that shapes with cache_geometry off store nothing."""
+        triangle = Triangle(6, 4, 0, 0)
+        triangle.cache_geometry = False
+        triangle.area(), triangle.perimeter(), triangle.bounding_box()
+        self.assertEqual(sorted(vars(triangle)), ["_base", "_height", "_x", "_y", "cache_geometry"])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,41 @@
+import math
+import unittest
+from polymorphism_demo import Circle, Rectangle, Shape, Triangle
+from shape_batch import ShapeBatch
+
+class TestShapeBatch(unittest.TestCase):
+
+    def setUp(self):
+        """Set up a batch with every kind of shape, interleaved."""
+        self.shapes = [Rectangle(2, 3), Circle(1), Triangle(4, 5), Rectangle(1, 1), Circle(2)]
+        self.batch = ShapeBatch.from_shapes(self.shapes)
+
+    def test_areas(self):
+        """Test that column-wise areas match the per-object area() calls."""
+        self.assertEqual(list(self.batch.areas()), [shape.area() for shape in self.shapes])
+        self.assertEqual(list(self.batch.areas(Rectangle)), [6, 1])
+        self.assertAlmostEqual(self.batch.total_area(), sum(shape.area() for shape in self.shapes))
+        self.assertEqual(self.batch.total_area_by_kind(),
+                         {"Rectangle": 7, "Circle": 5 * math.pi, "Triangle": 10})
+        self.assertEqual(self.batch.count(Circle), 2)
+
+    def test_histogram(self):
+        """Test equal-width bins with default and explicit ranges."""
+        counts, edges = self.batch.histogram(4)
+        self.assertEqual(counts, [2, 1, 0, 2])
+        self.assertEqual((edges[0], edges[-1]), (1, 4 * math.pi))
+        self.assertEqual(self.batch.histogram(2, low=0, high=10), ([2, 2], [0, 5, 10]))
+        self.assertEqual(ShapeBatch().histogram(2)[0], [0, 0])
+
+    def test_round_trip(self):
+        """Test conversion back to shape objects in the original order."""
+        shapes = self.batch.to_shapes()
+        self.assertEqual([shape.area() for shape in shapes], [shape.area() for shape in self.shapes])
+        self.assertEqual(str(shapes[2]), "Triangle(base=4.0, height=5.0)")
+        self.assertEqual([type(shape) for shape in self.batch.to_shapes()],
+                         [type(shape) for shape in self.shapes])
+        with self.assertRaises(TypeError):
+            self.batch.append(Shape())
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,79 @@
+import random
+import unittest
+from polymorphism_demo import Circle, Rectangle, Triangle
+from shape_index import GridIndex
+
+class TestGridIndex(unittest.TestCase):
+
+    def setUp(self):
+        """Set up an index over a few placed shapes."""
+        self.square = Rectangle(2, 2, 0, 0)        # box (0, 0, 2, 2)
+        self.circle = Circle(1, 3, 1)              # box (2, 0, 4, 2)
+        self.triangle = Triangle(4, 3, 10, 10)     # box (10, 10, 14, 13)
+        self.far = Rectangle(1, 1, -20, 5)         # box (-20, 5, -19, 6)
+        self.index = GridIndex.bulk_load([self.square, self.circle, self.triangle, self.far],
+                                         cell_size=3)
+
+    def test_bounding_boxes(self):
+        """Test placement and bounding boxes of every shape kind."""
+        self.assertEqual(self.circle.bounding_box(), (2, 0, 4, 2))
+        self.assertEqual(Triangle(4, 3).place(1, 1).bounding_box(), (1, 1, 5, 4))
+        self.assertEqual(str(self.square), "Rectangle(length=2, width=2, x=0, y=0)")
+        self.assertEqual(str(Circle(1)), "Circle(radius=1)")
+        with self.assertRaises(ValueError):
+            Circle(1).bounding_box()
+        with self.assertRaises(ValueError):
+            self.index.insert(Rectangle(1, 1))
+
+    def test_window_query(self):
+        """Test that windows return every intersecting box once, in order."""
+        self.assertEqual(self.index.query(1, 1, 2.5, 2.5), [self.square, self.circle])
+        self.assertEqual(self.index.query(-100, -100, 100, 100),
+                         [self.square, self.circle, self.triangle, self.far])
+        self.assertEqual(self.index.query(5, 5, 6, 6), [])
+
+    def test_nearest(self):
+        """Test nearest-neighbour search, including points far from the grid."""
+        self.assertEqual(self.index.nearest(9, 9), [self.triangle])
+        self.assertEqual(self.index.nearest(1, 1, k=2), [self.square, self.circle])
+        self.assertEqual(self.index.nearest(-50, 5), [self.far])
+        self.assertEqual(len(self.index.nearest(0, 0, k=10)), 4)
+        self.assertEqual(GridIndex(1).nearest(0, 0), [])
+        # Rings before the occupied cells are skipped, so this returns at once
+        fine = GridIndex.bulk_load([self.square, self.circle, self.far], cell_size=0.01)
+        self.assertEqual(fine.nearest(3000, 3000, k=2), [self.circle, self.square])
+
+    def test_overlapping_pairs(self):
+        """Test that touching boxes pair up once, across cell boundaries."""
+        self.index.insert(Rectangle(5, 1, 1, 1.5))
+        pairs = self.index.overlapping_pairs()
+        self.assertEqual(len(pairs), 3)
+        self.assertEqual(pairs[0], (self.square, self.circle))
+
+        small = GridIndex.bulk_load([Rectangle(0.3, 0.4, 1.5, 2.0), Rectangle(0.6, 0.2, 1.7, 1.9)],
+                                    cell_size=0.1)
+        self.assertEqual(len(small.overlapping_pairs()), 1)
+
+    def test_matches_brute_force(self):
+        """Test pairs and nearest shapes against every-shape scans on random layouts."""
+        rng = random.Random(42)
+        for cell_size in (0.1, 0.37, 1, 2.5):
+            shapes = [Rectangle(rng.uniform(0.05, 2), rng.uniform(0.05, 2),
+                                rng.uniform(-5, 5), rng.uniform(-5, 5)) for _ in range(60)]
+            index = GridIndex.bulk_load(shapes, cell_size)
+            boxes = [shape.bounding_box() for shape in shapes]
+            expected = [(shapes[i], shapes[j]) for i in range(len(shapes))
+                        for j in range(i + 1, len(shapes))
+                        if boxes[i][0] <= boxes[j][2] and boxes[j][0] <= boxes[i][2]
+                        and boxes[i][1] <= boxes[j][3] and boxes[j][1] <= boxes[i][3]]
+            self.assertEqual(index.overlapping_pairs(), expected)
+
+            for _ in range(20):
+                x, y = rng.uniform(-30, 30), rng.uniform(-30, 30)
+                distances = sorted(index._distance(i, x, y) for i in range(len(shapes)))
+                found = index.nearest(x, y, k=3)
+                self.assertEqual([index._distance(shapes.index(shape), x, y) for shape in found],
+                                 distances[:3])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,51 @@
+import io
+import math
+import os
+import tempfile
+import unittest
+from polymorphism_demo import Circle, Rectangle, Triangle
+from shape_io import AreaSummary, export_shapes, iter_shape_chunks, summarize_file
+
+class TestShapeIO(unittest.TestCase):
+
+    def setUp(self):
+        """Set up placed and unplaced shapes of every kind."""
+        self.shapes = [Rectangle(2, 3), Circle(1, x=0, y=0), Triangle(4, 5), Rectangle(1, 1, 2, 2)]
+
+    def test_round_trip(self):
+        """Test that both formats stream back the same shapes in chunks."""
+        for fmt in ("text", "jsonl"):
+            out = io.StringIO()
+            self.assertEqual(export_shapes(self.shapes, out, fmt, chunk_size=3), 4)
+            chunks = list(iter_shape_chunks(io.StringIO(out.getvalue()), fmt, chunk_size=3))
+            self.assertEqual([len(chunk) for chunk in chunks], [3, 1])
+            shapes = chunks[0] + chunks[1]
+            self.assertEqual([shape.area() for shape in shapes], [6, math.pi, 10, 1])
+            self.assertEqual(shapes[3].bounding_box(), (2, 2, 3, 3))
+            self.assertFalse(shapes[0].is_placed())
+        with self.assertRaises(ValueError):
+            list(iter_shape_chunks(io.StringIO("Hexagon(side=1)\n")))
+
+    def test_summarize_file(self):
+        """Test that serial and parallel summaries agree."""
+        fd, path = tempfile.mkstemp(suffix=".jsonl")
+        with os.fdopen(fd, "w") as fp:
+            export_shapes(self.shapes * 50, fp, "jsonl")
+        try:
+            serial = summarize_file(path, workers=1, chunk_size=7)
+            parallel = summarize_file(path, workers=2, chunk_size=7)
+        finally:
+            os.remove(path)
+        self.assertEqual(serial.as_dict(), parallel.as_dict())
+        self.assertEqual(serial.count, 200)
+        self.assertAlmostEqual(serial.total_area, 50 * (17 + math.pi))
+        self.assertEqual(serial.as_dict()["Rectangle"],
+                         {"count": 100, "total": 350, "mean": 3.5, "min": 1, "max": 6})
+
+    def test_merge(self):
+        """Test that merged partial summaries equal one summary."""
+        merged = AreaSummary().add(self.shapes[:2]).merge(AreaSummary().add(self.shapes[2:]))
+        self.assertEqual(merged.as_dict(), AreaSummary().add(self.shapes).as_dict())
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,172 @@
+# account_store.py
+
+import threading
+
+from bank_account import FixedPointBankAccount
+
+
+class AccountStore:
+    """
+    A thread-safe collection of account balances with atomic transfers.
+
+    Accounts are spread over a fixed number of shards, each guarded by its
+    own lock, so operations on accounts in different shards run without
+    contending. A transfer locks both shards in shard-number order, which
+    rules out deadlocks between concurrent transfers in opposite directions.
+
+    Balances are stored as integer cents, like FixedPointBankAccount.
+    """
+
+    def __init__(self, shards=64):
+        """
+        Initialize an empty AccountStore.
+
+        Args:
+            shards (int): Number of independently locked shards, defaults to 64
+        """
+        self._locks = [threading.Lock() for _ in range(shards)]
+        self._balances = [{} for _ in range(shards)]  # account id -> cents
+
+    def _shard(self, account_id):
+        """Index of the shard that holds an account."""
+        return hash(account_id) % len(self._locks)
+
+    def open_account(self, account_id, initial_balance=0):
+        """
+        Open a new account.
+
+        Args:
+            account_id: A hashable account identifier
+            initial_balance (float): Starting balance, defaults to 0
+
+        Raises:
+            ValueError: If the account already exists
+        """
+        shard = self._shard(account_id)
+        with self._locks[shard]:
+            if account_id in self._balances[shard]:
+                raise ValueError(f"Account {account_id!r} already exists")
+            self._balances[shard][account_id] = FixedPointBankAccount.to_cents(initial_balance)
+
+    def balance(self, account_id):
+        """
+        Get the balance of an account.
+
+        Args:
+            account_id: The account identifier
+
+        Returns:
+            float: The current balance in dollars
+
+        Raises:
+            KeyError: If the account does not exist
+        """
+        shard = self._shard(account_id)
+        with self._locks[shard]:
+            return self._balances[shard][account_id] / 100
+
+    def deposit(self, account_id, amount):
+        """
+        Deposit money into an account.
+
+        Args:
+            account_id: The account identifier
+            amount (float): Amount to deposit
+
+        Returns:
+            bool: True if the deposit was applied, False if not positive
+
+        Raises:
+            KeyError: If the account does not exist
+        """
+        cents = FixedPointBankAccount.to_cents(amount)
+        if cents <= 0:
+            return False
+        shard = self._shard(account_id)
+        with self._locks[shard]:
+            self._balances[shard][account_id] += cents
+        return True
+
+    def withdraw(self, account_id, amount):
+        """
+        Withdraw money if sufficient funds are available, atomically.
+
+        Args:
+            account_id: The account identifier
+            amount (float): Amount to withdraw
+
+        Returns:
+            bool: True if withdrawal successful, False otherwise
+
+        Raises:
+            KeyError: If the account does not exist
+        """
+        cents = FixedPointBankAccount.to_cents(amount)
+        if cents <= 0:
+            return False
+        shard = self._shard(account_id)
+        with self._locks[shard]:
+            balances = self._balances[shard]
+            if balances[account_id] < cents:
+                return False
+            balances[account_id] -= cents
+        return True
+
+    def transfer(self, source_id, target_id, amount):
+        """
+        Move money between two accounts as one atomic step.
+
+        Args:
+            source_id: The account to withdraw from
+            target_id: The account to deposit into
+            amount (float): Amount to transfer
+
+        Returns:
+            bool: True if the transfer happened, False if the amount is not
+                positive or the source has insufficient funds
+
+        Raises:
+            KeyError: If either account does not exist
+        """
+        cents = FixedPointBankAccount.to_cents(amount)
+        if cents <= 0:
+            return False
+        source_shard = self._shard(source_id)
+        target_shard = self._shard(target_id)
+        first, second = sorted((source_shard, target_shard))
+
+        with self._locks[first]:
+            if second != first:
+                self._locks[second].acquire()
+            try:
+                source = self._balances[source_shard]
+                target = self._balances[target_shard]
+                if target_id not in target:
+                    raise KeyError(target_id)
+                if source[source_id] < cents:
+                    return False
+                source[source_id] -= cents
+                target[target_id] += cents
+                return True
+            finally:
+                if second != first:
+                    self._locks[second].release()
+
+    def total_balance(self):
+        """
+        Get the sum of all balances as one consistent snapshot.
+
+        Returns:
+            float: The total in dollars
+        """
+        for lock in self._locks:
+            lock.acquire()
+        try:
+            return sum(sum(shard.values()) for shard in self._balances) / 100
+        finally:
+            for lock in self._locks:
+                lock.release()
+
+    def __len__(self):
+        """Number of accounts."""
+        return sum(len(shard) for shard in self._balances)
@@ -0,0 +1,241 @@
+# balance_history.py
+
+import time
+from array import array
+from bisect import bisect_left, bisect_right
+
+from bank_account import BankAccount
+
+
+class BalanceHistory:
+    """
+    Timestamped balance changes stored in array-backed columns.
+
+    Each row holds the time of a change, the balance after it, and the
+    lowest and highest balance reached since the previous row. Rows are
+    appended in time order, so point-in-time queries use binary search.
+
+    When the history grows past max_entries, every row except the newest
+    keep_recent is compacted into one checkpoint row per checkpoint_interval
+    seconds. Checkpoints keep the closing balance and the low and high of
+    their interval. Window statistics stay exact for windows that cover
+    whole checkpoint intervals; a window that starts or ends inside a
+    checkpoint interval gets that whole interval's low and high and is
+    marked approximate. balance_at() inside a compacted interval returns the
+    balance as of the previous checkpoint.
+    """
+
+    def __init__(self, initial_balance=0, max_entries=100_000, keep_recent=10_000,
+                 checkpoint_interval=3600):
+        """
+        Initialize an empty history.
+
+        Args:
+            initial_balance (float): Balance before the first recorded change
+            max_entries (int): Row count that triggers compaction
+            keep_recent (int): Newest rows left uncompacted
+            checkpoint_interval (float): Seconds covered by one checkpoint
+        """
+        self.initial_balance = initial_balance
+        self.max_entries = max_entries
+        self.keep_recent = keep_recent
+        self.checkpoint_interval = checkpoint_interval
+        self._compact_at = max_entries
+        self._checkpoints = 0
+        self._times = array("d")
+        self._balances = array("d")
+        self._lows = array("d")
+        self._highs = array("d")
+
+    def __len__(self):
+        """Number of stored rows, including checkpoints."""
+        return len(self._times)
+
+    def record(self, timestamp, balance):
+        """
+        Append a balance change.
+
+        Args:
+            timestamp (float): Time of the change, not earlier than the last one
+            balance (float): Balance after the change
+
+        Raises:
+            ValueError: If timestamp is earlier than the last recorded change
+        """
+        if self._times and timestamp < self._times[-1]:
+            raise ValueError("Balance changes must be recorded in time order")
+        self._times.append(timestamp)
+        self._balances.append(balance)
+        self._lows.append(balance)
+        self._highs.append(balance)
+        if len(self._times) > self._compact_at:
+            self.compact()
+
+    def compact(self):
+        """Merge all but the newest keep_recent rows into interval checkpoints."""
+        old = len(self._times) - self.keep_recent
+        if old <= 0:
+            return
+
+        times, balances, lows, highs = array("d"), array("d"), array("d"), array("d")
+        bucket = None
+        for i in range(old):
+            current = self._times[i] // self.checkpoint_interval
+            if current == bucket:
+                times[-1] = self._times[i]
+                balances[-1] = self._balances[i]
+                lows[-1] = min(lows[-1], self._lows[i])
+                highs[-1] = max(highs[-1], self._highs[i])
+            else:
+                bucket = current
+                times.append(self._times[i])
+                balances.append(self._balances[i])
+                lows.append(self._lows[i])
+                highs.append(self._highs[i])
+
+        self._checkpoints = len(times)
+        for column, compacted in ((self._times, times), (self._balances, balances),
+                                  (self._lows, lows), (self._highs, highs)):
+            compacted.extend(column[old:])
+        self._times, self._balances, self._lows, self._highs = times, balances, lows, highs
+        # Sparse histories may not shrink much; wait for them to double first
+        self._compact_at = max(self.max_entries, 2 * len(self._times))
+
+    def _splits_checkpoint(self, i, timestamp):
+        """
+        Check whether timestamp falls inside checkpoint row i's interval.
+
+        Args:
+            i (int): Row index
+            timestamp (float): The time to check
+
+        Returns:
+            bool: True if row i is a checkpoint whose interval started at or
+                before timestamp, so it merges changes on both sides of it
+        """
+        if i >= self._checkpoints:
+            return False
+        interval_start = self._times[i] // self.checkpoint_interval * self.checkpoint_interval
+        return interval_start <= timestamp
+
+    def balance_at(self, timestamp):
+        """
+        Get the balance at a point in time in O(log n).
+
+        Args:
+            timestamp (float): The time to query
+
+        Returns:
+            float: The balance after every change recorded at or before timestamp
+        """
+        i = bisect_right(self._times, timestamp)
+        return self._balances[i - 1] if i else self.initial_balance
+
+    def window_stats(self, start, end):
+        """
+        Summarize the balance over the window [start, end].
+
+        Args:
+            start (float): Start of the window
+            end (float): End of the window
+
+        Returns:
+            dict: opening and closing balance, min and max balance, net_flow
+                (closing minus opening), the number of rows in the window, and
+                exact, which is False when start or end falls inside a
+                checkpoint interval. The values are then computed as if
+                that whole interval were inside the window (at start) or
+                outside it (at end).
+        """
+        opening = self.balance_at(start)
+        first = bisect_right(self._times, start)
+        last = bisect_right(self._times, end)
+        low = min(self._lows[first:last], default=opening)
+        high = max(self._highs[first:last], default=opening)
+        closing = self._balances[last - 1] if last > first else opening
+        return {
+            "opening": opening,
+            "closing": closing,
+            "min": min(low, opening),
+            "max": max(high, opening),
+            "net_flow": closing - opening,
+            "changes": last - first,
+            "exact": not (self._splits_checkpoint(first, start)
+                          or self._splits_checkpoint(last, end)),
+        }
+
+    def changes_between(self, start, end):
+        """
+        Get the recorded rows in the window [start, end].
+
+        Args:
+            start (float): Start of the window
+            end (float): End of the window
+
+        Returns:
+            list: (timestamp, balance) pairs in time order
+        """
+        first = bisect_left(self._times, start)
+        last = bisect_right(self._times, end)
+        return list(zip(self._times[first:last], self._balances[first:last]))
+
+
+class HistoryBankAccount(BankAccount):
+    """
+    A BankAccount that records every balance change in a BalanceHistory.
+
+    Enables "what was the balance at time T?" queries for audits.
+    """
+
+    __slots__ = ("history", "clock")
+
+    def __init__(self, initial_balance=0, clock=time.time, **history_options):
+        """
+        Initialize a HistoryBankAccount with an optional initial balance.
+
+        Args:
+            initial_balance (float): Starting balance, defaults to 0
+            clock (callable): Returns the current timestamp, defaults to time.time
+            **history_options: Passed on to BalanceHistory
+        """
+        super().__init__(initial_balance)
+        self.clock = clock
+        self.history = BalanceHistory(initial_balance, **history_options)
+
+    def deposit(self, amount):
+        """
+        Deposit money into the account and record the new balance.
+
+        Args:
+            amount (float): Amount to deposit
+        """
+        super().deposit(amount)
+        if amount > 0:
+            self.history.record(self.clock(), self.account_balance)
+
+    def withdraw(self, amount):
+        """
+        Withdraw money if sufficient funds are available and record the new balance.
+
+        Args:
+            amount (float): Amount to withdraw
+
+        Returns:
+            bool: True if withdrawal successful, False if insufficient funds
+        """
+        if super().withdraw(amount):
+            self.history.record(self.clock(), self.account_balance)
+            return True
+        return False
+
+    def balance_at(self, timestamp):
+        """
+        Get the balance at a point in time.
+
+        Args:
+            timestamp (float): The time to query
+
+        Returns:
+            float: The balance at that time
+        """
+        return self.history.balance_at(timestamp)
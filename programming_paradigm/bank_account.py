@@ -4,6 +4,9 @@ class BankAccount:
     Implements basic banking operations with encapsulation.
     """
     
+    # No per-instance __dict__, which saves memory for millions of accounts
+    __slots__ = ("account_balance",)
+    
     def __init__(self, initial_balance=0):
         """
         Initialize a BankAccount with an optional initial balance.
@@ -45,8 +48,137 @@ class BankAccount:
         else:
             return False
     
+    def balance_message(self):
+        """
+        Format the current account balance in a user-friendly way.
+        
+        Returns:
+            str: The message printed by display_balance()
+        """
+        return f"Current Balance: ${self.account_balance:.2f}"
+    
     def display_balance(self):
         """
         Display the current account balance in a user-friendly format.
         """
-        print(f"Current Balance: ${self.account_balance:.2f}") 
\ No newline at end of file
+        print(self.balance_message())
+
+
+class FixedPointBankAccount(BankAccount):
+    """
+    A BankAccount that stores its balance as an integer number of cents.
+    
+    Integer arithmetic never accumulates rounding drift, so any sequence of
+    deposits and withdrawals gives the exact balance. deposit() and
+    withdraw() take dollars and round each amount to the nearest cent;
+    deposit_cents() and withdraw_cents() take whole cents and skip that
+    conversion.
+    """
+    
+    __slots__ = ("balance_cents",)
+    
+    def __init__(self, initial_balance=0):
+        """
+        Initialize a FixedPointBankAccount with an optional initial balance.
+        
+        Args:
+            initial_balance (float): Starting balance, defaults to 0
+        """
+        self.balance_cents = self.to_cents(initial_balance)
+    
+    @staticmethod
+    def to_cents(amount):
+        """
+        Convert a dollar amount to a whole number of cents.
+        
+        Args:
+            amount (float): Amount in dollars
+            
+        Returns:
+            int: The amount rounded to the nearest cent
+        """
+        return round(amount * 100)
+    
+    @property
+    def account_balance(self):
+        """float: The current balance in dollars."""
+        return self.balance_cents / 100
+    
+    @account_balance.setter
+    def account_balance(self, value):
+        self.balance_cents = self.to_cents(value)
+    
+    def deposit(self, amount):
+        """
+        Deposit money into the account.
+        
+        Args:
+            amount (float): Amount to deposit
+        """
+        cents = round(amount * 100)  # to_cents(), inlined
+        if cents > 0:
+            self.balance_cents += cents
+        else:
+            print("Deposit amount must be positive.")
+    
+    def withdraw(self, amount):
+        """
+        Withdraw money from the account if sufficient funds are available.
+        
+        Args:
+            amount (float): Amount to withdraw
+            
+        Returns:
+            bool: True if withdrawal successful, False if insufficient funds
+        """
+        cents = round(amount * 100)  # to_cents(), inlined
+        if cents <= 0:
+            print("Withdrawal amount must be positive.")
+            return False
+        
+        if self.balance_cents >= cents:
+            self.balance_cents -= cents
+            return True
+        else:
+            return False
+    
+    def deposit_cents(self, cents):
+        """
+        Deposit a whole number of cents.
+        
+        Args:
+            cents (int): Amount to deposit, in cents
+        """
+        if cents > 0:
+            self.balance_cents += cents
+        else:
+            print("Deposit amount must be positive.")
+    
+    def withdraw_cents(self, cents):
+        """
+        Withdraw a whole number of cents if sufficient funds are available.
+        
+        Args:
+            cents (int): Amount to withdraw, in cents
+            
+        Returns:
+            bool: True if withdrawal successful, False if insufficient funds
+        """
+        if cents <= 0:
+            print("Withdrawal amount must be positive.")
+            return False
+        if self.balance_cents >= cents:
+            self.balance_cents -= cents
+            return True
+        return False
+    
+    def balance_message(self):
+        """
+        Format the current account balance exactly, without a float round trip.
+        
+        Returns:
+            str: The message printed by display_balance()
+        """
+        sign = "-" if self.balance_cents < 0 else ""
+        dollars, cents = divmod(abs(self.balance_cents), 100)
+        return f"Current Balance: ${sign}{dollars}.{cents:02d}"
@@ -0,0 +1,88 @@
+# bank_commands.py
+
+import math
+
+COMMANDS = ("deposit", "withdraw", "display")
+
+
+def parse_command(text):
+    """
+    Parse a "<command>:<amount>" string, as accepted by main-0.py.
+
+    Args:
+        text (str): The command, e.g. "deposit:50" or "display"
+
+    Returns:
+        tuple: (command, amount), where amount is a float or None
+
+    Raises:
+        ValueError: If the amount is not a finite number
+    """
+    command, *params = text.strip().split(':')
+    amount = float(params[0]) if params else None
+    if amount is not None and not math.isfinite(amount):
+        raise ValueError(f"Amount must be a finite number: {params[0]}")
+    return command, amount
+
+
+def execute_command(account, command, amount):
+    """
+    Apply a parsed command to an account.
+
+    Args:
+        account (BankAccount): The account to operate on
+        command (str): "deposit", "withdraw" or "display"
+        amount (float): The amount, or None for display
+
+    Returns:
+        str: The message main-0.py would print for this command
+    """
+    if command == "deposit" and amount is not None:
+        if amount <= 0:
+            return "Deposit amount must be positive."
+        account.deposit(amount)
+        return f"Deposited: ${amount}"
+    elif command == "withdraw" and amount is not None:
+        if amount <= 0:
+            return "Withdrawal amount must be positive."
+        if account.withdraw(amount):
+            return f"Withdrew: ${amount}"
+        else:
+            return "Insufficient funds."
+    elif command == "display":
+        return account.balance_message()
+    else:
+        return "Invalid command."
+
+
+def split_account(line, default="default"):
+    """
+    Split an optional account name off a "[account ]command[:amount]" line.
+
+    Args:
+        line (str): The command line, e.g. "alice deposit:50"
+        default (str): Account name used when none is given
+
+    Returns:
+        tuple: (account name, command text)
+    """
+    name, _, command = line.strip().rpartition(" ")
+    return name.strip() or default, command
+
+
+def run_command(account, text):
+    """
+    Parse and apply one command string.
+
+    Args:
+        account (BankAccount): The account to operate on
+        text (str): The command, e.g. "withdraw:20"
+
+    Returns:
+        str: The response message
+    """
+    try:
+        command, amount = parse_command(text)
+    except ValueError:
+        return "Invalid command."
+    return execute_command(account, command, amount)
@@ -0,0 +1,294 @@
+# bank_journal.py
+
+import mmap
+import operator
+import os
+import struct
+from array import array
+
+from bank_account import FixedPointBankAccount
+
+# Each journal record is a 4-byte length prefix followed by a payload of
+# operation code, account id and amount in cents.
+PAYLOAD = struct.Struct("<BIq")
+RECORD = struct.Struct("<IBIq")
+OPEN = 0
+CHANGE = 1
+
+SNAPSHOT_MAGIC = b"BANKSNP1"
+SNAPSHOT_HEADER = struct.Struct("<8sQ")
+
+
+class JournaledBank:
+    """
+    Account balances kept in memory and protected by a write-ahead journal.
+
+    Every successful operation is appended to a binary journal. Records are
+    buffered and written with a single fsync every group_commit operations
+    (group commit), so an operation is durable once its group has been
+    committed or flush() returns. A snapshot of all balances is written
+    every snapshot_every operations, after which a new journal is started.
+    Reopening the directory recovers the balances from the latest snapshot
+    plus its journal.
+
+    Balances are stored as integer cents, like FixedPointBankAccount.
+    """
+
+    def __init__(self, directory, group_commit=64, snapshot_every=None):
+        """
+        Open (and recover if needed) the bank stored in directory.
+
+        Args:
+            directory (str): Directory for snapshot and journal files
+            group_commit (int): Operations per journal fsync, defaults to 64
+            snapshot_every (int): Operations between snapshots, defaults to never
+        """
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.group_commit = group_commit
+        self.snapshot_every = snapshot_every
+        self._buffer = bytearray()
+        self._buffered = 0
+        self._since_snapshot = 0
+        self._generation, self._balances = self._recover()
+        self._journal = open(self._journal_path(self._generation), "ab")
+
+    def _journal_path(self, generation):
+        """Path of the journal that follows snapshot number generation."""
+        return os.path.join(self.directory, f"journal-{generation:08d}.log")
+
+    def _snapshot_path(self, generation):
+        """Path of snapshot number generation."""
+        return os.path.join(self.directory, f"snapshot-{generation:08d}.snap")
+
+    def _recover(self):
+        """
+        Load the latest snapshot and replay its journal.
+
+        Returns:
+            tuple: (generation, array of balances in cents)
+        """
+        generations = [int(name[9:17]) for name in os.listdir(self.directory)
+                       if name.startswith("snapshot-") and name.endswith(".snap")]
+        generation = max(generations, default=0)
+
+        balances = array("q")
+        if generations:
+            with open(self._snapshot_path(generation), "rb") as fp:
+                magic, count = SNAPSHOT_HEADER.unpack(fp.read(SNAPSHOT_HEADER.size))
+                if magic != SNAPSHOT_MAGIC:
+                    raise ValueError(f"Not a bank snapshot: {fp.name}")
+                balances.fromfile(fp, count)
+
+        path = self._journal_path(generation)
+        if os.path.exists(path):
+            self._replay(path, balances)
+        return generation, balances
+
+    @staticmethod
+    def _replay(path, balances):
+        """
+        Apply every complete record of a journal to balances.
+
+        A partially written record at the end (from a crash mid-write) is
+        truncated away.
+
+        Args:
+            path (str): Path of the journal file
+            balances (array): Balances in cents, updated in place
+        """
+        size = os.path.getsize(path)
+        complete = size - size % RECORD.size
+        if complete:
+            with open(path, "rb") as fp:
+                with mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    with memoryview(mapped) as view:
+                        records = view[:complete]
+                        for length, op, account_id, cents in RECORD.iter_unpack(records):
+                            if length != PAYLOAD.size:
+                                raise ValueError(f"Corrupt journal record in {path}")
+                            if op == CHANGE:
+                                balances[account_id] += cents
+                            else:
+                                balances.append(cents)
+                        records.release()
+        if complete != size:
+            os.truncate(path, complete)
+
+    def _pack(self, op, account_id, cents):
+        """
+        Build a journal record, checking it before any balance changes.
+
+        Args:
+            op (int): OPEN or CHANGE
+            account_id (int): The account id
+            cents (int): Amount in cents
+
+        Returns:
+            bytes: The packed record
+
+        Raises:
+            TypeError: If account_id is not an integer
+            IndexError: If a CHANGE names an account that does not exist
+            ValueError: If the amount does not fit in a record
+        """
+        account_id = operator.index(account_id)
+        if op == CHANGE and not 0 <= account_id < len(self._balances):
+            raise IndexError("Account id out of range")
+        try:
+            return RECORD.pack(PAYLOAD.size, op, account_id, cents)
+        except struct.error as e:
+            raise ValueError(f"Amount out of range: {cents} cents") from e
+
+    def _log(self, record):
+        """Append a packed record to the journal buffer, committing full groups."""
+        self._buffer += record
+        self._buffered += 1
+        self._since_snapshot += 1
+        if self._buffered >= self.group_commit:
+            self.flush()
+        if self.snapshot_every and self._since_snapshot >= self.snapshot_every:
+            self.snapshot()
+
+    def flush(self):
+        """Write buffered journal records and fsync them to disk."""
+        if self._buffer:
+            self._journal.write(self._buffer)
+            self._journal.flush()
+            os.fsync(self._journal.fileno())
+            self._buffer.clear()
+            self._buffered = 0
+
+    def snapshot(self):
+        """
+        Write every balance to a new snapshot and start a new journal.
+
+        The snapshot is written to a temporary file and renamed into place.
+        The directory is fsynced before the previous generation is removed,
+        so the rename reaches the disk first and a crash at any point leaves
+        a recoverable directory.
+        """
+        self.flush()
+        old = self._generation
+        new = old + 1
+
+        path = self._snapshot_path(new)
+        with open(path + ".tmp", "wb") as fp:
+            fp.write(SNAPSHOT_HEADER.pack(SNAPSHOT_MAGIC, len(self._balances)))
+            self._balances.tofile(fp)
+            fp.flush()
+            os.fsync(fp.fileno())
+        os.replace(path + ".tmp", path)
+
+        self._journal.close()
+        self._journal = open(self._journal_path(new), "ab")
+        self._sync_directory()
+        self._generation = new
+        self._since_snapshot = 0
+        for stale in (self._snapshot_path(old), self._journal_path(old)):
+            if os.path.exists(stale):
+                os.remove(stale)
+
+    def _sync_directory(self):
+        """Fsync the directory so renamed and created entries are durable."""
+        if os.name != "posix":
+            return  # Directories cannot be opened for fsync on Windows
+        fd = os.open(self.directory, os.O_RDONLY)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+
+    def close(self):
+        """Commit buffered records and close the journal."""
+        self.flush()
+        self._journal.close()
+
+    def __enter__(self):
+        """Use the bank as a context manager that closes on exit."""
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Commit buffered records and close the journal."""
+        self.close()
+
+    def __len__(self):
+        """Number of accounts."""
+        return len(self._balances)
+
+    def open_account(self, initial_balance=0):
+        """
+        Open a new account.
+
+        Args:
+            initial_balance (float): Starting balance, defaults to 0
+
+        Returns:
+            int: The new account id
+        """
+        cents = FixedPointBankAccount.to_cents(initial_balance)
+        account_id = len(self._balances)
+        record = self._pack(OPEN, account_id, cents)
+        self._balances.append(cents)
+        self._log(record)
+        return account_id
+
+    def balance(self, account_id):
+        """
+        Get the balance of an account.
+
+        Args:
+            account_id (int): The account id
+
+        Returns:
+            float: The current balance in dollars
+        """
+        return self._balances[account_id] / 100
+
+    def deposit(self, account_id, amount):
+        """
+        Deposit money into an account.
+
+        Args:
+            account_id (int): The account id
+            amount (float): Amount to deposit
+
+        Returns:
+            bool: True if the deposit was applied, False if not positive
+
+        Raises:
+            IndexError: If the account does not exist
+            ValueError: If the amount is too large to journal
+        """
+        cents = FixedPointBankAccount.to_cents(amount)
+        if cents <= 0:
+            return False
+        record = self._pack(CHANGE, account_id, cents)
+        self._balances[account_id] += cents
+        self._log(record)
+        return True
+
+    def withdraw(self, account_id, amount):
+        """
+        Withdraw money from an account if sufficient funds are available.
+
+        Args:
+            account_id (int): The account id
+            amount (float): Amount to withdraw
+
+        Returns:
+            bool: True if withdrawal successful, False otherwise
+
+        Raises:
+            IndexError: If the account does not exist
+            ValueError: If the amount is too large to journal
+        """
+        cents = FixedPointBankAccount.to_cents(amount)
+        if cents <= 0:
+            return False
+        record = self._pack(CHANGE, account_id, -cents)
+        if self._balances[account_id] < cents:
+            return False
+        self._balances[account_id] -= cents
+        self._log(record)
+        return True
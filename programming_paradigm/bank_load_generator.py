@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Load generator for bank_server.py.
+
+Opens several connections, keeps a window of pipelined commands in flight
+on each, and reports throughput and p50/p99 latency.
+
+Usage: python bank_load_generator.py [--host HOST] [--port PORT | --unix PATH]
+           [--connections N] [--requests N] [--pipeline N]
+"""
+
+import argparse
+import asyncio
+import time
+from collections import deque
+
+COMMANDS = ("deposit:5", "withdraw:5", "display")
+
+
+async def run_connection(args, connection_id, latencies):
+    """
+    Send args.requests commands over one connection, recording latencies.
+
+    Args:
+        args (argparse.Namespace): Parsed command line options
+        connection_id (int): Used to give each connection its own account
+        latencies (list): Seconds per request, appended to in place
+    """
+    if args.unix:
+        reader, writer = await asyncio.open_unix_connection(args.unix)
+    else:
+        reader, writer = await asyncio.open_connection(args.host, args.port)
+
+    sent = deque()  # Send time of every command awaiting a response
+    remaining = args.requests
+    while remaining or sent:
+        window = min(args.pipeline - len(sent), remaining)
+        if window > 0:
+            lines = [f"load{connection_id} {COMMANDS[(remaining - i) % len(COMMANDS)]}\n"
+                     for i in range(window)]
+            now = time.perf_counter()
+            sent.extend([now] * window)
+            writer.write("".join(lines).encode("utf-8"))
+            remaining -= window
+
+        await reader.readline()
+        latencies.append(time.perf_counter() - sent.popleft())
+
+    writer.close()
+    await writer.wait_closed()
+
+
+def percentile(values, fraction):
+    """Return the value at a fraction (0-1) of a sorted list."""
+    return values[min(int(fraction * len(values)), len(values) - 1)]
+
+
+async def run(args):
+    """Run every connection concurrently and print a report."""
+    latencies = []
+    start = time.perf_counter()
+    await asyncio.gather(*(run_connection(args, i, latencies)
+                           for i in range(args.connections)))
+    elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    print(f"Requests:   {len(latencies):,} over {args.connections} connections "
+          f"(pipeline depth {args.pipeline})")
+    print(f"Throughput: {len(latencies) / elapsed:,.0f} requests/s")
+    print(f"Latency:    p50 {percentile(latencies, 0.50) * 1000:.3f} ms | "
+          f"p99 {percentile(latencies, 0.99) * 1000:.3f} ms")
+
+
+def main():
+    """Parse command line options and run the load test."""
+    parser = argparse.ArgumentParser(description="Load generator for bank_server.py")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--unix", help="connect to a Unix socket path instead of TCP")
+    parser.add_argument("--connections", type=int, default=8)
+    parser.add_argument("--requests", type=int, default=10_000, help="per connection")
+    parser.add_argument("--pipeline", type=int, default=32)
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
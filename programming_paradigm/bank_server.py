@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Long-running asyncio transaction server for BankAccount.
+
+Clients send newline-delimited commands using the main-0.py grammar,
+optionally prefixed by an account name:
+
+    deposit:50
+    alice withdraw:20
+    alice display
+
+Commands without an account name use the "default" account. Accounts are
+created on first use with the server's starting balance. Commands may be
+pipelined; every command that arrives in one read is answered with a
+single write, one response line per command, in order. A line longer than
+MAX_LINE_LENGTH bytes is answered with "Invalid command." and skipped.
+
+Usage: python bank_server.py [--host HOST] [--port PORT | --unix PATH]
+"""
+
+import argparse
+import asyncio
+
+from bank_account import BankAccount
+from bank_commands import run_command, split_account
+
+READ_SIZE = 64 * 1024
+MAX_LINE_LENGTH = 1024
+
+
+class BankServer:
+    """Serves bank commands to many concurrent connections."""
+
+    def __init__(self, starting_balance=100):
+        """
+        Initialize the server with no accounts.
+
+        Args:
+            starting_balance (float): Balance of newly created accounts,
+                defaults to 100 like main-0.py
+        """
+        self.starting_balance = starting_balance
+        self.accounts = {}
+
+    def handle_line(self, line):
+        """
+        Run one command line and return its response.
+
+        Args:
+            line (str): "[account ]command[:amount]"
+
+        Returns:
+            str: The response message
+        """
+        name, command = split_account(line)
+        account = self.accounts.get(name)
+        if account is None:
+            account = self.accounts[name] = BankAccount(self.starting_balance)
+        return run_command(account, command)
+
+    async def handle_connection(self, reader, writer):
+        """
+        Answer pipelined commands from one client until it disconnects.
+
+        Args:
+            reader (asyncio.StreamReader): The client's input stream
+            writer (asyncio.StreamWriter): The client's output stream
+        """
+        pending = b""  # Start of a line whose newline has not arrived yet
+        skipping = False  # Dropping the rest of an over-long line
+        try:
+            while True:
+                data = await reader.read(READ_SIZE)
+                if not data:
+                    break
+                *lines, pending = (pending + data).split(b"\n")
+                if skipping:
+                    if lines:
+                        del lines[0]  # The end of the over-long line
+                        skipping = False
+                    else:
+                        pending = b""
+                responses = ["Invalid command." if len(line) > MAX_LINE_LENGTH
+                             else self.handle_line(line.decode("utf-8", "replace"))
+                             for line in lines if line.strip()]
+                if len(pending) > MAX_LINE_LENGTH:
+                    responses.append("Invalid command.")
+                    pending, skipping = b"", True
+                if responses:
+                    writer.write(("\n".join(responses) + "\n").encode("utf-8"))
+                    await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    async def start(self, host="127.0.0.1", port=8765, unix_path=None):
+        """
+        Start listening for connections.
+
+        Args:
+            host (str): TCP host, defaults to 127.0.0.1
+            port (int): TCP port, defaults to 8765 (0 picks a free port)
+            unix_path (str): Listen on this Unix socket instead of TCP
+
+        Returns:
+            asyncio.Server: The running server
+        """
+        if unix_path:
+            return await asyncio.start_unix_server(self.handle_connection, unix_path)
+        return await asyncio.start_server(self.handle_connection, host, port)
+
+
+async def serve(args):
+    """Run the server until it is cancelled."""
+    server = await BankServer(args.starting_balance).start(args.host, args.port, args.unix)
+    address = args.unix or "{}:{}".format(*server.sockets[0].getsockname()[:2])
+    print(f"Bank server listening on {address}")
+    async with server:
+        await server.serve_forever()
+
+
+def main():
+    """Parse command line options and run the server."""
+    parser = argparse.ArgumentParser(description="Bank transaction server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--unix", help="listen on a Unix socket path instead of TCP")
+    parser.add_argument("--starting-balance", type=float, default=100)
+    try:
+        asyncio.run(serve(parser.parse_args()))
+    except KeyboardInterrupt:
+        print("Server stopped.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,465 @@
+#!/usr/bin/env python3
+"""
+Benchmark script for the programming_paradigm modules.
+
+Usage: python benchmarks.py [name ...] [size ...]
+Runs the named benchmarks (all by default, see BENCHMARKS) once per size
+(defaults to 10k, 1M and 5M).
+"""
+
+import io
+import os
+import pickle
+import random
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+from decimal import Decimal
+
+from account_store import AccountStore
+from bank_account import BankAccount, FixedPointBankAccount
+from bank_journal import JournaledBank
+from ledger import DEPOSIT, WITHDRAW, Ledger, numpy
+from library_management import Book, Library
+from library_snapshot import LibrarySnapshot, save_snapshot
+from sharded_library import ShardedLibrary
+
+DEFAULT_SIZES = [10_000, 1_000_000, 5_000_000]
+LOOKUPS = 1_000
+SEARCHES = 100
+THREADS = 8
+
+
+class DictBankAccount:
+    """BankAccount's layout before __slots__, kept as a memory baseline."""
+
+    def __init__(self, initial_balance=0):
+        self.account_balance = initial_balance
+
+
+class DictBook:
+    """library_management.Book's layout before __slots__, kept as a baseline."""
+
+    def __init__(self, title, author):
+        self.title = title
+        self.author = author
+        self._is_checked_out = False
+        self._library = None
+
+
+class RoundedBankAccount(BankAccount):
+    """A float BankAccount rounded to cents after every change, the usual workaround."""
+
+    __slots__ = ()
+
+    def deposit(self, amount):
+        super().deposit(amount)
+        self.account_balance = round(self.account_balance, 2)
+
+    def withdraw(self, amount):
+        succeeded = super().withdraw(amount)
+        self.account_balance = round(self.account_balance, 2)
+        return succeeded
+
+
+def timed(func, *args):
+    """Return the wall-clock seconds taken by func(*args)."""
+    start = time.perf_counter()
+    func(*args)
+    return time.perf_counter() - start
+
+
+def build_library(size):
+    """Build a Library holding size books with distinct titles."""
+    library = Library()
+    for i in range(size):
+        library.add_book(Book(f"Title {i}", f"Author {i % 1000}"))
+    return library
+
+
+def benchmark_title_lookup(size):
+    """Compare a linear title scan with the indexed check-out path."""
+    library = build_library(size)
+    books = library.get_all_books()
+    # Look up titles spread across the whole catalog
+    titles = [f"Title {i}" for i in range(0, size, max(size // LOOKUPS, 1))]
+
+    def scan_checkout():
+        for title in titles:
+            for book in books:
+                if book.title == title and book.is_available():
+                    book.check_out()
+                    break
+        for book in books:
+            book.return_book()
+
+    def indexed_checkout():
+        for title in titles:
+            library.check_out_book(title)
+        for title in titles:
+            library.return_book(title)
+
+    scan = timed(scan_checkout)
+    indexed = timed(indexed_checkout)
+    print(f"{size:>10,} books | scan: {scan:.4f}s | "
+          f"indexed: {indexed:.4f}s | {len(titles)} lookups")
+
+
+def benchmark_available_listing(size):
+    """Compare a full scan plus one print per book with the streamed writer."""
+    library = build_library(size)
+    for i in range(0, size, 2):
+        library.check_out_book(f"Title {i}")
+    books = library.get_all_books()
+
+    def scan_listing():
+        output = io.StringIO()
+        available_books = [book for book in books if book.is_available()]
+        for book in available_books:
+            print(book, file=output)
+
+    def streamed_listing():
+        library.write_available_books(io.StringIO())
+
+    scan = timed(scan_listing)
+    streamed = timed(streamed_listing)
+    print(f"{size:>10,} books | scan + print: {scan:.4f}s | "
+          f"streamed: {streamed:.4f}s")
+
+
+def synthetic_words(count, rng):
+    """Generate count distinct pronounceable words."""
+    syllables = ["ka", "lo", "mi", "ne", "ru", "sa", "ti", "vo", "ze", "dra"]
+    words = set()
+    while len(words) < count:
+        words.add("".join(rng.choice(syllables) for _ in range(rng.randint(2, 4))))
+    return sorted(words)
+
+
+def benchmark_search(size):
+    """Compare a naive substring scan with the inverted-index search."""
+    rng = random.Random(42)
+    words = synthetic_words(5_000, rng)
+    authors = [f"{rng.choice(words)} {rng.choice(words)}" for _ in range(1_000)]
+    library = Library()
+    for _ in range(size):
+        title = " ".join(rng.sample(words, 3))
+        library.add_book(Book(title, rng.choice(authors)))
+    books = library.get_all_books()
+    queries = [f"{rng.choice(words)} {rng.choice(words)[:3]}" for _ in range(SEARCHES)]
+
+    def scan_search():
+        for query in queries:
+            terms = query.lower().split()
+            [book for book in books
+             if all(term in f"{book.title} {book.author}".lower() for term in terms)][:10]
+
+    def indexed_search():
+        for query in queries:
+            library.search(query, 10)
+
+    scan = timed(scan_search)
+    indexed = timed(indexed_search)
+    print(f"{size:>10,} books | substring scan: {scan:.4f}s | "
+          f"index: {indexed:.4f}s | {SEARCHES} queries")
+
+
+def benchmark_concurrent_checkout(size):
+    """Compare check-out throughput with one global lock and striped locks."""
+    operations = min(size, 200_000)
+    titles = [f"Title {i}" for i in range(operations)]
+
+    for label, stripes in (("global lock", 1), ("striped locks", 64)):
+        library = Library(lock_stripes=stripes)
+        library.add_books(Book(title, "Author") for title in titles)
+
+        def worker(offset):
+            for title in titles[offset::THREADS]:
+                library.check_out_book(title)
+                library.return_book(title)
+
+        threads = [threading.Thread(target=worker, args=(i,)) for i in range(THREADS)]
+        start = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed = time.perf_counter() - start
+        print(f"{operations:>10,} titles | {label:<13} | "
+              f"{2 * operations / elapsed:,.0f} ops/s with {THREADS} threads")
+
+
+def benchmark_snapshot_load(size):
+    """Compare loading a pickled book list with opening a binary snapshot."""
+    books = [Book(f"Title {i}", f"Author {i % 1000}") for i in range(size)]
+    with tempfile.TemporaryDirectory() as tmpdir:
+        pickle_path = os.path.join(tmpdir, "books.pickle")
+        snapshot_path = os.path.join(tmpdir, "books.snap")
+        with open(pickle_path, "wb") as fp:
+            pickle.dump(books, fp, protocol=pickle.HIGHEST_PROTOCOL)
+        save_snapshot(books, snapshot_path)
+        del books
+
+        def load_pickle():
+            with open(pickle_path, "rb") as fp:
+                pickle.load(fp)
+
+        def open_snapshot():
+            with LibrarySnapshot(snapshot_path) as snapshot:
+                snapshot.find_book(f"Title {size // 2}")
+
+        def materialize_snapshot():
+            with LibrarySnapshot(snapshot_path) as snapshot:
+                for _ in snapshot:
+                    pass
+
+        unpickle = timed(load_pickle)
+        opened = timed(open_snapshot)
+        materialized = timed(materialize_snapshot)
+        print(f"{size:>10,} books | pickle.load: {unpickle:.4f}s | "
+              f"snapshot open + lookup: {opened:.4f}s | "
+              f"snapshot full scan: {materialized:.4f}s | "
+              f"{os.path.getsize(pickle_path):,} vs "
+              f"{os.path.getsize(snapshot_path):,} bytes")
+
+
+def benchmark_ledger(size):
+    """Compare per-object BankAccount calls with one Ledger batch."""
+    rng = random.Random(42)
+    account_count = max(size // 10, 1)
+    account_ids = [rng.randrange(account_count) for _ in range(size)]
+    kinds = [rng.choice((DEPOSIT, WITHDRAW)) for _ in range(size)]
+    amounts = [rng.randint(1, 200) for _ in range(size)]
+    if numpy is not None:
+        # The same batch already held in arrays, as a settlement feed would be
+        columns = (numpy.array(account_ids), numpy.array(kinds), numpy.array(amounts, dtype=float))
+
+    # A low starting balance makes many withdrawals overdraw
+    for opening in (100, 10_000):
+        accounts = [BankAccount(opening) for _ in range(account_count)]
+        ledger = Ledger.from_accounts(accounts)
+        array_ledger = Ledger.from_accounts(accounts)
+
+        def object_loop():
+            for account_id, kind, amount in zip(account_ids, kinds, amounts):
+                if kind == DEPOSIT:
+                    accounts[account_id].deposit(amount)
+                else:
+                    accounts[account_id].withdraw(amount)
+
+        loop = timed(object_loop)
+        batch = timed(ledger.apply, account_ids, kinds, amounts)
+        assert list(ledger.balances()) == [account.account_balance for account in accounts]
+        line = (f"{size:>10,} operations | opening ${opening:<6,} | BankAccount loop: {loop:.4f}s | "
+                f"Ledger.apply: {batch:.4f}s")
+        if numpy is not None:
+            arrays = timed(array_ledger.apply, *columns)
+            assert array_ledger.balances() == ledger.balances()
+            line += f" | from arrays: {arrays:.4f}s"
+        print(line)
+
+
+def benchmark_fixed_point(size):
+    """Run the same account operations on float, Decimal and integer-cent balances."""
+    rng = random.Random(42)
+    cents = [rng.randint(1, 20_000) for _ in range(size)]
+    withdrawals = [rng.random() < 0.5 for _ in range(size)]
+    dollars = [c / 100 for c in cents]
+    decimals = [Decimal(c).scaleb(-2) for c in cents]
+
+    def replay(account, amounts, cents=False):
+        if cents:
+            deposit, withdraw = account.deposit_cents, account.withdraw_cents
+        else:
+            deposit, withdraw = account.deposit, account.withdraw
+        for amount, is_withdrawal in zip(amounts, withdrawals):
+            if is_withdrawal:
+                withdraw(amount)
+            else:
+                deposit(amount)
+        return account
+
+    cases = [
+        ("float", BankAccount(), dollars),
+        ("float + round", RoundedBankAccount(), dollars),
+        ("Decimal", BankAccount(Decimal(0)), decimals),
+        ("FixedPoint", FixedPointBankAccount(), dollars),
+        ("FixedPoint cents", FixedPointBankAccount(), cents),
+    ]
+    results = []
+    for label, account, amounts in cases:
+        elapsed = timed(replay, account, amounts, label.endswith("cents"))
+        results.append(f"{label}: {elapsed:.4f}s")
+    exact = cases[2][1].account_balance
+    for _, account, _ in cases[3:]:
+        assert account.balance_message() == f"Current Balance: ${exact:.2f}"
+    drift = abs(Decimal(cases[0][1].account_balance) - exact)
+    print(f"{size:>10,} operations | {' | '.join(results)} | float drift: ${drift:.2E}")
+
+
+def benchmark_journal(size):
+    """Measure journaled operations per second and recovery time."""
+    operations = min(size, 1_000_000)
+    for group_commit in (1, 16, 256, 4096):
+        count = operations if group_commit > 1 else min(operations, 10_000)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with JournaledBank(tmpdir, group_commit=group_commit) as bank:
+                account = bank.open_account(0)
+                start = time.perf_counter()
+                for _ in range(count):
+                    bank.deposit(account, 1)
+                elapsed = time.perf_counter() - start
+        print(f"{count:>10,} deposits | group commit {group_commit:>5} | "
+              f"{count / elapsed:,.0f} ops/s")
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        with JournaledBank(tmpdir, group_commit=65_536) as bank:
+            accounts = [bank.open_account(0) for _ in range(1_000)]
+            for i in range(size):
+                bank.deposit(accounts[i % 1_000], 1)
+        recovery = timed(lambda: JournaledBank(tmpdir).close())
+    print(f"{size:>10,} entries  | recovery: {recovery:.4f}s")
+
+
+def benchmark_account_store(size):
+    """Measure transfer throughput as the thread pool grows."""
+    rng = random.Random(42)
+    transfers = [(rng.randrange(1_000), rng.randrange(1_000), rng.randint(1, 50))
+                 for _ in range(min(size, 1_000_000))]
+
+    for workers in (1, 2, 4, THREADS):
+        store = AccountStore()
+        for account in range(1_000):
+            store.open_account(account, 1_000)
+
+        def worker(offset):
+            for source, target, amount in transfers[offset::workers]:
+                store.transfer(source, target, amount)
+
+        with ThreadPoolExecutor(workers) as pool:
+            start = time.perf_counter()
+            list(pool.map(worker, range(workers)))
+            elapsed = time.perf_counter() - start
+        assert store.total_balance() == 1_000_000
+        print(f"{len(transfers):>10,} transfers | {workers} threads | "
+              f"{len(transfers) / elapsed:,.0f} transfers/s")
+
+
+def benchmark_sharding(size):
+    """Measure batched check-outs and searches as shard processes are added."""
+    rng = random.Random(42)
+    words = synthetic_words(5_000, rng)
+    books = min(size, 1_000_000)
+    titles = [f"{' '.join(rng.sample(words, 3))} {i}" for i in range(books)]
+    queries = [f"{rng.choice(words)} {rng.choice(words)[:3]}" for _ in range(SEARCHES)]
+    batch = 10_000
+
+    for shards in sorted({1, 2, 4, os.cpu_count() or 1}):
+        with ShardedLibrary(shards) as library:
+            library.add_books(Book(title, "Author") for title in titles)
+            library.search("warmup")
+
+            def check_out_and_return():
+                for start in range(0, books, batch):
+                    library.check_out_books(titles[start:start + batch])
+                    library.return_books(titles[start:start + batch])
+
+            def search():
+                for query in queries:
+                    library.search(query, 10)
+
+            checkouts = 2 * books / timed(check_out_and_return)
+            searches = SEARCHES / timed(search)
+        print(f"{books:>10,} books | {shards} shards | {checkouts:,.0f} ops/s | "
+              f"{searches:,.0f} searches/s ({os.cpu_count()} CPUs)")
+
+
+def traced_memory(func, *args):
+    """
+    Run func(*args) with tracemalloc on.
+
+    Returns:
+        tuple: (result, bytes still allocated, peak bytes), counted from the call
+    """
+    tracemalloc.start()
+    try:
+        result = func(*args)
+        allocated, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return result, allocated, peak
+
+
+def bytes_per_object(factory, count):
+    """Measure the traced memory allocated per object built by factory()."""
+    objects, allocated, _ = traced_memory(lambda: [factory() for _ in range(count)])
+    return (allocated - sys.getsizeof(objects)) / count
+
+
+def compare_layouts(cases, count):
+    """
+    Print memory per object and attribute read speed, before and after a change.
+
+    Args:
+        cases (list): (name, before factory, after factory, read function) tuples
+        count (int): Objects built per factory
+    """
+    width = max(len(name) for name, *_ in cases)
+    for name, before, after, read in cases:
+        sizes = [bytes_per_object(factory, count) for factory in (before, after)]
+        reads = []
+        for factory in (before, after):
+            objects = [factory() for _ in range(count)]
+            reads.append(count / timed(lambda: [read(obj) for obj in objects]))
+        print(f"{count:>10,} {name:<{width}} | bytes/object: {sizes[0]:.0f} -> {sizes[1]:.0f} | "
+              f"reads/s: {reads[0]:,.0f} -> {reads[1]:,.0f}")
+
+
+def benchmark_slots(size):
+    """Compare memory and attribute reads of dict-based and slotted objects."""
+    count = min(size, 1_000_000)
+    cases = [
+        ("BankAccount", lambda: DictBankAccount(100), lambda: BankAccount(100),
+         lambda account: account.account_balance),
+        ("Book", lambda: DictBook("Title", "Author"), lambda: Book("Title", "Author"),
+         lambda book: (book.title, book.author, book._is_checked_out)),
+    ]
+    compare_layouts(cases, count)
+
+
+# name, heading, benchmark function
+BENCHMARKS = [
+    ("lookup", "TITLE LOOKUP: SCAN VS INDEX", benchmark_title_lookup),
+    ("listing", "AVAILABLE LISTING: SCAN VS STREAM", benchmark_available_listing),
+    ("search", "FULL-TEXT SEARCH: SUBSTRING SCAN VS INDEX", benchmark_search),
+    ("locks", "CONCURRENT CHECK-OUT: GLOBAL VS STRIPED LOCKS", benchmark_concurrent_checkout),
+    ("snapshot", "STARTUP: PICKLE VS BINARY SNAPSHOT", benchmark_snapshot_load),
+    ("ledger", "SETTLEMENT: BANKACCOUNT LOOP VS LEDGER BATCH", benchmark_ledger),
+    ("fixedpoint", "BALANCE REPLAY: FLOAT VS DECIMAL VS INTEGER CENTS", benchmark_fixed_point),
+    ("journal", "WRITE-AHEAD JOURNAL: GROUP COMMIT AND RECOVERY", benchmark_journal),
+    ("transfers", "ACCOUNT STORE: TRANSFERS BY THREAD COUNT", benchmark_account_store),
+    ("slots", "MEMORY: __dict__ VS __slots__", benchmark_slots),
+    ("sharding", "SHARDED LIBRARY: THROUGHPUT BY PROCESS COUNT", benchmark_sharding),
+]
+
+
+def main():
+    """Run the selected benchmarks (all by default) for each size."""
+    names = [arg for arg in sys.argv[1:] if not arg.isdigit()]
+    sizes = [int(arg) for arg in sys.argv[1:] if arg.isdigit()] or DEFAULT_SIZES
+
+    for name, heading, benchmark in BENCHMARKS:
+        if names and name not in names:
+            continue
+        print("=" * 50)
+        print(heading)
+        print("=" * 50)
+        for size in sizes:
+            benchmark(size)
+
+
+if __name__ == "__main__":
+    main()
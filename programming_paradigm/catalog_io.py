@@ -0,0 +1,144 @@
+# catalog_io.py
+
+import csv
+import io
+import json
+from itertools import islice
+
+from library_management import Book
+
+FIELDS = ["title", "author", "available"]
+FORMATS = ("csv", "jsonl")
+
+
+def read_records(fp, fmt="csv"):
+    """
+    Lazily read catalog records from a CSV or JSON Lines file.
+
+    Args:
+        fp: A text file object opened for reading
+        fmt (str): "csv" (with a header row) or "jsonl"
+
+    Returns:
+        iterator: One dict per record
+
+    Raises:
+        ValueError: If the format is not supported
+    """
+    if fmt == "csv":
+        return csv.DictReader(fp)
+    if fmt == "jsonl":
+        return (json.loads(line) for line in fp if line.strip())
+    raise ValueError(f"Unsupported catalog format: {fmt}")
+
+
+def _is_available(value):
+    """Interpret an "available" field, treating a missing or blank value as True."""
+    if value is None:
+        return True
+    if isinstance(value, str):
+        return value.strip().lower() not in ("0", "false", "no")
+    return bool(value)
+
+
+def iter_book_batches(fp, fmt="csv", batch_size=1000):
+    """
+    Stream Book instances from a catalog file in fixed-size batches.
+
+    Only one batch is held in memory at a time.
+
+    Args:
+        fp: A text file object opened for reading
+        fmt (str): "csv" or "jsonl"
+        batch_size (int): Number of books per batch, defaults to 1000
+
+    Yields:
+        list: A batch of new Book instances
+
+    Raises:
+        ValueError: If batch_size is not positive or a record has no title
+            or author
+    """
+    if batch_size <= 0:
+        raise ValueError("batch_size must be positive")
+    records = read_records(fp, fmt)
+    while True:
+        batch = []
+        for record in islice(records, batch_size):
+            title = record.get("title")
+            author = record.get("author")
+            if title is None or author is None:
+                raise ValueError(f"Catalog record is missing a title or author: {record}")
+            book = Book(title, author)
+            if not _is_available(record.get("available")):
+                book.check_out()
+            batch.append(book)
+        if not batch:
+            return
+        yield batch
+
+
+def import_books(fp, library, fmt="csv", batch_size=1000):
+    """
+    Load a catalog file into a library, one batch at a time.
+
+    Args:
+        fp: A text file object opened for reading
+        library (Library): The library to populate
+        fmt (str): "csv" or "jsonl"
+        batch_size (int): Number of books per batch, defaults to 1000
+
+    Returns:
+        int: The number of books imported
+    """
+    count = 0
+    for batch in iter_book_batches(fp, fmt, batch_size):
+        count += library.add_books(batch)
+    return count
+
+
+def export_books(books, fp, fmt="csv", batch_size=1000):
+    """
+    Write books to a catalog file, one buffered write per batch.
+
+    Args:
+        books (iterable): Book instances to export
+        fp: A text file object opened for writing
+        fmt (str): "csv" (a header row is written first) or "jsonl"
+        batch_size (int): Number of books per write, defaults to 1000
+
+    Returns:
+        int: The number of books exported
+
+    Raises:
+        ValueError: If the format is not supported or batch_size is not positive
+    """
+    if fmt not in FORMATS:
+        raise ValueError(f"Unsupported catalog format: {fmt}")
+    if batch_size <= 0:
+        raise ValueError("batch_size must be positive")
+
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    if fmt == "csv":
+        writer.writerow(FIELDS)
+
+    count = 0
+    books = iter(books)
+    while True:
+        batch = list(islice(books, batch_size))
+        if fmt == "csv":
+            writer.writerows([book.title, book.author, int(book.is_available())]
+                             for book in batch)
+        else:
+            buffer.writelines(json.dumps({"title": book.title,
+                                          "author": book.author,
+                                          "available": book.is_available()}) + "\n"
+                              for book in batch)
+        fp.write(buffer.getvalue())
+        buffer.seek(0)
+        buffer.truncate()
+        count += len(batch)
+        # The last, empty batch still flushes the CSV header of an empty export
+        if not batch:
+            return count
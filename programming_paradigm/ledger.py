@@ -0,0 +1,264 @@
+# ledger.py
+
+import operator
+from array import array
+
+from bank_account import BankAccount
+
+try:
+    import numpy
+except ImportError:  # apply() falls back to a loop over the operations
+    numpy = None
+
+DEPOSIT = 0
+WITHDRAW = 1
+
+# Running balances this close to zero, relative to the amounts summed to
+# reach them, are checked on the exact balance rather than trusted to cumsum
+ROUNDING_TOLERANCE = 1e-9
+
+# Vectorized overdraft rounds in apply() before the rest is replayed in order
+MAX_ROUNDS = 32
+
+
+class Ledger:
+    """
+    Balances for many accounts stored in one contiguous array of doubles.
+
+    Accounts are identified by their index in the ledger. Batches of
+    deposits and withdrawals are applied in a single call with the same
+    rules as BankAccount: non-positive amounts are rejected, and a
+    withdrawal that would overdraw the account fails. Operations run in
+    order, so a deposit early in a batch can fund a later withdrawal.
+
+    When NumPy is installed, apply() is vectorized: running balances come
+    from cumulative sums per account, and only withdrawals that may
+    overdraw are checked one round at a time. Otherwise every operation is
+    applied in a Python loop.
+    """
+
+    def __init__(self, balances=()):
+        """
+        Initialize a Ledger with optional starting balances.
+
+        Args:
+            balances (iterable): Starting balance of each account
+        """
+        self._balances = array("d", balances)
+
+    @classmethod
+    def from_accounts(cls, accounts):
+        """
+        Create a Ledger holding the current balances of BankAccount objects.
+
+        Args:
+            accounts (iterable): BankAccount instances, in account-id order
+
+        Returns:
+            Ledger: A new ledger
+        """
+        return cls(account.account_balance for account in accounts)
+
+    def __len__(self):
+        """Number of accounts in the ledger."""
+        return len(self._balances)
+
+    def open_account(self, initial_balance=0):
+        """
+        Add an account to the ledger.
+
+        Args:
+            initial_balance (float): Starting balance, defaults to 0
+
+        Returns:
+            int: The new account id
+        """
+        self._balances.append(initial_balance)
+        return len(self._balances) - 1
+
+    def balance(self, account_id):
+        """
+        Get the balance of one account.
+
+        Args:
+            account_id (int): The account id
+
+        Returns:
+            float: The current balance
+        """
+        return self._balances[account_id]
+
+    def balances(self):
+        """
+        Get a copy of every balance.
+
+        Returns:
+            array: The balances, indexed by account id
+        """
+        return array("d", self._balances)
+
+    def to_account(self, account_id):
+        """
+        Create a BankAccount holding one account's current balance.
+
+        Args:
+            account_id (int): The account id
+
+        Returns:
+            BankAccount: A new, independent account object
+        """
+        return BankAccount(self._balances[account_id])
+
+    def apply(self, account_ids, kinds, amounts):
+        """
+        Apply a batch of deposits and withdrawals in order.
+
+        Args:
+            account_ids (sequence): Account id of each operation
+            kinds (sequence): DEPOSIT or WITHDRAW for each operation
+            amounts (sequence): Amount of each operation
+
+        Returns:
+            bytearray: 1 where the operation succeeded, 0 where it was rejected
+
+        Raises:
+            ValueError: If the sequences differ in length or a kind is unknown
+            IndexError: If an account id is out of range
+            TypeError: If an account id is not an integer
+
+            The whole batch is checked first, so no operation is applied
+            when any of these is raised.
+        """
+        if not len(account_ids) == len(kinds) == len(amounts):
+            raise ValueError("account_ids, kinds and amounts must have the same length")
+        if not len(amounts):
+            return bytearray()
+        if numpy is not None:
+            return self._apply_numpy(account_ids, kinds, amounts)
+
+        if not set(kinds) <= {DEPOSIT, WITHDRAW}:
+            raise ValueError("Operation kinds must be DEPOSIT or WITHDRAW")
+        account_ids = [operator.index(account_id) for account_id in account_ids]
+        if not 0 <= min(account_ids) <= max(account_ids) < len(self._balances):
+            raise IndexError("Account id out of range")
+        return self._apply_in_order(account_ids, kinds, amounts)
+
+    def _apply_in_order(self, account_ids, kinds, amounts, results=None, positions=None):
+        """
+        Apply already validated operations one at a time.
+
+        Args:
+            account_ids (sequence): Account id of each operation
+            kinds (sequence): DEPOSIT or WITHDRAW for each operation
+            amounts (sequence): Amount of each operation
+            results (bytearray): Success mask to fill in, defaults to a new one
+            positions (sequence): Index in results of each operation,
+                defaults to 0, 1, 2, ...
+
+        Returns:
+            bytearray: The success mask
+        """
+        balances = self._balances
+        if results is None:
+            results = bytearray(len(amounts))
+        if positions is None:
+            positions = range(len(amounts))
+        for i, account_id, kind, amount in zip(positions, account_ids, kinds, amounts):
+            if not amount > 0:
+                continue
+            if kind == DEPOSIT:
+                balances[account_id] += amount
+            elif balances[account_id] >= amount:
+                balances[account_id] -= amount
+            else:
+                continue
+            results[i] = 1
+        return results
+
+    def _apply_numpy(self, account_ids, kinds, amounts):
+        """
+        Apply a batch with whole-array operations.
+
+        Accounts whose balance covers all their withdrawals accept every
+        valid operation. The others' operations are grouped by account,
+        keeping their order, and each account's running balance is a
+        cumulative sum of signed amounts. Every operation before an account's first possible overdraft is
+        applied with numpy.add.at, which adds in operation order exactly
+        like the loop. That withdrawal is then decided on the exact balance,
+        and the account's later operations go to the next round. Accounts
+        still unsettled after MAX_ROUNDS rounds are replayed in order.
+        """
+        ids = numpy.asarray(account_ids)
+        kinds = numpy.asarray(kinds)
+        amounts = numpy.asarray(amounts, dtype=numpy.float64)
+        if ids.dtype.kind not in "iu":
+            raise TypeError("Account ids must be integers")
+        if not ((kinds == DEPOSIT) | (kinds == WITHDRAW)).all():
+            raise ValueError("Operation kinds must be DEPOSIT or WITHDRAW")
+        if ids.min() < 0 or ids.max() >= len(self._balances):
+            raise IndexError("Account id out of range")
+
+        balances = numpy.frombuffer(self._balances, dtype=numpy.float64)
+        valid = amounts > 0
+        withdraw = valid & (kinds == WITHDRAW)
+        signed = numpy.where(withdraw, -amounts, numpy.where(valid, amounts, 0.0))
+        results = numpy.zeros(len(amounts), dtype=numpy.uint8)
+        # Bound on cumsum's rounding error, for every round
+        margin = ROUNDING_TOLERANCE * (numpy.abs(signed).sum() + numpy.abs(balances).max())
+
+        # Accounts that can cover all their withdrawals in any order need no
+        # running balance
+        outflow = numpy.bincount(ids, numpy.where(withdraw, amounts, 0.0), len(balances))
+        safe = (balances - outflow >= margin)[ids]
+        done = numpy.flatnonzero(safe)
+        numpy.add.at(balances, ids[done], signed[done])
+        results[done] = valid[done]
+
+        # Unsettled operations, by account and then in batch order
+        order = numpy.flatnonzero(~safe)
+        if len(balances) * len(ids) < 2 ** 63:
+            # Unique keys need no stable sort, which is much slower
+            order = order[numpy.argsort(ids[order].astype(numpy.int64) * len(ids) + order)]
+        else:
+            order = order[numpy.argsort(ids[order], kind="stable")]
+        for _ in range(MAX_ROUNDS):
+            if not len(order):
+                break
+            accounts = ids[order]
+            steps = signed[order]
+            is_start = numpy.empty(len(order), dtype=bool)
+            is_start[0] = True
+            numpy.not_equal(accounts[1:], accounts[:-1], out=is_start[1:])
+            starts = numpy.flatnonzero(is_start)
+            lengths = numpy.diff(starts, append=len(order))
+
+            # Running balance of each account after each of its operations
+            totals = numpy.cumsum(steps)
+            running = balances[accounts] + (totals - numpy.repeat((totals - steps)[starts], lengths))
+            risky = numpy.flatnonzero((running < margin) & withdraw[order])
+
+            # Stop each account at its first withdrawal that may overdraw
+            groups = numpy.searchsorted(starts, risky, side="right") - 1
+            is_first = numpy.r_[True, groups[1:] != groups[:-1]] if len(risky) else []
+            first = risky[is_first]
+            stops = starts + lengths
+            stops[groups[is_first]] = first
+            settled = numpy.arange(len(order)) < numpy.repeat(stops, lengths)
+
+            done = order[settled]
+            numpy.add.at(balances, ids[done], signed[done])
+            results[done] = valid[done]
+
+            # Accounts are distinct here, so each is updated once
+            decided = order[first]
+            accepted = decided[balances[ids[decided]] >= amounts[decided]]
+            balances[ids[accepted]] -= amounts[accepted]
+            results[accepted] = 1
+
+            settled[first] = True
+            order = order[~settled]
+
+        if len(order):
+            self._apply_in_order(ids[order].tolist(), kinds[order].tolist(),
+                                 amounts[order].tolist(), results, order.tolist())
+        return bytearray(results.tobytes())
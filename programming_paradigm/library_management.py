@@ -1,8 +1,18 @@
 # library_management.py
 
+import sys
+import threading
+from heapq import heappop, heappush
+from itertools import count, islice
+
+from search_index import SearchIndex
+
 class Book:
     """A class representing a book in the library."""
     
+    # No per-instance __dict__, which saves memory for large catalogs
+    __slots__ = ("title", "author", "_is_checked_out", "_library")
+    
     def __init__(self, title, author):
         """
         Initialize a Book instance.
@@ -14,14 +24,19 @@ class Book:
         self.title = title
         self.author = author
         self._is_checked_out = False  # Private attribute to track availability
+        self._library = None  # Library that owns this book, if any
     
     def check_out(self):
         """Mark the book as checked out."""
         self._is_checked_out = True
+        if self._library is not None:
+            self._library._set_available(self, False)
     
     def return_book(self):
         """Mark the book as returned (available)."""
         self._is_checked_out = False
+        if self._library is not None:
+            self._library._set_available(self, True)
     
     def is_available(self):
         """
@@ -43,11 +58,48 @@ class Book:
 
 
 class Library:
-    """A class representing a library that manages a collection of books."""
+    """
+    A class representing a library that manages a collection of books.
+    
+    check_out_book() and return_book() are safe to call from several
+    threads. Each title is guarded by one of lock_stripes locks chosen by
+    the title's hash, so threads working on unrelated titles rarely contend.
+    The set of available books, shared by every title, has its own lock;
+    listings copy it under that lock, so they can run during check-outs.
+    
+    Patrons can reserve a title that has no available copy. Each title keeps
+    a heap of reservations ordered by priority and then by request time, and
+    return_book() hands the copy straight to the first one.
+    """
+    
+    def __init__(self, lock_stripes=64):
+        """
+        Initialize a Library instance with an empty collection of books.
+        
+        Args:
+            lock_stripes (int): Number of per-title locks, defaults to 64
+        """
+        self._books = {}  # Private insertion-ordered set of Book instances
+        self._titles = {}  # Title index: title -> list of copies
+        self._available = {}  # Insertion-ordered set of available books
+        self._available_lock = threading.Lock()  # Guards _available
+        self._search_index = SearchIndex()  # Full-text index over titles and authors
+        self._locks = [threading.Lock() for _ in range(lock_stripes)]
+        self._waitlists = {}  # title -> heap of [-priority, seq, patron, callback]
+        self._reservations = {}  # (title, patron) -> waitlist entry
+        self._reservation_seq = count()
     
-    def __init__(self):
-        """Initialize a Library instance with an empty collection of books."""
-        self._books = []  # Private list to store Book instances
+    def _lock_for(self, title):
+        """
+        Get the lock guarding the copies of a title.
+        
+        Args:
+            title (str): The book title
+            
+        Returns:
+            threading.Lock: The stripe lock for this title
+        """
+        return self._locks[hash(title) % len(self._locks)]
     
     def add_book(self, book):
         """
@@ -55,11 +107,88 @@ class Library:
         
         Args:
             book (Book): A Book instance to add to the library
+            
+        Raises:
+            TypeError: If book is not a Book instance
+            ValueError: If the book already belongs to a library
         """
-        if isinstance(book, Book):
-            self._books.append(book)
-        else:
+        self.add_books([book])
+    
+    def add_books(self, books):
+        """
+        Add many books to the library's collection in a single pass.
+        
+        The whole batch is validated before any book is added, so a bad
+        batch leaves the library unchanged. An available copy of a title
+        that patrons are waiting for is checked out and handed to the next
+        of them, as return_book() does.
+        
+        Args:
+            books (iterable): Book instances to add to the library
+            
+        Returns:
+            int: The number of books added
+            
+        Raises:
+            TypeError: If any item is not a Book instance
+            ValueError: If any book already belongs to a library or is repeated
+        """
+        books = list(books)
+        if not all(isinstance(book, Book) for book in books):
             raise TypeError("Only Book instances can be added to the library")
+        if (any(book._library is not None for book in books)
+                or len(set(books)) != len(books)):
+            raise ValueError("Book already belongs to a library")
+        
+        all_books = self._books
+        titles = self._titles
+        available = self._available
+        lock_for = self._lock_for
+        handed_over = []
+        for book in books:
+            book._library = self
+            all_books[book] = None
+            with lock_for(book.title):
+                titles.setdefault(book.title, []).append(book)
+                if not book._is_checked_out and book.title in self._waitlists:
+                    reservation = self._pop_reservation(book.title)
+                    if reservation is not None:
+                        # Not in the availability set yet, so just mark it
+                        book._is_checked_out = True
+                        handed_over.append((reservation[3], book))
+        self._search_index.add_many(books)
+        with self._available_lock:
+            available.update((book, None) for book in books if not book._is_checked_out)
+            
+        # Hand the copies to waiting patrons outside the locks
+        for callback, book in handed_over:
+            if callback is not None:
+                callback(book)
+        return len(books)
+    
+    def remove_book(self, book):
+        """
+        Remove a book from the library's collection.
+        
+        Args:
+            book (Book): The Book instance to remove
+            
+        Raises:
+            ValueError: If the book is not in the library
+        """
+        if book not in self._books:
+            raise ValueError("Book is not in the library")
+        
+        book._library = None
+        del self._books[book]
+        with self._available_lock:
+            self._available.pop(book, None)
+        self._search_index.remove(book)
+        with self._lock_for(book.title):
+            copies = self._titles[book.title]
+            copies.remove(book)
+            if not copies:
+                del self._titles[book.title]
     
     def check_out_book(self, title):
         """
@@ -71,10 +200,11 @@ class Library:
         Returns:
             bool: True if book was successfully checked out, False otherwise
         """
-        for book in self._books:
-            if book.title == title and book.is_available():
-                book.check_out()
-                return True
+        with self._lock_for(title):
+            for book in self._titles.get(title, ()):
+                if book.is_available():
+                    book.check_out()
+                    return True
         return False
     
     def return_book(self, title):
@@ -87,19 +217,182 @@ class Library:
         Returns:
             bool: True if book was successfully returned, False otherwise
         """
-        for book in self._books:
-            if book.title == title and not book.is_available():
+        with self._lock_for(title):
+            for book in self._titles.get(title, ()):
+                if not book.is_available():
+                    break
+            else:
+                return False
+            
+            reservation = self._pop_reservation(title)
+            if reservation is None:
                 book.return_book()
-                return True
-        return False
+                
+        # Hand the copy to the next patron outside the lock
+        if reservation is not None and reservation[3] is not None:
+            reservation[3](book)
+        return True
+    
+    def reserve(self, title, patron, priority=0, callback=None):
+        """
+        Check out a copy of a title, or join its waitlist if none is available.
+        
+        Waiting patrons are served by highest priority first, then in the
+        order they reserved. When a copy is returned it stays checked out and
+        is handed to the first waiting patron by calling callback(book).
+        
+        Args:
+            title (str): The title to reserve
+            patron: A hashable identifier for the patron
+            priority (int): Higher values are served first, defaults to 0
+            callback (callable): Called with the Book once it is handed over
+            
+        Returns:
+            bool: True if a copy was checked out immediately, False if queued
+            
+        Raises:
+            ValueError: If the patron is already waiting for this title
+        """
+        with self._lock_for(title):
+            if (title, patron) in self._reservations:
+                raise ValueError("Patron is already waiting for this title")
+            
+            for book in self._titles.get(title, ()):
+                if book.is_available():
+                    book.check_out()
+                    break
+            else:
+                entry = [-priority, next(self._reservation_seq), patron, callback]
+                self._reservations[(title, patron)] = entry
+                heappush(self._waitlists.setdefault(title, []), entry)
+                return False
+        
+        if callback is not None:
+            callback(book)
+        return True
+    
+    def cancel_reservation(self, title, patron):
+        """
+        Remove a patron from a title's waitlist.
+        
+        Args:
+            title (str): The reserved title
+            patron: The patron identifier passed to reserve()
+            
+        Returns:
+            bool: True if a reservation was cancelled, False if none existed
+        """
+        with self._lock_for(title):
+            entry = self._reservations.pop((title, patron), None)
+            if entry is None:
+                return False
+            # Leave the entry in the heap; _pop_reservation() skips it
+            entry[2] = entry[3] = None
+            return True
+    
+    def get_waitlist(self, title):
+        """
+        Get the patrons waiting for a title, next in line first.
+        
+        Args:
+            title (str): The reserved title
+            
+        Returns:
+            list: Patron identifiers in service order
+        """
+        with self._lock_for(title):
+            entries = [entry for entry in self._waitlists.get(title, ())
+                       if (title, entry[2]) in self._reservations]
+        return [entry[2] for entry in sorted(entries)]
+    
+    def _pop_reservation(self, title):
+        """
+        Pop the next live reservation for a title. Must hold the title's lock.
+        
+        Args:
+            title (str): The reserved title
+            
+        Returns:
+            list or None: The waitlist entry, or None if nobody is waiting
+        """
+        waitlist = self._waitlists.get(title)
+        while waitlist:
+            entry = heappop(waitlist)
+            if self._reservations.get((title, entry[2])) is entry:
+                del self._reservations[(title, entry[2])]
+                if not waitlist:
+                    del self._waitlists[title]
+                return entry
+        self._waitlists.pop(title, None)
+        return None
+    
+    def _set_available(self, book, available):
+        """
+        Keep the availability set in sync with a book's state.
+        
+        Called by Book.check_out() and Book.return_book().
+        
+        Args:
+            book (Book): A book owned by this library
+            available (bool): Whether the book is now available
+        """
+        with self._available_lock:
+            if available:
+                self._available[book] = None
+            else:
+                self._available.pop(book, None)
+    
+    def _available_snapshot(self, offset=0, limit=None):
+        """Copy a page of the availability set while holding its lock."""
+        stop = None if limit is None else offset + limit
+        with self._available_lock:
+            return list(islice(self._available, offset, stop))
+    
+    def iter_available_books(self, offset=0, limit=None):
+        """
+        Iterate over available books.
+        
+        Books are yielded in the order they became available. The page is
+        copied when the call is made (references only, no formatting), so
+        other threads may check books out or return them meanwhile.
+        
+        Args:
+            offset (int): Number of available books to skip, defaults to 0
+            limit (int): Maximum number of books to yield, defaults to all
+            
+        Returns:
+            iterator: Available Book instances
+        """
+        return iter(self._available_snapshot(offset, limit))
+    
+    def write_available_books(self, fp, chunk_size=1000):
+        """
+        Write all available books to a file object, one per line.
+        
+        Lines are joined and written in chunks of chunk_size books
+        instead of one write per book. The books listed are the ones
+        available when the call is made.
+        
+        Args:
+            fp: A text file object with a write() method
+            chunk_size (int): Number of books per write, defaults to 1000
+            
+        Returns:
+            int: The number of books written
+        """
+        count = 0
+        books = iter(self._available_snapshot())
+        while True:
+            chunk = [str(book) for book in islice(books, chunk_size)]
+            if not chunk:
+                return count
+            fp.write("\n".join(chunk) + "\n")
+            count += len(chunk)
     
     def list_available_books(self):
         """Print all available books in the library."""
-        available_books = [book for book in self._books if book.is_available()]
-        
-        if available_books:
-            for book in available_books:
-                print(book)
+        if self._available:
+            self.write_available_books(sys.stdout)
         else:
             print("No books are currently available.")
     
@@ -110,7 +403,16 @@ class Library:
         Returns:
             list: List of all Book instances in the library
         """
-        return self._books.copy()  # Return a copy to maintain encapsulation
+        return list(self._books)  # Return a copy to maintain encapsulation
+    
+    def get_book_count(self):
+        """
+        Get the total number of books in the library.
+        
+        Returns:
+            int: The number of books, including checked-out copies
+        """
+        return len(self._books)
     
     def find_book(self, title):
         """
@@ -122,7 +424,55 @@ class Library:
         Returns:
             Book or None: The Book instance if found, None otherwise
         """
-        for book in self._books:
-            if book.title == title:
-                return book
-        return None
\ No newline at end of file
+        copies = self._titles.get(title)
+        return copies[0] if copies else None
+    
+    def search(self, query, limit=10, with_scores=False):
+        """
+        Search books by words in their title or author.
+        
+        Every query word must match a word, or the start of a word, in the
+        book's title or author. Title matches rank above author matches.
+        
+        Args:
+            query (str): Words to search for
+            limit (int): Maximum number of results, defaults to 10
+            with_scores (bool): Return (book, score) pairs instead of books
+            
+        Returns:
+            list: Matching Book instances, best match first
+        """
+        return self._search_index.search(query, limit, with_scores)
+    
+    def save_snapshot(self, path):
+        """
+        Save every book to a compact binary snapshot file.
+        
+        Reservations are not saved.
+        
+        Args:
+            path (str): Path of the snapshot file to write
+            
+        Returns:
+            int: The number of books saved
+        """
+        # Imported here because library_snapshot imports this module
+        from library_snapshot import save_snapshot
+        return save_snapshot(self.get_all_books(), path)
+    
+    @staticmethod
+    def load_snapshot(path):
+        """
+        Open a snapshot file written by save_snapshot().
+        
+        The file is memory-mapped and Book objects are only built when they
+        are accessed. Call to_library() on the result for a mutable Library.
+        
+        Args:
+            path (str): Path of the snapshot file
+            
+        Returns:
+            LibrarySnapshot: A read-only view of the saved books
+        """
+        from library_snapshot import LibrarySnapshot
+        return LibrarySnapshot(path)
\ No newline at end of file
@@ -0,0 +1,264 @@
+# library_snapshot.py
+
+import mmap
+import struct
+import sys
+from array import array
+from bisect import bisect_left
+
+from library_management import Book, Library
+
+MAGIC = b"LIBSNAP1"
+# magic, book count, string count, string data length
+HEADER = struct.Struct("<8sQQQ")
+
+
+def _padding(size):
+    """Number of zero bytes that align size to 8 bytes."""
+    return -size % 8
+
+
+def _little_endian(values):
+    """Return an array's bytes in little-endian order."""
+    if sys.byteorder != "little":
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values.tobytes()
+
+
+def save_snapshot(books, path):
+    """
+    Write books to a compact binary snapshot file.
+
+    The file holds a header, a sorted table of the distinct title and
+    author strings, one fixed-width (title id, author id) record per book,
+    the book indexes sorted by title for lookups, and one availability bit
+    per book. All integers are little-endian.
+
+    Args:
+        books (iterable): Book instances, in the order they should be stored
+        path (str): Path of the snapshot file to write
+
+    Returns:
+        int: The number of books written
+    """
+    books = list(books)
+    strings = sorted({book.title for book in books} | {book.author for book in books})
+    string_ids = {string: i for i, string in enumerate(strings)}
+
+    encoded = [string.encode("utf-8") for string in strings]
+    offsets = array("Q", [0])
+    for data in encoded:
+        offsets.append(offsets[-1] + len(data))
+
+    records = array("I")
+    bitmap = bytearray((len(books) + 7) // 8)
+    for i, book in enumerate(books):
+        records.append(string_ids[book.title])
+        records.append(string_ids[book.author])
+        if book.is_available():
+            bitmap[i >> 3] |= 1 << (i & 7)
+    # Stable sort, so copies of a title keep their catalog order
+    order = array("I", sorted(range(len(books)), key=records[::2].__getitem__))
+
+    with open(path, "wb") as fp:
+        fp.write(HEADER.pack(MAGIC, len(books), len(strings), offsets[-1]))
+        fp.write(_little_endian(offsets))
+        fp.write(b"".join(encoded))
+        fp.write(bytes(_padding(offsets[-1])))
+        fp.write(_little_endian(records))
+        fp.write(_little_endian(order))
+        fp.write(bytes(_padding(4 * len(order))))
+        fp.write(bitmap)
+    return len(books)
+
+
+class LibrarySnapshot:
+    """
+    A read-only, memory-mapped view of a library snapshot.
+
+    Opening a snapshot only maps the file; Book objects are built when a
+    book is accessed, and each access builds a new, detached Book.
+    """
+
+    def __init__(self, path):
+        """
+        Memory-map a snapshot file written by save_snapshot().
+
+        Args:
+            path (str): Path of the snapshot file
+
+        Raises:
+            ValueError: If the file is not a library snapshot or is truncated
+        """
+        with open(path, "rb") as fp:
+            self._mmap = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+        view = memoryview(self._mmap)
+        try:
+            self._count, string_count, sizes = self._read_header(view, path)
+        except ValueError:
+            view.release()
+            self._mmap.close()
+            raise
+
+        position = HEADER.size
+        sections = []
+        for size in sizes:
+            sections.append(view[position:position + size])
+            position += size
+        offsets, self._data, records, order, self._bitmap = sections
+
+        self._offsets = self._cast(offsets, "Q")
+        self._records = self._cast(records, "I")
+        self._order = self._cast(order[:4 * self._count], "I")
+        self._string_count = string_count
+
+    @staticmethod
+    def _read_header(view, path):
+        """
+        Read and check the header of a mapped snapshot.
+
+        Args:
+            view (memoryview): The whole mapped file
+            path (str): Path of the file, for error messages
+
+        Returns:
+            tuple: (book count, string count, byte size of each section)
+
+        Raises:
+            ValueError: If the magic is wrong or the file is shorter than
+                its header says
+        """
+        if len(view) < HEADER.size:
+            raise ValueError(f"Truncated library snapshot: {path}")
+        magic, count, string_count, data_size = HEADER.unpack_from(view)
+        if magic != MAGIC:
+            raise ValueError(f"Not a library snapshot: {path}")
+        sizes = (8 * (string_count + 1), data_size + _padding(data_size),
+                 8 * count, 4 * count + _padding(4 * count), (count + 7) // 8)
+        if HEADER.size + sum(sizes) > len(view):
+            raise ValueError(f"Truncated library snapshot: {path}")
+        return count, string_count, sizes
+
+    @staticmethod
+    def _cast(section, typecode):
+        """View a section as unsigned integers, copying only on big-endian hosts."""
+        if sys.byteorder == "little":
+            return section.cast(typecode)
+        values = array(typecode, section.tobytes())
+        values.byteswap()
+        return values
+
+    def __enter__(self):
+        """Use the snapshot as a context manager that closes on exit."""
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Unmap the snapshot file."""
+        self.close()
+
+    def close(self):
+        """Release the memory map. Books already built stay usable."""
+        for name in ("_offsets", "_records", "_order", "_data", "_bitmap"):
+            view = self.__dict__.pop(name, None)
+            if isinstance(view, memoryview):
+                view.release()
+        self._mmap.close()
+
+    def _string(self, string_id):
+        """Decode one entry of the string table."""
+        return str(self._data[self._offsets[string_id]:self._offsets[string_id + 1]], "utf-8")
+
+    def _is_available(self, index):
+        """Read the availability bit of a book."""
+        return bool(self._bitmap[index >> 3] & (1 << (index & 7)))
+
+    def __len__(self):
+        """Number of books in the snapshot."""
+        return self._count
+
+    def __getitem__(self, index):
+        """
+        Build the Book stored at a position.
+
+        Args:
+            index (int): Position of the book, in catalog order
+
+        Returns:
+            Book: A new Book with the stored title, author and availability
+        """
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("snapshot index out of range")
+        book = Book(self._string(self._records[2 * index]),
+                    self._string(self._records[2 * index + 1]))
+        if not self._is_available(index):
+            book.check_out()
+        return book
+
+    def __iter__(self):
+        """Iterate over the books in catalog order, building each one lazily."""
+        return (self[i] for i in range(self._count))
+
+    def get_book_count(self):
+        """
+        Get the total number of books in the snapshot.
+
+        Returns:
+            int: The number of books stored
+        """
+        return self._count
+
+    def find_book(self, title):
+        """
+        Find a book by title using binary search.
+
+        Args:
+            title (str): The title of the book to find
+
+        Returns:
+            Book or None: The first copy of the title, None if not found
+        """
+        string_id = bisect_left(range(self._string_count), title, key=self._string)
+        if string_id == self._string_count or self._string(string_id) != title:
+            return None
+
+        records = self._records
+        position = bisect_left(self._order, string_id, key=lambda i: records[2 * i])
+        if position == self._count or records[2 * self._order[position]] != string_id:
+            return None
+        return self[self._order[position]]
+
+    def iter_available_books(self, offset=0, limit=None):
+        """
+        Iterate over available books in catalog order.
+
+        Args:
+            offset (int): Number of available books to skip, defaults to 0
+            limit (int): Maximum number of books to yield, defaults to all
+
+        Yields:
+            Book: Newly built available books
+        """
+        for index in range(self._count):
+            if limit is not None and limit <= 0:
+                return
+            if self._is_available(index):
+                if offset:
+                    offset -= 1
+                else:
+                    yield self[index]
+                    if limit is not None:
+                        limit -= 1
+
+    def to_library(self):
+        """
+        Build a full, mutable Library from the snapshot.
+
+        Returns:
+            Library: A new Library holding every book in the snapshot
+        """
+        library = Library()
+        library.add_books(self)
+        return library
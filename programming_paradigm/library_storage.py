@@ -0,0 +1,300 @@
+# library_storage.py
+
+import queue
+import sqlite3
+import sys
+import threading
+from contextlib import contextmanager
+
+from library_management import Book
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS books (
+    id INTEGER PRIMARY KEY,
+    title TEXT NOT NULL,
+    author TEXT NOT NULL,
+    checked_out INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS books_title ON books (title, checked_out);
+CREATE INDEX IF NOT EXISTS books_author ON books (author);
+CREATE INDEX IF NOT EXISTS books_available ON books (checked_out, id);
+"""
+
+
+def _connect(path):
+    """Open a connection that may be handed between threads."""
+    connection = sqlite3.connect(path, check_same_thread=False)
+    connection.execute("PRAGMA journal_mode=WAL")
+    connection.execute("PRAGMA synchronous=NORMAL")
+    return connection
+
+
+def _to_book(row):
+    """Build a detached Book snapshot from a (title, author, checked_out) row."""
+    book = Book(row[0], row[1])
+    if row[2]:
+        book.check_out()
+    return book
+
+
+class ConnectionPool:
+    """A fixed-size pool of SQLite connections for concurrent readers."""
+
+    def __init__(self, path, size=4):
+        """
+        Open size connections to the database at path.
+
+        Args:
+            path (str): Path of the SQLite database file
+            size (int): Number of pooled connections, defaults to 4
+        """
+        self._connections = queue.Queue()
+        for _ in range(size):
+            self._connections.put(_connect(path))
+
+    @contextmanager
+    def connection(self):
+        """
+        Borrow a connection for the duration of a with block.
+
+        Blocks until a connection is free.
+
+        Yields:
+            sqlite3.Connection: A pooled connection
+        """
+        connection = self._connections.get()
+        try:
+            yield connection
+        finally:
+            self._connections.put(connection)
+
+    def close(self):
+        """Close every pooled connection."""
+        while not self._connections.empty():
+            self._connections.get().close()
+
+
+class SQLiteLibrary:
+    """
+    A Library stored in an SQLite database instead of process memory.
+
+    Opening an existing database is instant, and lookups use indexes on
+    title and author, so the catalog does not need to fit in RAM. Writes go
+    through a single writer connection; check-outs and returns are committed
+    in batches of commit_every operations, so the most recent ones can be
+    lost on a crash unless flush() is called. Readers use a connection pool
+    and see committed state only.
+
+    Books returned by this class are snapshots: calling check_out() or
+    return_book() on them does not change the database.
+    """
+
+    def __init__(self, path, pool_size=4, commit_every=100):
+        """
+        Open (and create if needed) the library database at path.
+
+        Args:
+            path (str): Path of the SQLite database file
+            pool_size (int): Number of reader connections, defaults to 4
+            commit_every (int): Check-outs and returns per commit, defaults to 100
+        """
+        self._writer = _connect(path)
+        self._writer.executescript(SCHEMA)
+        self._write_lock = threading.Lock()
+        self._pending = 0
+        self.commit_every = commit_every
+        self._pool = ConnectionPool(path, pool_size)
+
+    def __enter__(self):
+        """Use the library as a context manager that closes on exit."""
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Commit pending writes and close the database."""
+        self.close()
+
+    def add_book(self, book):
+        """
+        Add a book to the library's collection.
+
+        Args:
+            book (Book): A Book instance to add to the library
+        """
+        self.add_books([book])
+
+    def add_books(self, books):
+        """
+        Add many books in one transaction.
+
+        Args:
+            books (iterable): Book instances to add to the library
+
+        Returns:
+            int: The number of books added
+
+        Raises:
+            TypeError: If any item is not a Book instance
+        """
+        books = list(books)
+        if not all(isinstance(book, Book) for book in books):
+            raise TypeError("Only Book instances can be added to the library")
+
+        with self._write_lock:
+            self._writer.executemany(
+                "INSERT INTO books (title, author, checked_out) VALUES (?, ?, ?)",
+                ((book.title, book.author, int(not book.is_available())) for book in books))
+            self._commit()
+        return len(books)
+
+    def _commit(self):
+        """Commit the writer connection. Must hold the write lock."""
+        self._writer.commit()
+        self._pending = 0
+
+    def _write_batched(self, sql, params):
+        """
+        Run one check-out or return statement, committing every commit_every calls.
+
+        Returns:
+            bool: True if a row was changed
+        """
+        with self._write_lock:
+            changed = self._writer.execute(sql, params).rowcount > 0
+            if changed:
+                self._pending += 1
+                if self._pending >= self.commit_every:
+                    self._commit()
+            return changed
+
+    def check_out_book(self, title):
+        """
+        Check out a book by title.
+
+        Args:
+            title (str): The title of the book to check out
+
+        Returns:
+            bool: True if book was successfully checked out, False otherwise
+        """
+        return self._write_batched(
+            "UPDATE books SET checked_out = 1 WHERE id = "
+            "(SELECT id FROM books WHERE title = ? AND checked_out = 0 LIMIT 1)",
+            (title,))
+
+    def return_book(self, title):
+        """
+        Return a book by title.
+
+        Args:
+            title (str): The title of the book to return
+
+        Returns:
+            bool: True if book was successfully returned, False otherwise
+        """
+        return self._write_batched(
+            "UPDATE books SET checked_out = 0 WHERE id = "
+            "(SELECT id FROM books WHERE title = ? AND checked_out = 1 LIMIT 1)",
+            (title,))
+
+    def flush(self):
+        """Commit any check-outs and returns that are still pending."""
+        with self._write_lock:
+            self._commit()
+
+    def find_book(self, title):
+        """
+        Find a book by title.
+
+        Args:
+            title (str): The title of the book to find
+
+        Returns:
+            Book or None: A snapshot of the book if found, None otherwise
+        """
+        with self._pool.connection() as connection:
+            row = connection.execute(
+                "SELECT title, author, checked_out FROM books WHERE title = ? "
+                "ORDER BY id LIMIT 1", (title,)).fetchone()
+        return _to_book(row) if row else None
+
+    def find_books_by_author(self, author):
+        """
+        Find every book by an author.
+
+        Args:
+            author (str): The exact author name
+
+        Returns:
+            list: Book snapshots in the order they were added
+        """
+        with self._pool.connection() as connection:
+            rows = connection.execute(
+                "SELECT title, author, checked_out FROM books WHERE author = ? "
+                "ORDER BY id", (author,)).fetchall()
+        return [_to_book(row) for row in rows]
+
+    def iter_available_books(self, offset=0, limit=None):
+        """
+        Iterate over available books in the order they were added.
+
+        The iterator holds a pooled connection until it is exhausted or closed.
+
+        Args:
+            offset (int): Number of available books to skip, defaults to 0
+            limit (int): Maximum number of books to yield, defaults to all
+
+        Yields:
+            Book: Snapshots of available books
+        """
+        with self._pool.connection() as connection:
+            cursor = connection.execute(
+                "SELECT title, author, checked_out FROM books WHERE checked_out = 0 "
+                "ORDER BY id LIMIT ? OFFSET ?", (-1 if limit is None else limit, offset))
+            for row in cursor:
+                yield _to_book(row)
+
+    def write_available_books(self, fp, chunk_size=1000):
+        """
+        Write all available books to a file object, one per line.
+
+        Args:
+            fp: A text file object with a write() method
+            chunk_size (int): Number of books per write, defaults to 1000
+
+        Returns:
+            int: The number of books written
+        """
+        count = 0
+        chunk = []
+        for book in self.iter_available_books():
+            chunk.append(str(book))
+            if len(chunk) == chunk_size:
+                fp.write("\n".join(chunk) + "\n")
+                count += len(chunk)
+                chunk = []
+        if chunk:
+            fp.write("\n".join(chunk) + "\n")
+            count += len(chunk)
+        return count
+
+    def list_available_books(self):
+        """Print all available books in the library."""
+        if not self.write_available_books(sys.stdout):
+            print("No books are currently available.")
+
+    def get_book_count(self):
+        """
+        Get the total number of books in the library.
+
+        Returns:
+            int: The number of books stored
+        """
+        with self._pool.connection() as connection:
+            return connection.execute("SELECT COUNT(*) FROM books").fetchone()[0]
+
+    def close(self):
+        """Commit pending writes and close every connection."""
+        with self._write_lock:
+            self._commit()
+            self._writer.close()
+        self._pool.close()
@@ -1,12 +1,57 @@
 import sys
+from collections import Counter
 from bank_account import BankAccount
+from bank_commands import COMMANDS, run_command, split_account
 from library_management import Book, Library
 from robust_division_calculator import safe_divide
 
+def run_batch(lines, starting_balance=100):
+    """
+    Apply a stream of commands in order against accounts that persist
+    for the whole run, then print all output at once with a summary.
+
+    Each line is "[account ]<command>:<amount>"; lines without an account
+    name use the "default" account. Accounts start with starting_balance.
+
+    Args:
+        lines (iterable): Command lines, e.g. an open file or sys.stdin
+        starting_balance (float): Balance of newly created accounts
+    """
+    accounts = {}
+    output = []
+    counts = Counter()
+    for line in lines:
+        if not line.strip():
+            continue
+        name, text = split_account(line)
+        account = accounts.get(name)
+        if account is None:
+            account = accounts[name] = BankAccount(starting_balance)
+        response = run_command(account, text)
+        output.append(response)
+        counts["invalid" if response == "Invalid command." else text.split(':')[0]] += 1
+
+    output.append(f"Processed {sum(counts.values())} commands: " +
+                  ", ".join(f"{command} {counts[command]}"
+                            for command in (*COMMANDS, "invalid")))
+    for name, account in accounts.items():
+        output.append(f"{name}: {account.balance_message()}")
+    sys.stdout.write("\n".join(output) + "\n")
+
 def main():
+    if len(sys.argv) >= 2 and sys.argv[1] == "--batch":
+        # Batch mode: read commands from a file, or stdin when none is given
+        if len(sys.argv) > 2 and sys.argv[2] != "-":
+            with open(sys.argv[2]) as fp:
+                run_batch(fp)
+        else:
+            run_batch(sys.stdin)
+        return
+
     account = BankAccount(100)  # Example starting balance
     if len(sys.argv) < 2:
         print("Usage: python main.py <command>:<amount>")
+        print("       python main.py --batch [file]")
         print("Commands: deposit, withdraw, display")
         sys.exit(1)
 
@@ -0,0 +1,181 @@
+# search_index.py
+
+import re
+from bisect import bisect_left, insort
+from heapq import nlargest
+
+TOKEN_PATTERN = re.compile(r"\w+")
+
+# Weight of a token found in each indexed field
+TITLE_WEIGHT = 2
+AUTHOR_WEIGHT = 1
+
+# Score multiplier for a query token matching a whole token vs. a prefix
+EXACT_BONUS = 2
+PREFIX_BONUS = 1
+
+
+def tokenize(text):
+    """
+    Split text into lowercase word tokens.
+
+    Args:
+        text (str): The text to tokenize
+
+    Returns:
+        list: The word tokens in order of appearance
+    """
+    return TOKEN_PATTERN.findall(text.casefold())
+
+
+class SearchIndex:
+    """
+    An inverted index over book titles and authors.
+
+    Each token maps to the books containing it, with a weight that favours
+    title matches over author matches. Prefix lookups bisect a sorted list
+    of the tokens, which new and removed tokens are inserted into or
+    deleted from in place, so it is never re-sorted as a whole.
+    """
+
+    def __init__(self):
+        """Initialize an empty index."""
+        self._postings = {}  # token -> {book: weight}
+        self._sorted_tokens = []  # Sorted copy of the tokens for prefix search
+
+    def _weights(self, book):
+        """
+        Compute the weight of every token in a book's title and author.
+
+        Args:
+            book: An object with title and author attributes
+
+        Returns:
+            dict: Token -> combined field weight
+        """
+        weights = {}
+        for token in set(tokenize(book.title)):
+            weights[token] = TITLE_WEIGHT
+        for token in set(tokenize(book.author)):
+            weights[token] = weights.get(token, 0) + AUTHOR_WEIGHT
+        return weights
+
+    def add(self, book):
+        """
+        Index a book's title and author.
+
+        Args:
+            book: An object with title and author attributes
+        """
+        for token in self._add_postings(book):
+            insort(self._sorted_tokens, token)
+
+    def add_many(self, books):
+        """
+        Index many books at once.
+
+        New tokens are sorted together and merged into the token list in
+        one pass, rather than inserted one by one.
+
+        Args:
+            books (iterable): Objects with title and author attributes
+        """
+        new_tokens = []
+        for book in books:
+            new_tokens.extend(self._add_postings(book))
+        if new_tokens:
+            new_tokens.sort()
+            # Two sorted runs: Timsort merges them in linear time
+            self._sorted_tokens += new_tokens
+            self._sorted_tokens.sort()
+
+    def _add_postings(self, book):
+        """
+        Add a book to the postings of its tokens.
+
+        Args:
+            book: An object with title and author attributes
+
+        Returns:
+            list: Tokens that were not indexed before
+        """
+        new_tokens = []
+        for token, weight in self._weights(book).items():
+            postings = self._postings.get(token)
+            if postings is None:
+                postings = self._postings[token] = {}
+                new_tokens.append(token)
+            postings[book] = weight
+        return new_tokens
+
+    def remove(self, book):
+        """
+        Remove a previously indexed book.
+
+        Args:
+            book: An object with title and author attributes
+        """
+        for token in self._weights(book):
+            postings = self._postings.get(token)
+            if postings is None:
+                continue
+            postings.pop(book, None)
+            if not postings:
+                del self._postings[token]
+                del self._sorted_tokens[bisect_left(self._sorted_tokens, token)]
+
+    def _expand(self, prefix):
+        """
+        Yield every indexed token starting with prefix.
+
+        Args:
+            prefix (str): A lowercase token prefix
+
+        Yields:
+            str: Matching tokens in sorted order
+        """
+        tokens = self._sorted_tokens
+        i = bisect_left(tokens, prefix)
+        while i < len(tokens) and tokens[i].startswith(prefix):
+            yield tokens[i]
+            i += 1
+
+    def search(self, query, limit=10, with_scores=False):
+        """
+        Find the books matching every word of a query.
+
+        Each query word matches whole tokens or token prefixes. Results are
+        ranked by their combined score, highest first.
+
+        Args:
+            query (str): Words to search for
+            limit (int): Maximum number of results, defaults to 10
+            with_scores (bool): Return (book, score) pairs instead of books
+
+        Returns:
+            list: Matching books, best match first
+        """
+        scores = None
+        for word in dict.fromkeys(tokenize(query)):
+            matches = {}
+            for token in self._expand(word):
+                bonus = EXACT_BONUS if token == word else PREFIX_BONUS
+                for book, weight in self._postings[token].items():
+                    score = weight * bonus
+                    if score > matches.get(book, 0):
+                        matches[book] = score
+
+            if scores is None:
+                scores = matches
+            else:
+                scores = {book: scores[book] + score
+                          for book, score in matches.items() if book in scores}
+            if not scores:
+                return []
+
+        if scores is None:
+            return []
+        ranked = nlargest(limit, scores.items(), key=lambda item: item[1])
+        if with_scores:
+            return ranked
+        return [book for book, _ in ranked]
@@ -0,0 +1,434 @@
+# sharded_library.py
+
+import itertools
+import multiprocessing
+import os
+import sys
+import threading
+import zlib
+from heapq import nlargest
+
+from library_management import Book, Library
+
+
+def shard_for(title, shards):
+    """
+    Pick the shard that owns a title.
+
+    Uses CRC-32 rather than hash(), whose value for strings changes from one
+    interpreter run to the next.
+
+    Args:
+        title (str): The book title
+        shards (int): Number of shards
+
+    Returns:
+        int: Shard number in range(shards)
+    """
+    return zlib.crc32(title.encode("utf-8")) % shards
+
+
+def _book_row(book):
+    """Turn a shard's Book into a picklable (title, author, available) row."""
+    return book.title, book.author, book.is_available()
+
+
+def _book_from_row(row):
+    """Build a detached Book from a (title, author, available) row."""
+    title, author, available = row
+    book = Book(title, author)
+    book._is_checked_out = not available
+    return book
+
+
+def _add_books(library, rows):
+    """Add (title, author, available) rows as new books."""
+    return library.add_books(_book_from_row(row) for row in rows)
+
+
+def _check_out_books(library, titles):
+    """Check out one copy of each title."""
+    return [library.check_out_book(title) for title in titles]
+
+
+def _return_books(library, titles):
+    """Return one copy of each title."""
+    return [library.return_book(title) for title in titles]
+
+
+def _find_book(library, title):
+    """Find a title and return its row, or None."""
+    book = library.find_book(title)
+    return None if book is None else _book_row(book)
+
+
+# Open listings in this worker process: cursor id -> iterator of books
+_cursors = {}
+_cursor_ids = itertools.count()
+
+
+def _open_available(library):
+    """Start a listing of the books available now and return its cursor id."""
+    cursor = next(_cursor_ids)
+    _cursors[cursor] = library.iter_available_books()
+    return cursor
+
+
+def _next_available(library, cursor, limit):
+    """Format the next limit books of a listing, closing it when it runs out."""
+    lines = [str(book) for book in itertools.islice(_cursors[cursor], limit)]
+    if len(lines) < limit:
+        del _cursors[cursor]
+    return "".join(line + "\n" for line in lines), len(lines)
+
+
+def _close_available(library, cursor):
+    """Drop a listing that will not be read to the end."""
+    _cursors.pop(cursor, None)
+
+
+def _search(library, query, limit):
+    """Search and return (score, row) pairs, best first."""
+    return [(score, _book_row(book))
+            for book, score in library.search(query, limit, with_scores=True)]
+
+
+# Requests a shard worker understands: name -> handler(library, *args)
+HANDLERS = {
+    "add_books": _add_books,
+    "check_out_books": _check_out_books,
+    "return_books": _return_books,
+    "find_book": _find_book,
+    "count": Library.get_book_count,
+    "open_available": _open_available,
+    "next_available": _next_available,
+    "close_available": _close_available,
+    "search": _search,
+}
+
+
+def _serve(conn):
+    """
+    Worker process loop: own one Library and answer requests for it.
+
+    Each request is a (name, args) tuple and is answered with (True, result)
+    or (False, exception). None stops the worker.
+    """
+    library = Library()
+    while True:
+        request = conn.recv()
+        if request is None:
+            break
+        name, args = request
+        try:
+            conn.send((True, HANDLERS[name](library, *args)))
+        except Exception as error:
+            conn.send((False, error))
+    conn.close()
+
+
+class ShardedLibrary:
+    """
+    A library split by title hash across worker processes.
+
+    Each shard is a separate process holding its own Library, so the
+    collection can use several cores and more memory than one process.
+    Requests about one title go to the shard that owns it. Counts, listings
+    and searches are sent to every shard at once and the answers combined.
+    Each shard's pipe has a lock, so several threads can share the library.
+
+    Books returned by find_book() and search() are detached copies: checking
+    them out does not change the library, use check_out_book() instead.
+    Added books are copied to their shard with their availability. The
+    instances passed to add_books() are marked as owned by this library, so
+    they cannot be added again, but checking them out afterwards only
+    changes the instance, not the shard's copy.
+    """
+
+    def __init__(self, shards=None):
+        """
+        Start the shard processes.
+
+        Args:
+            shards (int): Number of worker processes, defaults to the CPU count
+        """
+        self._connections = []
+        self._processes = []
+        self._locks = []
+        for _ in range(shards or os.cpu_count() or 1):
+            conn, child_conn = multiprocessing.Pipe()
+            process = multiprocessing.Process(target=_serve, args=(child_conn,), daemon=True)
+            process.start()
+            child_conn.close()
+            self._connections.append(conn)
+            self._processes.append(process)
+            self._locks.append(threading.Lock())
+
+    @property
+    def shards(self):
+        """Number of shard processes."""
+        return len(self._connections)
+
+    def _call(self, shard, name, *args):
+        """Send one request to a shard and wait for its result."""
+        return self._gather({shard: (name, args)})[shard]
+
+    def _gather(self, requests):
+        """
+        Send requests to several shards, then collect every result.
+
+        All requests are sent before any result is read, so the shards work
+        in parallel. The shards' locks are held until their replies are read,
+        taken in shard order so that concurrent calls cannot deadlock.
+
+        Args:
+            requests (dict): shard -> (name, args)
+
+        Returns:
+            dict: shard -> result
+
+        Raises:
+            Exception: The first error raised by a shard, after all replies
+                have been read
+        """
+        locks = [self._locks[shard] for shard in sorted(requests)]
+        for lock in locks:
+            lock.acquire()
+        try:
+            for shard, request in requests.items():
+                self._connections[shard].send(request)
+            results, error = {}, None
+            for shard in requests:
+                ok, result = self._connections[shard].recv()
+                if ok:
+                    results[shard] = result
+                elif error is None:
+                    error = result
+        finally:
+            for lock in locks:
+                lock.release()
+        if error is not None:
+            raise error
+        return results
+
+    def _scatter(self, name, *args):
+        """Send the same request to every shard and return the results in shard order."""
+        results = self._gather({shard: (name, args) for shard in range(self.shards)})
+        return [results[shard] for shard in range(self.shards)]
+
+    def _by_shard(self, name, titles):
+        """Route per-title requests to their shards and restore input order."""
+        titles = list(titles)
+        positions = {}
+        for i, title in enumerate(titles):
+            positions.setdefault(shard_for(title, self.shards), []).append(i)
+        results = self._gather({shard: (name, ([titles[i] for i in indexes],))
+                                for shard, indexes in positions.items()})
+        ordered = [None] * len(titles)
+        for shard, indexes in positions.items():
+            for i, result in zip(indexes, results[shard]):
+                ordered[i] = result
+        return ordered
+
+    def add_book(self, book):
+        """
+        Add a book to the shard that owns its title.
+
+        Args:
+            book (Book): A Book instance that does not belong to a library
+
+        Raises:
+            TypeError: If book is not a Book instance
+            ValueError: If the book already belongs to a library
+        """
+        self.add_books([book])
+
+    def add_books(self, books):
+        """
+        Add many books, sending one batch to each shard involved.
+
+        The whole batch is validated before any book is sent.
+
+        Args:
+            books (iterable): Book instances that do not belong to a library
+
+        Returns:
+            int: The number of books added
+
+        Raises:
+            TypeError: If any item is not a Book instance
+            ValueError: If any book already belongs to a library or is repeated
+        """
+        books = list(books)
+        if not all(isinstance(book, Book) for book in books):
+            raise TypeError("Only Book instances can be added to the library")
+        if (any(book._library is not None for book in books)
+                or len(set(books)) != len(books)):
+            raise ValueError("Book already belongs to a library")
+
+        batches = {}
+        for book in books:
+            shard = shard_for(book.title, self.shards)
+            batches.setdefault(shard, []).append(_book_row(book))
+        results = self._gather({shard: ("add_books", (rows,))
+                                for shard, rows in batches.items()})
+        for book in books:
+            book._library = self
+        return sum(results.values())
+
+    def _set_available(self, book, available):
+        """
+        Ignore availability changes of added Book instances.
+
+        Called by Book.check_out() and Book.return_book() on instances passed
+        to add_books(). The shards hold their own copies, which change only
+        through check_out_book() and return_book().
+        """
+
+    def check_out_book(self, title):
+        """
+        Check out a book by title.
+
+        Args:
+            title (str): The title of the book to check out
+
+        Returns:
+            bool: True if book was successfully checked out, False otherwise
+        """
+        return self._call(shard_for(title, self.shards), "check_out_books", [title])[0]
+
+    def check_out_books(self, titles):
+        """
+        Check out one copy of each title, in one round trip per shard.
+
+        Args:
+            titles (iterable): Titles to check out
+
+        Returns:
+            list: One bool per title, in input order
+        """
+        return self._by_shard("check_out_books", titles)
+
+    def return_book(self, title):
+        """
+        Return a book by title.
+
+        Args:
+            title (str): The title of the book to return
+
+        Returns:
+            bool: True if book was successfully returned, False otherwise
+        """
+        return self._call(shard_for(title, self.shards), "return_books", [title])[0]
+
+    def return_books(self, titles):
+        """
+        Return one copy of each title, in one round trip per shard.
+
+        Args:
+            titles (iterable): Titles to return
+
+        Returns:
+            list: One bool per title, in input order
+        """
+        return self._by_shard("return_books", titles)
+
+    def find_book(self, title):
+        """
+        Find a book by title.
+
+        Args:
+            title (str): The title of the book to find
+
+        Returns:
+            Book or None: A detached copy of the book if found, None otherwise
+        """
+        row = self._call(shard_for(title, self.shards), "find_book", title)
+        return None if row is None else _book_from_row(row)
+
+    def get_book_count(self):
+        """
+        Get the total number of books across all shards.
+
+        Returns:
+            int: The number of books
+        """
+        return sum(self._scatter("count"))
+
+    def write_available_books(self, fp, chunk_size=10_000):
+        """
+        Write all available books to a file object, one per line.
+
+        Each shard snapshots its available books when the listing starts and
+        then formats up to chunk_size of them per round, in parallel, reading
+        on from where the previous round stopped. Books are grouped by
+        shard, so the order differs from a single Library.
+
+        Args:
+            fp: A text file object with a write() method
+            chunk_size (int): Lines per shard per round, defaults to 10,000
+
+        Returns:
+            int: The number of books written
+        """
+        if chunk_size <= 0:
+            raise ValueError("chunk_size must be positive")
+        total = 0
+        cursors = dict(enumerate(self._scatter("open_available")))
+        try:
+            while cursors:
+                results = self._gather({shard: ("next_available", (cursor, chunk_size))
+                                        for shard, cursor in cursors.items()})
+                for shard, (text, count) in sorted(results.items()):
+                    fp.write(text)
+                    total += count
+                    if count < chunk_size:
+                        del cursors[shard]
+        finally:
+            if cursors:
+                self._gather({shard: ("close_available", (cursor,))
+                              for shard, cursor in cursors.items()})
+        return total
+
+    def list_available_books(self):
+        """Print all available books in the library."""
+        if not self.write_available_books(sys.stdout):
+            print("No books are currently available.")
+
+    def search(self, query, limit=10):
+        """
+        Search every shard and merge the best matches.
+
+        Args:
+            query (str): Words to search for
+            limit (int): Maximum number of results, defaults to 10
+
+        Returns:
+            list: Detached Book copies, best match first
+        """
+        matches = [match for results in self._scatter("search", query, limit)
+                   for match in results]
+        return [_book_from_row(row)
+                for _, row in nlargest(limit, matches, key=lambda match: match[0])]
+
+    def close(self):
+        """Stop the shard processes."""
+        for conn, process, lock in zip(self._connections, self._processes, self._locks):
+            with lock:
+                try:
+                    conn.send(None)
+                except (BrokenPipeError, OSError):
+                    pass
+                conn.close()
+            process.join()
+        self._connections = []
+        self._processes = []
+        self._locks = []
+
+    def __enter__(self):
+        """Use the library as a context manager that closes on exit."""
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Stop the shard processes."""
+        self.close()
@@ -0,0 +1,57 @@
+import random
+import threading
+import unittest
+from account_store import AccountStore
+
+class TestAccountStore(unittest.TestCase):
+
+    def setUp(self):
+        """Set up an AccountStore with two accounts."""
+        self.store = AccountStore(shards=4)
+        self.store.open_account("alice", 100)
+        self.store.open_account("bob", 20)
+
+    def test_operations(self):
+        """Test deposits, withdrawals and transfers follow BankAccount rules."""
+        self.assertTrue(self.store.deposit("alice", 0.5))
+        self.assertFalse(self.store.deposit("alice", 0))
+        self.assertFalse(self.store.withdraw("bob", 20.01))
+        self.assertTrue(self.store.transfer("alice", "bob", 30.25))
+        self.assertFalse(self.store.transfer("bob", "alice", 100))
+        self.assertFalse(self.store.transfer("bob", "alice", -1))
+        self.assertEqual(self.store.balance("alice"), 70.25)
+        self.assertEqual(self.store.balance("bob"), 50.25)
+
+        with self.assertRaises(ValueError):
+            self.store.open_account("alice")
+        with self.assertRaises(KeyError):
+            self.store.transfer("alice", "carol", 1)
+        self.assertEqual(self.store.balance("alice"), 70.25)
+
+    def test_concurrent_transfers_conserve_money(self):
+        """Test that money is conserved under many concurrent transfers."""
+        store = AccountStore(shards=8)
+        accounts = list(range(50))
+        for account in accounts:
+            store.open_account(account, 100)
+        barrier = threading.Barrier(8)
+
+        def worker(seed):
+            rng = random.Random(seed)
+            barrier.wait()
+            for _ in range(2_000):
+                source, target = rng.sample(accounts, 2)
+                store.transfer(source, target, rng.randint(1, 150))
+                store.withdraw(source, 0)
+
+        threads = [threading.Thread(target=worker, args=(seed,)) for seed in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(store.total_balance(), 5_000)
+        self.assertTrue(all(store.balance(account) >= 0 for account in accounts))
+
+if __name__ == '__main__':
+    unittest.main()
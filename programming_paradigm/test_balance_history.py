@@ -0,0 +1,61 @@
+import unittest
+from balance_history import BalanceHistory, HistoryBankAccount
+
+class TestBalanceHistory(unittest.TestCase):
+
+    def setUp(self):
+        """Set up a HistoryBankAccount driven by a fake clock."""
+        self.now = 0
+        self.account = HistoryBankAccount(100, clock=lambda: self.now)
+        for self.now, action, amount in ((10, "deposit", 50), (20, "withdraw", 120),
+                                         (30, "withdraw", 500), (40, "deposit", 5)):
+            getattr(self.account, action)(amount)
+
+    def test_balance_at(self):
+        """Test point-in-time balance queries."""
+        self.assertEqual(self.account.balance_at(5), 100)
+        self.assertEqual(self.account.balance_at(10), 150)
+        self.assertEqual(self.account.balance_at(25), 30)
+        self.assertEqual(self.account.balance_at(35), 30)
+        self.assertEqual(self.account.balance_at(1000), 35)
+        self.assertEqual(len(self.account.history), 3)
+
+    def test_window_stats(self):
+        """Test min, max and net flow over a window."""
+        stats = self.account.history.window_stats(5, 30)
+        self.assertEqual(stats, {"opening": 100, "closing": 30, "min": 30, "max": 150,
+                                 "net_flow": -70, "changes": 2, "exact": True})
+        quiet = self.account.history.window_stats(21, 39)
+        self.assertEqual((quiet["min"], quiet["max"], quiet["changes"]), (30, 30, 0))
+        self.assertEqual(self.account.history.changes_between(10, 20), [(10, 150), (20, 30)])
+
+    def test_compaction(self):
+        """Test that compaction bounds rows and keeps window extremes."""
+        history = BalanceHistory(0, max_entries=100, keep_recent=10, checkpoint_interval=100)
+        for t in range(1000):
+            history.record(t, t % 7)
+        self.assertLessEqual(len(history), 100)
+        self.assertEqual(history.balance_at(999), 999 % 7)
+        self.assertEqual(history.balance_at(199), 199 % 7)
+        stats = history.window_stats(-1, 999)
+        self.assertEqual((stats["min"], stats["max"]), (0, 6))
+        with self.assertRaises(ValueError):
+            history.record(5, 1)
+
+    def test_window_inside_checkpoint(self):
+        """Test that windows splitting a checkpoint interval are marked approximate."""
+        history = BalanceHistory(100, max_entries=3, keep_recent=1, checkpoint_interval=100)
+        for t, balance in ((10, 1), (60, 50), (90, 40), (150, 7), (160, 8)):
+            history.record(t, balance)
+        self.assertEqual(history.changes_between(0, 200), [(90, 40), (150, 7), (160, 8)])
+
+        whole = history.window_stats(-1, 155)
+        self.assertEqual((whole["min"], whole["max"], whole["exact"]), (1, 100, True))
+        # The true minimum after t=70 is 7, but the checkpoint's low of 1 is used
+        starts_inside = history.window_stats(70, 200)
+        self.assertEqual((starts_inside["min"], starts_inside["exact"]), (1, False))
+        self.assertFalse(history.window_stats(-1, 50)["exact"])
+        self.assertTrue(history.window_stats(95, 155)["exact"])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,65 @@
+import io
+import unittest
+from contextlib import redirect_stdout
+from bank_account import BankAccount, FixedPointBankAccount
+
+class TestFixedPointBankAccount(unittest.TestCase):
+
+    def test_no_rounding_drift(self):
+        """Test that repeated small deposits give an exact balance."""
+        account = FixedPointBankAccount()
+        for _ in range(10):
+            account.deposit(0.1)
+        self.assertEqual(account.balance_cents, 100)
+        self.assertEqual(account.account_balance, 1.0)
+
+        drifting = BankAccount()
+        for _ in range(10):
+            drifting.deposit(0.1)
+        self.assertNotEqual(drifting.account_balance, 1.0)
+
+    def test_same_behaviour_as_bank_account(self):
+        """Test that deposits, withdrawals and output match BankAccount."""
+        for cls in (BankAccount, FixedPointBankAccount):
+            account = cls(100)
+            output = io.StringIO()
+            with redirect_stdout(output):
+                account.deposit(50.25)
+                account.deposit(0)
+                self.assertTrue(account.withdraw(20))
+                self.assertFalse(account.withdraw(1000))
+                self.assertFalse(account.withdraw(-5))
+                account.display_balance()
+            self.assertEqual(output.getvalue(),
+                             "Deposit amount must be positive.\n"
+                             "Withdrawal amount must be positive.\n"
+                             "Current Balance: $130.25\n")
+            self.assertEqual(account.account_balance, 130.25)
+
+    def test_cent_operations(self):
+        """Test the whole-cent deposit and withdrawal methods."""
+        account = FixedPointBankAccount(1)
+        output = io.StringIO()
+        with redirect_stdout(output):
+            account.deposit_cents(25)
+            account.deposit_cents(0)
+            self.assertTrue(account.withdraw_cents(125))
+            self.assertFalse(account.withdraw_cents(1))
+            self.assertFalse(account.withdraw_cents(-1))
+        self.assertEqual(output.getvalue(), "Deposit amount must be positive.\n"
+                                            "Withdrawal amount must be positive.\n")
+        self.assertEqual(account.balance_cents, 0)
+
+    def test_balance_assignment(self):
+        """Test that setting account_balance converts to cents."""
+        account = FixedPointBankAccount()
+        account.account_balance = 12.345
+        self.assertEqual(account.balance_cents, 1234)
+        account.account_balance = -3.5
+        output = io.StringIO()
+        with redirect_stdout(output):
+            account.display_balance()
+        self.assertEqual(output.getvalue(), "Current Balance: $-3.50\n")
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,109 @@
+import os
+import stat
+import tempfile
+import unittest
+from unittest import mock
+from bank_journal import JournaledBank
+
+class TestJournaledBank(unittest.TestCase):
+
+    def setUp(self):
+        """Set up a temporary directory for the journal."""
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.directory = self.tmpdir.name
+
+    def tearDown(self):
+        """Remove the temporary directory."""
+        self.tmpdir.cleanup()
+
+    def test_operations(self):
+        """Test that operations follow BankAccount rules."""
+        with JournaledBank(self.directory) as bank:
+            account = bank.open_account(100)
+            self.assertTrue(bank.deposit(account, 0.1))
+            self.assertFalse(bank.deposit(account, 0))
+            self.assertFalse(bank.withdraw(account, 1000))
+            self.assertFalse(bank.withdraw(account, -1))
+            self.assertTrue(bank.withdraw(account, 50.05))
+            self.assertEqual(bank.balance(account), 50.05)
+
+    def test_invalid_operations_change_nothing(self):
+        """Test that rejected input leaves memory and the journal in agreement."""
+        with JournaledBank(self.directory) as bank:
+            account = bank.open_account(5)
+            with self.assertRaises(IndexError):
+                bank.deposit(-1, 3)
+            with self.assertRaises(IndexError):
+                bank.withdraw(account + 1, 3)
+            with self.assertRaises(ValueError):
+                bank.deposit(account, 1e18)
+            self.assertEqual(bank.balance(account), 5)
+        with JournaledBank(self.directory) as recovered:
+            self.assertEqual(recovered.balance(account), 5)
+
+    def test_recovery_from_journal(self):
+        """Test that committed operations survive reopening."""
+        bank = JournaledBank(self.directory, group_commit=4)
+        first = bank.open_account(10)
+        second = bank.open_account()
+        for _ in range(5):
+            bank.deposit(second, 1.25)
+        bank.withdraw(first, 3)
+        bank.close()
+
+        with JournaledBank(self.directory) as recovered:
+            self.assertEqual(len(recovered), 2)
+            self.assertEqual(recovered.balance(first), 7)
+            self.assertEqual(recovered.balance(second), 6.25)
+
+    def test_unflushed_group_and_torn_record(self):
+        """Test that only committed groups and complete records are replayed."""
+        bank = JournaledBank(self.directory, group_commit=2)
+        account = bank.open_account(10)
+        bank.deposit(account, 5)
+        bank.deposit(account, 7)  # Still buffered when the "crash" happens
+        bank._journal.write(b"\x0d\x00\x00")  # Partially written record
+        bank._journal.close()
+
+        with JournaledBank(self.directory) as recovered:
+            self.assertEqual(recovered.balance(account), 15)
+            recovered.deposit(account, 1)
+        with JournaledBank(self.directory) as recovered:
+            self.assertEqual(recovered.balance(account), 16)
+
+    def test_snapshots(self):
+        """Test that snapshots replace old journals and still recover."""
+        with JournaledBank(self.directory, group_commit=3, snapshot_every=5) as bank:
+            accounts = [bank.open_account(i) for i in range(3)]
+            for account in accounts:
+                bank.deposit(account, 2)
+                bank.withdraw(account, 1)
+
+        files = sorted(os.listdir(self.directory))
+        self.assertEqual(files, ["journal-00000001.log", "snapshot-00000001.snap"])
+        with JournaledBank(self.directory) as recovered:
+            self.assertEqual([recovered.balance(a) for a in accounts], [1, 2, 3])
+
+    @unittest.skipUnless(os.name == "posix", "Directory fsync is POSIX-only")
+    def test_snapshot_syncs_directory_before_removing(self):
+        """Test that the rename is made durable before the old generation is deleted."""
+        events = []
+        real_fsync, real_remove = os.fsync, os.remove
+
+        def fsync(fd):
+            events.append("sync dir" if stat.S_ISDIR(os.fstat(fd).st_mode) else "sync file")
+            real_fsync(fd)
+
+        def remove(path):
+            events.append("remove")
+            real_remove(path)
+
+        with JournaledBank(self.directory) as bank:
+            bank.open_account(1)
+            with mock.patch("os.fsync", fsync), mock.patch("os.remove", remove):
+                bank.snapshot()
+        self.assertIn("remove", events)
+        self.assertLess(events.index("sync dir"), events.index("remove"))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,64 @@
+import asyncio
+import unittest
+from bank_server import MAX_LINE_LENGTH, BankServer
+
+class TestBankServer(unittest.IsolatedAsyncioTestCase):
+
+    async def asyncSetUp(self):
+        """Start a BankServer on a free localhost port."""
+        self.bank = BankServer()
+        self.server = await self.bank.start(port=0)
+        port = self.server.sockets[0].getsockname()[1]
+        self.reader, self.writer = await asyncio.open_connection("127.0.0.1", port)
+
+    async def asyncTearDown(self):
+        """Close the client connection and stop the server."""
+        self.writer.close()
+        await self.writer.wait_closed()
+        self.server.close()
+        await self.server.wait_closed()
+
+    async def send(self, *lines):
+        """Send pipelined command lines and read one response per line."""
+        self.writer.write("".join(f"{line}\n" for line in lines).encode("utf-8"))
+        await self.writer.drain()
+        return [(await self.reader.readline()).decode("utf-8").rstrip("\n")
+                for _ in lines]
+
+    async def test_pipelined_commands(self):
+        """Test that pipelined commands are answered in order."""
+        responses = await self.send("deposit:50", "withdraw:500", "withdraw:20",
+                                    "display", "deposit:-5", "transfer:5", "deposit:abc")
+        self.assertEqual(responses, ["Deposited: $50.0", "Insufficient funds.",
+                                     "Withdrew: $20.0", "Current Balance: $130.00",
+                                     "Deposit amount must be positive.",
+                                     "Invalid command.", "Invalid command."])
+
+    async def test_rejected_input(self):
+        """Test that non-finite amounts and over-long lines are rejected."""
+        responses = await self.send("deposit:inf", "deposit:nan", "withdraw:-inf", "display")
+        self.assertEqual(responses, ["Invalid command."] * 3 + ["Current Balance: $100.00"])
+
+        # An over-long line is answered before its newline arrives
+        self.writer.write(b"deposit:" + b"9" * (MAX_LINE_LENGTH * 3))
+        await self.writer.drain()
+        self.assertEqual(await self.reader.readline(), b"Invalid command.\n")
+        # The rest of that line is dropped without a response
+        self.writer.write(b"9" * MAX_LINE_LENGTH + b"\n")
+        self.assertEqual(await self.send("display"), ["Current Balance: $100.00"])
+
+        # A complete over-long line in a single read is rejected too
+        padded = "deposit:" + "0" * (MAX_LINE_LENGTH * 4) + "5"
+        self.assertEqual(await self.send(padded, "display"),
+                         ["Invalid command.", "Current Balance: $100.00"])
+
+    async def test_named_accounts(self):
+        """Test that account prefixes select independent accounts."""
+        responses = await self.send("alice withdraw:100", "alice display",
+                                    "bob display", "display")
+        self.assertEqual(responses, ["Withdrew: $100.0", "Current Balance: $0.00",
+                                     "Current Balance: $100.00", "Current Balance: $100.00"])
+        self.assertEqual(sorted(self.bank.accounts), ["alice", "bob", "default"])
+
+if __name__ == '__main__':
+    unittest.main()
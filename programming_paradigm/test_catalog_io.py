@@ -0,0 +1,78 @@
+import io
+import unittest
+from catalog_io import export_books, import_books, iter_book_batches
+from library_management import Book, Library
+
+class TestCatalogIO(unittest.TestCase):
+
+    def setUp(self):
+        """Set up a Library with one checked-out book."""
+        self.library = Library()
+        self.library.add_books([Book("1984", "George Orwell"),
+                                Book("Brave New World", "Aldous Huxley"),
+                                Book("Dune, Part 1", "Frank Herbert")])
+        self.library.check_out_book("1984")
+
+    def round_trip(self, fmt):
+        """Export the library and import it into a new Library."""
+        output = io.StringIO()
+        self.assertEqual(export_books(self.library.get_all_books(), output, fmt, batch_size=2), 3)
+
+        copy = Library()
+        self.assertEqual(import_books(io.StringIO(output.getvalue()), copy, fmt, batch_size=2), 3)
+        return copy
+
+    def test_csv_round_trip(self):
+        """Test that CSV export and import preserve books and availability."""
+        copy = self.round_trip("csv")
+        self.assertEqual([str(book) for book in copy.get_all_books()],
+                         [str(book) for book in self.library.get_all_books()])
+        self.assertFalse(copy.find_book("1984").is_available())
+        self.assertEqual(copy.search("dune"), [copy.find_book("Dune, Part 1")])
+
+    def test_jsonl_round_trip(self):
+        """Test that JSON Lines export and import preserve availability."""
+        copy = self.round_trip("jsonl")
+        self.assertEqual(len(copy.get_all_books()), 3)
+        self.assertEqual([str(book) for book in copy.iter_available_books()],
+                         ["Brave New World by Aldous Huxley", "Dune, Part 1 by Frank Herbert"])
+
+    def test_batches(self):
+        """Test batch sizes and validation of incomplete records."""
+        data = "title,author\nA,X\nB,Y\nC,Z\n"
+        sizes = [len(batch) for batch in iter_book_batches(io.StringIO(data), batch_size=2)]
+        self.assertEqual(sizes, [2, 1])
+
+        with self.assertRaises(ValueError):
+            list(iter_book_batches(io.StringIO('{"title": "A"}\n'), "jsonl"))
+
+        # A blank "available" cell means available, like a missing column
+        data = "title,author,available\nA,X,\nB,Y,0\nC,Z, \n"
+        books = next(iter_book_batches(io.StringIO(data)))
+        self.assertEqual([book.is_available() for book in books], [True, False, True])
+        with self.assertRaises(ValueError):
+            list(iter_book_batches(io.StringIO(data), "xml"))
+
+    def test_invalid_batch_size(self):
+        """Test that non-positive batch sizes are rejected."""
+        for batch_size in (0, -1):
+            with self.assertRaises(ValueError):
+                export_books(self.library.get_all_books(), io.StringIO(), batch_size=batch_size)
+            with self.assertRaises(ValueError):
+                import_books(io.StringIO("title,author\nA,B\n"), Library(), batch_size=batch_size)
+        output = io.StringIO()
+        self.assertEqual(export_books([], output), 0)
+        self.assertEqual(output.getvalue(), "title,author,available\r\n")
+
+    def test_add_books_is_atomic(self):
+        """Test that a batch with an invalid item adds nothing."""
+        library = Library()
+        with self.assertRaises(TypeError):
+            library.add_books([Book("A", "X"), "B"])
+        book = Book("A", "X")
+        with self.assertRaises(ValueError):
+            library.add_books([book, book])
+        self.assertEqual(library.get_all_books(), [])
+
+if __name__ == '__main__':
+    unittest.main()
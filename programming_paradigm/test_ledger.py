@@ -0,0 +1,67 @@
+import random
+import unittest
+from bank_account import BankAccount
+from ledger import DEPOSIT, WITHDRAW, Ledger
+
+class TestLedger(unittest.TestCase):
+
+    def setUp(self):
+        """Set up a Ledger with three accounts."""
+        self.ledger = Ledger.from_accounts([BankAccount(100), BankAccount(), BankAccount(50)])
+
+    def test_apply_in_order(self):
+        """Test that operations follow BankAccount rules and run in order."""
+        mask = self.ledger.apply(
+            [1, 1, 0, 2, 2, 0],
+            [WITHDRAW, DEPOSIT, WITHDRAW, DEPOSIT, WITHDRAW, DEPOSIT],
+            [10, 30, 100, -5, 50.5, 0])
+        self.assertEqual(list(mask), [0, 1, 1, 0, 0, 0])
+        self.assertEqual(list(self.ledger.balances()), [0, 30, 50])
+
+        mask = self.ledger.apply([1, 1], [WITHDRAW, WITHDRAW], [20, 20])
+        self.assertEqual(list(mask), [1, 0])
+        self.assertEqual(self.ledger.balance(1), 10)
+
+    def test_invalid_batches(self):
+        """Test that malformed batches are rejected before any change."""
+        with self.assertRaises(ValueError):
+            self.ledger.apply([0, 1], [DEPOSIT], [1, 2])
+        with self.assertRaises(ValueError):
+            self.ledger.apply([0, 1], [DEPOSIT, 7], [1, 2])
+        with self.assertRaises(IndexError):
+            self.ledger.apply([-1], [DEPOSIT], [5])
+        with self.assertRaises(IndexError):
+            self.ledger.apply([0, 1, 3], [DEPOSIT, DEPOSIT, DEPOSIT], [1, 2, 3])
+        with self.assertRaises(TypeError):
+            self.ledger.apply([0.0], [DEPOSIT], [5])
+        self.assertEqual(list(self.ledger.balances()), [100, 0, 50])
+        self.assertEqual(self.ledger.apply([], [], []), bytearray())
+
+    def test_matches_sequential_loop(self):
+        """Test that batches give the same mask and balances as one-by-one application."""
+        rng = random.Random(7)
+        for _ in range(50):
+            start = [rng.choice((0, 0.1, rng.uniform(0, 50))) for _ in range(8)]
+            ids = [rng.randrange(8) for _ in range(100)]
+            kinds = [rng.choice((DEPOSIT, WITHDRAW)) for _ in range(100)]
+            amounts = [rng.choice((0.1, 0.2, 0.3, -1, rng.uniform(0, 30))) for _ in range(100)]
+            batch, sequential = Ledger(start), Ledger(start)
+            self.assertEqual(batch.apply(ids, kinds, amounts),
+                             sequential._apply_in_order(ids, kinds, amounts))
+            self.assertEqual(list(batch.balances()), list(sequential.balances()))
+
+        # One account with more overdrafts than vectorized rounds
+        kinds = [WITHDRAW, WITHDRAW, DEPOSIT] * 40
+        batch = Ledger([0])
+        self.assertEqual(list(batch.apply([0] * 120, kinds, [1] * 120)), [0, 0, 1] + [1, 0, 1] * 39)
+        self.assertEqual(batch.balance(0), 1)
+
+    def test_accounts(self):
+        """Test opening accounts and converting back to BankAccount."""
+        account_id = self.ledger.open_account(25)
+        self.assertEqual(account_id, 3)
+        self.assertEqual(len(self.ledger), 4)
+        self.assertEqual(self.ledger.to_account(account_id).account_balance, 25)
+
+if __name__ == '__main__':
+    unittest.main()
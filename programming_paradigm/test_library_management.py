@@ -0,0 +1,211 @@
+import io
+import threading
+import unittest
+from library_management import Book, Library
+
+class TestLibrary(unittest.TestCase):
+
+    def setUp(self):
+        """Set up a small Library with two copies of one title."""
+        self.library = Library()
+        self.copy1 = Book("1984", "George Orwell")
+        self.copy2 = Book("1984", "George Orwell")
+        self.other = Book("Brave New World", "Aldous Huxley")
+        for book in (self.copy1, self.copy2, self.other):
+            self.library.add_book(book)
+
+    def test_add_book(self):
+        """Test adding books, including invalid and duplicate instances."""
+        self.assertEqual(len(self.library.get_all_books()), 3)
+        with self.assertRaises(TypeError):
+            self.library.add_book("1984")
+        with self.assertRaises(ValueError):
+            self.library.add_book(self.copy1)
+        with self.assertRaises(ValueError):
+            Library().add_book(self.copy1)
+
+    def test_check_out_and_return_copies(self):
+        """Test that each copy of a title can be checked out once."""
+        self.assertTrue(self.library.check_out_book("1984"))
+        self.assertTrue(self.library.check_out_book("1984"))
+        self.assertFalse(self.library.check_out_book("1984"))
+        self.assertFalse(self.library.check_out_book("Missing"))
+
+        self.assertTrue(self.library.return_book("1984"))
+        self.assertTrue(self.library.return_book("1984"))
+        self.assertFalse(self.library.return_book("1984"))
+
+    def test_find_book(self):
+        """Test finding books by exact title."""
+        self.assertIs(self.library.find_book("1984"), self.copy1)
+        self.assertIs(self.library.find_book("Brave New World"), self.other)
+        self.assertIsNone(self.library.find_book("Missing"))
+
+    def test_remove_book(self):
+        """Test that removing books keeps the title index consistent."""
+        self.library.remove_book(self.copy1)
+        self.assertIs(self.library.find_book("1984"), self.copy2)
+
+        self.library.remove_book(self.copy2)
+        self.assertIsNone(self.library.find_book("1984"))
+        self.assertFalse(self.library.check_out_book("1984"))
+        self.assertEqual(self.library.get_all_books(), [self.other])
+
+        with self.assertRaises(ValueError):
+            self.library.remove_book(self.copy1)
+
+    def test_available_books(self):
+        """Test the availability set, paging and streamed listing."""
+        self.copy1.check_out()
+        self.library.check_out_book("Brave New World")
+        self.assertEqual(list(self.library.iter_available_books()), [self.copy2])
+
+        self.library.return_book("Brave New World")
+        self.copy1.return_book()
+        available = list(self.library.iter_available_books())
+        self.assertEqual(available, [self.copy2, self.other, self.copy1])
+        self.assertEqual(list(self.library.iter_available_books(1, 1)), [self.other])
+        self.assertEqual(list(self.library.iter_available_books(offset=2)), [self.copy1])
+
+        output = io.StringIO()
+        count = self.library.write_available_books(output, chunk_size=2)
+        self.assertEqual(count, 3)
+        self.assertEqual(output.getvalue(), "".join(f"{book}\n" for book in available))
+
+    def test_search(self):
+        """Test ranked full-text search over titles and authors."""
+        orwell = Book("Homage to Catalonia", "George Orwell")
+        self.library.add_book(orwell)
+
+        self.assertEqual(self.library.search("orwell 1984"), [self.copy1, self.copy2])
+        self.assertEqual(self.library.search("brave"), [self.other])
+        self.assertEqual(self.library.search("HUX"), [self.other])
+        self.assertEqual(self.library.search("orw", limit=1), [self.copy1])
+        self.assertEqual(self.library.search("catalonia orwell"), [orwell])
+        self.assertEqual(self.library.search("missing"), [])
+        self.assertEqual(self.library.search("   "), [])
+
+        self.library.remove_book(orwell)
+        self.assertEqual(self.library.search("catalonia"), [])
+
+    def test_search_after_updates(self):
+        """Test prefix search between single adds and removals."""
+        dune = Book("Dune", "Frank Herbert")
+        self.library.add_book(dune)
+        self.assertEqual(self.library.search("du"), [dune])
+        self.library.add_book(Book("Dunkirk", "Joshua Levine"))
+        self.assertEqual(len(self.library.search("dun")), 2)
+        self.library.remove_book(dune)
+        self.assertEqual(self.library.search("dune"), [])
+
+        tokens = self.library._search_index._sorted_tokens
+        self.assertEqual(tokens, sorted(self.library._search_index._postings))
+
+    def test_concurrent_check_out(self):
+        """Test that concurrent check-outs never hand out the same copy twice."""
+        library = Library(lock_stripes=4)
+        for title in ("A", "B"):
+            library.add_books(Book(title, "Author") for _ in range(50))
+        results = []
+        barrier = threading.Barrier(8)
+
+        def worker():
+            barrier.wait()
+            successes = 0
+            for _ in range(100):
+                successes += library.check_out_book("A")
+                successes += library.check_out_book("B")
+            results.append(successes)
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(sum(results), 100)
+        self.assertEqual(list(library.iter_available_books()), [])
+
+    def test_concurrent_listing(self):
+        """Test that listings stay consistent while other threads check out books."""
+        library = Library(lock_stripes=4)
+        library.add_books(Book(f"Title {i}", "Author") for i in range(2000))
+        done = threading.Event()
+        errors = []
+
+        def borrower():
+            while not done.is_set():
+                for i in range(0, 2000, 7):
+                    library.check_out_book(f"Title {i}")
+                    library.return_book(f"Title {i}")
+
+        def lister():
+            try:
+                for _ in range(50):
+                    library.write_available_books(io.StringIO(), chunk_size=100)
+                    list(library.iter_available_books(100, 500))
+            except RuntimeError as error:
+                errors.append(error)
+            finally:
+                done.set()
+
+        threads = [threading.Thread(target=borrower), threading.Thread(target=lister)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(errors, [])
+        self.assertEqual(len(list(library.iter_available_books())), 2000)
+
+    def test_reservations(self):
+        """Test that returned copies go to waiting patrons by priority, then age."""
+        received = []
+        self.assertTrue(self.library.reserve("1984", "ann", callback=received.append))
+        self.assertEqual(received, [self.copy1])
+        self.assertTrue(self.library.check_out_book("1984"))
+
+        for patron, priority in (("bob", 0), ("cat", 5), ("dan", 0), ("eve", 5)):
+            self.assertFalse(self.library.reserve("1984", patron, priority,
+                                                  lambda book, p=patron: received.append(p)))
+        with self.assertRaises(ValueError):
+            self.library.reserve("1984", "bob")
+        self.assertTrue(self.library.cancel_reservation("1984", "eve"))
+        self.assertFalse(self.library.cancel_reservation("1984", "eve"))
+        self.assertEqual(self.library.get_waitlist("1984"), ["cat", "bob", "dan"])
+
+        # Each return hands the copy over instead of making it available
+        self.assertTrue(self.library.return_book("1984"))
+        self.assertTrue(self.library.return_book("1984"))
+        self.assertEqual(received, [self.copy1, "cat", "bob"])
+        self.assertNotIn(self.copy1, list(self.library.iter_available_books()))
+
+        self.assertTrue(self.library.return_book("1984"))
+        self.assertTrue(self.library.return_book("1984"))
+        self.assertEqual(received, [self.copy1, "cat", "bob", "dan"])
+        self.assertEqual(self.library.get_waitlist("1984"), [])
+        self.assertTrue(self.library.find_book("1984").is_available())
+
+    def test_new_copy_goes_to_waitlist(self):
+        """Test that a copy added while patrons wait is handed to the first of them."""
+        received = []
+        self.library.check_out_book("Brave New World")
+        self.assertFalse(self.library.reserve("Brave New World", "ann", callback=received.append))
+        self.assertFalse(self.library.reserve("Brave New World", "bob"))
+
+        new_copy = Book("Brave New World", "Aldous Huxley")
+        self.library.add_book(new_copy)
+        self.assertEqual(received, [new_copy])
+        self.assertFalse(new_copy.is_available())
+        self.assertFalse(self.library.check_out_book("Brave New World"))
+        self.assertEqual(self.library.get_waitlist("Brave New World"), ["bob"])
+
+        walk_in = [Book("Brave New World", "Aldous Huxley") for _ in range(2)]
+        self.library.add_books(walk_in)
+        self.assertEqual(self.library.get_waitlist("Brave New World"), [])
+        self.assertEqual([book.is_available() for book in walk_in], [False, True])
+        self.assertNotIn(walk_in[0], list(self.library.iter_available_books()))
+        self.assertTrue(self.library.check_out_book("Brave New World"))
+
+if __name__ == '__main__':
+    unittest.main()
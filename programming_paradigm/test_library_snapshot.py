@@ -0,0 +1,75 @@
+import os
+import tempfile
+import unittest
+from library_management import Book, Library
+
+class TestLibrarySnapshot(unittest.TestCase):
+
+    def setUp(self):
+        """Save a small Library with repeated titles to a snapshot file."""
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, "library.snap")
+        library = Library()
+        library.add_books([Book("1984", "George Orwell"),
+                           Book("Brave New World", "Aldous Huxley"),
+                           Book("1984", "George Orwell"),
+                           Book("Cien años de soledad", "Gabriel García Márquez")])
+        library.check_out_book("1984")
+        self.books = library.get_all_books()
+        self.assertEqual(library.save_snapshot(self.path), 4)
+        self.snapshot = Library.load_snapshot(self.path)
+
+    def tearDown(self):
+        """Close the snapshot and remove the temporary directory."""
+        self.snapshot.close()
+        self.tmpdir.cleanup()
+
+    def test_books_round_trip(self):
+        """Test that titles, authors, order and availability are restored."""
+        self.assertEqual(len(self.snapshot), 4)
+        self.assertEqual([str(book) for book in self.snapshot],
+                         [str(book) for book in self.books])
+        self.assertEqual([book.is_available() for book in self.snapshot],
+                         [book.is_available() for book in self.books])
+        self.assertEqual(str(self.snapshot[-1]), str(self.books[-1]))
+        with self.assertRaises(IndexError):
+            self.snapshot[4]
+
+    def test_find_book(self):
+        """Test binary-search lookups by title."""
+        self.assertFalse(self.snapshot.find_book("1984").is_available())
+        self.assertEqual(str(self.snapshot.find_book("Cien años de soledad")),
+                         "Cien años de soledad by Gabriel García Márquez")
+        self.assertIsNone(self.snapshot.find_book("Aldous Huxley"))
+        self.assertIsNone(self.snapshot.find_book("Missing"))
+
+    def test_available_books_and_to_library(self):
+        """Test availability paging and conversion back to a Library."""
+        self.assertEqual([book.title for book in self.snapshot.iter_available_books(1, 1)],
+                         ["1984"])
+        library = self.snapshot.to_library()
+        self.assertEqual(len(library.get_all_books()), 4)
+        self.assertTrue(library.check_out_book("1984"))
+        self.assertFalse(library.check_out_book("1984"))
+
+    def test_rejects_other_files(self):
+        """Test that a file without the snapshot header is rejected."""
+        path = os.path.join(self.tmpdir.name, "other.bin")
+        with open(path, "wb") as fp:
+            fp.write(bytes(64))
+        with self.assertRaises(ValueError):
+            Library.load_snapshot(path)
+
+    def test_rejects_truncated_files(self):
+        """Test that files cut short inside the header or body are rejected."""
+        with open(self.path, "rb") as fp:
+            data = fp.read()
+        path = os.path.join(self.tmpdir.name, "truncated.snap")
+        for size in (10, 32, len(data) - 1):
+            with open(path, "wb") as fp:
+                fp.write(data[:size])
+            with self.assertRaisesRegex(ValueError, "Truncated"):
+                Library.load_snapshot(path)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,53 @@
+import os
+import tempfile
+import unittest
+from library_management import Book
+from library_storage import SQLiteLibrary
+
+class TestSQLiteLibrary(unittest.TestCase):
+
+    def setUp(self):
+        """Set up an SQLiteLibrary in a temporary directory."""
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, "library.db")
+        self.library = SQLiteLibrary(self.path, pool_size=2, commit_every=2)
+        self.library.add_books([Book("1984", "George Orwell"),
+                                Book("1984", "George Orwell"),
+                                Book("Brave New World", "Aldous Huxley")])
+
+    def tearDown(self):
+        """Close the database and remove the temporary directory."""
+        self.library.close()
+        self.tmpdir.cleanup()
+
+    def test_check_out_and_return(self):
+        """Test check-outs and returns against the stored copies."""
+        self.assertTrue(self.library.check_out_book("1984"))
+        self.assertTrue(self.library.check_out_book("1984"))
+        self.assertFalse(self.library.check_out_book("1984"))
+        self.assertFalse(self.library.check_out_book("Missing"))
+        self.assertTrue(self.library.return_book("1984"))
+        self.assertFalse(self.library.return_book("Brave New World"))
+
+    def test_lookups(self):
+        """Test finding books by title and author."""
+        self.assertEqual(str(self.library.find_book("1984")), "1984 by George Orwell")
+        self.assertIsNone(self.library.find_book("Missing"))
+        self.assertEqual(len(self.library.find_books_by_author("George Orwell")), 2)
+        self.assertEqual(self.library.get_book_count(), 3)
+        with self.assertRaises(TypeError):
+            self.library.add_book("1984")
+
+    def test_persistence(self):
+        """Test that batched check-outs are visible after reopening."""
+        self.library.check_out_book("Brave New World")
+        self.library.close()
+
+        self.library = SQLiteLibrary(self.path)
+        self.assertFalse(self.library.find_book("Brave New World").is_available())
+        self.assertEqual([str(book) for book in self.library.iter_available_books()],
+                         ["1984 by George Orwell", "1984 by George Orwell"])
+        self.assertEqual(len(list(self.library.iter_available_books(1, 5))), 1)
+
+if __name__ == '__main__':
+    unittest.main()
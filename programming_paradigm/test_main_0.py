@@ -0,0 +1,69 @@
+import importlib
+import io
+import os
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from unittest import mock
+
+main_0 = importlib.import_module("main-0")
+
+class TestBatchMode(unittest.TestCase):
+
+    def run_batch(self, lines, **kwargs):
+        """Run a batch and return its output lines."""
+        output = io.StringIO()
+        with redirect_stdout(output):
+            main_0.run_batch(lines, **kwargs)
+        return output.getvalue().splitlines()
+
+    def test_commands_run_in_order(self):
+        """Test that accounts persist across lines and commands apply in order."""
+        output = self.run_batch(["withdraw:150\n", "deposit:100\n", "withdraw:150\n",
+                                 "alice withdraw:30\n", "alice display\n", "display\n"])
+        self.assertEqual(output[:6], ["Insufficient funds.", "Deposited: $100.0",
+                                      "Withdrew: $150.0", "Withdrew: $30.0",
+                                      "Current Balance: $70.00", "Current Balance: $50.00"])
+        self.assertEqual(output[7:], ["default: Current Balance: $50.00",
+                                      "alice: Current Balance: $70.00"])
+
+    def test_invalid_lines(self):
+        """Test that bad lines are answered and counted, and blank lines skipped."""
+        output = self.run_batch(["deposit:abc", "", "transfer:5", "deposit", "  ",
+                                 "deposit:inf", "withdraw:-5"], starting_balance=10)
+        self.assertEqual(output, ["Invalid command."] * 4
+                         + ["Withdrawal amount must be positive.",
+                            "Processed 5 commands: deposit 0, withdraw 1, display 0, invalid 4",
+                            "default: Current Balance: $10.00"])
+
+    def test_output_is_buffered(self):
+        """Test that nothing is written until every line has been read."""
+        output = io.StringIO()
+
+        def lines():
+            for line in ("deposit:5", "display"):
+                yield line
+                self.assertEqual(output.getvalue(), "")
+
+        with redirect_stdout(output):
+            main_0.run_batch(lines())
+        self.assertEqual(output.getvalue().splitlines()[-2:],
+                         ["Processed 2 commands: deposit 1, withdraw 0, display 1, invalid 0",
+                          "default: Current Balance: $105.00"])
+
+    def test_batch_file_argument(self):
+        """Test that --batch reads commands from a file."""
+        fd, path = tempfile.mkstemp(suffix=".txt")
+        with os.fdopen(fd, "w") as fp:
+            fp.write("deposit:25\nbob display\n")
+        self.addCleanup(os.remove, path)
+
+        output = io.StringIO()
+        with mock.patch("sys.argv", ["main-0.py", "--batch", path]), redirect_stdout(output):
+            main_0.main()
+        self.assertEqual(output.getvalue().splitlines()[:3],
+                         ["Deposited: $25.0", "Current Balance: $100.00",
+                          "Processed 2 commands: deposit 1, withdraw 0, display 1, invalid 0"])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,114 @@
+import io
+import threading
+import unittest
+from library_management import Book, Library
+from sharded_library import ShardedLibrary, shard_for
+
+class TestShardedLibrary(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        """Start one three-shard library for all tests."""
+        cls.library = ShardedLibrary(shards=3)
+        cls.library.add_books([
+            Book("1984", "George Orwell"),
+            Book("Animal Farm", "George Orwell"),
+            Book("Brave New World", "Aldous Huxley"),
+            Book("Dune", "Frank Herbert"),
+            Book("Emma", "Jane Austen"),
+        ])
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.library.close()
+
+    def test_routing(self):
+        """Test that titles always map to the same shard."""
+        self.assertEqual(shard_for("Dune", 3), shard_for("Dune", 3))
+        self.assertIn(shard_for("Dune", 3), range(3))
+        self.assertEqual(self.library.get_book_count(), 5)
+
+    def test_check_out_and_return(self):
+        """Test routed check-out, return and lookup."""
+        self.assertTrue(self.library.check_out_book("Dune"))
+        self.assertFalse(self.library.check_out_book("Dune"))
+        self.assertFalse(self.library.find_book("Dune").is_available())
+        self.assertTrue(self.library.return_book("Dune"))
+        self.assertTrue(self.library.find_book("Dune").is_available())
+        self.assertIsNone(self.library.find_book("Missing"))
+
+        self.assertEqual(self.library.check_out_books(["Emma", "Missing", "1984", "Emma"]),
+                         [True, False, True, False])
+        self.assertEqual(self.library.return_books(["1984", "Emma"]), [True, True])
+
+    def test_scatter_gather(self):
+        """Test that listings and searches combine every shard."""
+        out = io.StringIO()
+        self.assertEqual(self.library.write_available_books(out, chunk_size=1), 5)
+        self.assertEqual(sorted(out.getvalue().splitlines()),
+                         sorted(str(book) for book in [
+                             Book("1984", "George Orwell"), Book("Animal Farm", "George Orwell"),
+                             Book("Brave New World", "Aldous Huxley"), Book("Dune", "Frank Herbert"),
+                             Book("Emma", "Jane Austen")]))
+        self.assertCountEqual([book.title for book in self.library.search("orwell")],
+                              ["1984", "Animal Farm"])
+        self.assertEqual(len(self.library.search("orwell", limit=1)), 1)
+        self.assertEqual([book.title for book in self.library.search("brave")], ["Brave New World"])
+
+    def test_threads_share_shards(self):
+        """Test that concurrent callers each get their own replies."""
+        errors = []
+
+        def borrower(title):
+            for _ in range(100):
+                if not (self.library.check_out_book(title)
+                        and self.library.find_book(title).title == title
+                        and self.library.return_book(title)):
+                    errors.append(title)
+
+        def counter():
+            for _ in range(50):
+                if self.library.get_book_count() != 5:
+                    errors.append("count")
+                if not 1 <= self.library.write_available_books(io.StringIO(), chunk_size=2) <= 5:
+                    errors.append("listing")
+
+        threads = [threading.Thread(target=borrower, args=(title,))
+                   for title in ("1984", "Dune", "Emma", "Animal Farm")]
+        threads.append(threading.Thread(target=counter))
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(errors, [])
+
+    def test_invalid_books(self):
+        """Test that bad batches are rejected before anything is sent."""
+        owned = Book("Owned", "Someone")
+        Library().add_book(owned)
+        with self.assertRaises(ValueError):
+            self.library.add_books([Book("New", "Someone"), owned])
+        with self.assertRaises(TypeError):
+            self.library.add_book("not a book")
+        repeated = Book("Repeated", "Someone")
+        with self.assertRaises(ValueError):
+            self.library.add_books([repeated, repeated])
+        self.assertEqual(self.library.get_book_count(), 5)
+
+    def test_added_books_keep_state(self):
+        """Test that added books keep their availability and cannot be added twice."""
+        borrowed = Book("Borrowed", "Someone")
+        borrowed.check_out()
+        with ShardedLibrary(shards=2) as library:
+            library.add_book(borrowed)
+            self.assertFalse(library.find_book("Borrowed").is_available())
+            self.assertFalse(library.check_out_book("Borrowed"))
+            with self.assertRaises(ValueError):
+                library.add_book(borrowed)
+            with self.assertRaises(ValueError):
+                Library().add_book(borrowed)
+            self.assertEqual(library.get_book_count(), 1)
+            self.assertTrue(library.return_book("Borrowed"))
+
+if __name__ == '__main__':
+    unittest.main()